@@ -0,0 +1,43 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+
+
+Message = BaseCommand | BaseQuery
+Handler = BaseCommandHandler | BaseQueryHandler
+NextCall = Callable[[Message], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class BaseBehavior(ABC):
+    """A step of the mediator pipeline wrapped around every handler call.
+
+    Behaviors run in registration order, the first one is the outermost.
+    ``call_next`` continues down the pipeline and eventually calls
+    ``handler.handle``.
+
+    """
+
+    @abstractmethod
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any: ...
@@ -0,0 +1,123 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Callable,
+)
+
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    Message,
+    NextCall,
+)
+from application.commands.base import BaseCommand
+from application.interfaces.cache import BaseQueryCache
+from application.queries.base import BaseQuery
+from application.single_flight import SingleFlight
+
+
+@dataclass(frozen=True)
+class QueryCachePolicy:
+    key: Callable[[BaseQuery], str]
+    ttl: float
+    backend: str = "memory"
+
+
+@dataclass(frozen=True)
+class CacheInvalidation:
+    query_type: type[BaseQuery]
+    # Builds the query cache key from the command and the handler result
+    key: Callable[[BaseCommand, Any], str]
+
+
+def cached_query(
+    key: Callable[[BaseQuery], str],
+    ttl: float,
+    backend: str = "memory",
+):
+    """Opt a query type into result caching.
+
+    ``key`` maps a query to the part of the cache key that identifies
+    it; the query class name is prepended automatically.
+
+    """
+
+    def decorator(query_type: type[BaseQuery]) -> type[BaseQuery]:
+        query_type.cache_policy = QueryCachePolicy(key=key, ttl=ttl, backend=backend)
+        return query_type
+
+    return decorator
+
+
+def invalidates_cache(
+    query_type: type[BaseQuery],
+    key: Callable[[BaseCommand, Any], str],
+):
+    """Drop cached ``query_type`` results after the command succeeds."""
+
+    def decorator(command_type: type[BaseCommand]) -> type[BaseCommand]:
+        command_type.cache_invalidations = (
+            *getattr(command_type, "cache_invalidations", ()),
+            CacheInvalidation(query_type=query_type, key=key),
+        )
+        return command_type
+
+    return decorator
+
+
+def get_cache_key(query_type: type[BaseQuery], key: str) -> str:
+    return f"{query_type.__name__}:{key}"
+
+
+@dataclass(frozen=True)
+class QueryCacheBehavior(BaseBehavior):
+    backends: dict[str, BaseQueryCache]
+
+    # Cache key -> result of the handler call that is already running, so a
+    # burst of misses for one key reaches the handler only once.
+    _in_flight: SingleFlight[str, Any] = field(
+        default_factory=SingleFlight,
+        init=False,
+    )
+
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any:
+        if isinstance(message, BaseCommand):
+            result = await call_next(message)
+            await self._invalidate(message, result)
+            return result
+
+        policy: QueryCachePolicy | None = getattr(message, "cache_policy", None)
+        if policy is None:
+            return await call_next(message)
+
+        backend = self.backends[policy.backend]
+        key = get_cache_key(message.__class__, policy.key(message))
+
+        cached = await backend.get(key)
+        if cached is not None:
+            return cached
+
+        async def load() -> Any:
+            result = await call_next(message)
+            if result is not None:
+                await backend.set(key, result, policy.ttl)
+            return result
+
+        return await self._in_flight.do(key, load)
+
+    async def _invalidate(self, command: BaseCommand, result: Any) -> None:
+        for invalidation in getattr(command, "cache_invalidations", ()):
+            policy: QueryCachePolicy = invalidation.query_type.cache_policy
+            key = get_cache_key(
+                invalidation.query_type,
+                invalidation.key(command, result),
+            )
+            await self.backends[policy.backend].delete(key)
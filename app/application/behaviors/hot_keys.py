@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+)
+
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    Message,
+    NextCall,
+)
+from application.queries.base import BaseQuery
+from domain.services.hot_keys import HotKeys
+
+
+@dataclass(frozen=True)
+class HotKeyPolicy:
+    key: Callable[[BaseQuery], str]
+
+
+def tracks_hot_keys(key: Callable[[BaseQuery], str]):
+    """Count every ``query_type`` message by ``key`` in the hot key
+    sketch."""
+
+    def decorator(query_type: type[BaseQuery]) -> type[BaseQuery]:
+        query_type.hot_key_policy = HotKeyPolicy(key=key)
+        return query_type
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class HotKeyBehavior(BaseBehavior):
+    """Records tracked queries before the query cache, which answers most
+    resolves of hot codes and would hide them from the sketch."""
+
+    hot_keys: HotKeys
+
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any:
+        policy: HotKeyPolicy | None = getattr(message, "hot_key_policy", None)
+        if policy is not None:
+            self.hot_keys.record(policy.key(message))
+
+        return await call_next(message)
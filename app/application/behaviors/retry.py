@@ -0,0 +1,62 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    Message,
+    NextCall,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    exceptions: tuple[type[Exception], ...]
+    attempts: int
+    # Before the second attempt, doubled before every next one
+    delay: float
+
+
+def retries(
+    *exceptions: type[Exception],
+    attempts: int = 2,
+    delay: float = 0.05,
+):
+    """Run the handler of a message type again when it raises one of
+    ``exceptions``, up to ``attempts`` calls in total.
+
+    Only for messages whose handlers are safe to repeat.
+
+    """
+
+    def decorator(message_type: type[Message]) -> type[Message]:
+        message_type.retry_policy = RetryPolicy(
+            exceptions=exceptions,
+            attempts=attempts,
+            delay=delay,
+        )
+        return message_type
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class RetryBehavior(BaseBehavior):
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any:
+        policy: RetryPolicy | None = getattr(message, "retry_policy", None)
+        if policy is None:
+            return await call_next(message)
+
+        for attempt in range(policy.attempts - 1):
+            try:
+                return await call_next(message)
+            except policy.exceptions:
+                await asyncio.sleep(policy.delay * 2**attempt)
+
+        return await call_next(message)
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    Message,
+    NextCall,
+)
+from application.commands.base import BaseCommand
+from application.interfaces.timing import BaseHandlerTimer
+
+
+@dataclass(frozen=True)
+class TimingBehavior(BaseBehavior):
+    timer: BaseHandlerTimer
+
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any:
+        outcome = "error"
+        started_at = perf_counter()
+        try:
+            result = await call_next(message)
+            outcome = "ok"
+            return result
+        finally:
+            self.timer.observe(
+                kind="command" if isinstance(message, BaseCommand) else "query",
+                message=message.__class__.__name__,
+                handler=handler.__class__.__name__,
+                outcome=outcome,
+                duration=perf_counter() - started_at,
+            )
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Any
+
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    Message,
+    NextCall,
+)
+from application.interfaces.tracing import BaseTracer
+
+
+@dataclass(frozen=True)
+class TracingBehavior(BaseBehavior):
+    """Shows every handler as its own span inside the request trace."""
+
+    tracer: BaseTracer
+
+    async def handle(
+        self,
+        message: Message,
+        handler: Handler,
+        call_next: NextCall,
+    ) -> Any:
+        async with self.tracer.span(
+            handler.__class__.__name__,
+            action=message.__class__.__name__,
+        ):
+            return await call_next(message)
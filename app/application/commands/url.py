@@ -1,15 +1,26 @@
 from dataclasses import dataclass
 
+from application.behaviors.caching import invalidates_cache
 from application.commands.base import (
     BaseCommand,
     BaseCommandHandler,
 )
+from application.queries.url import (
+    CheckAliasAvailabilityQuery,
+    GetLongURLQuery,
+)
 from domain.services.url import URLService
 
 
+@invalidates_cache(GetLongURLQuery, key=lambda command, short_url: short_url)
+@invalidates_cache(
+    CheckAliasAvailabilityQuery,
+    key=lambda command, short_url: short_url,
+)
 @dataclass(frozen=True)
 class CreateShortURLCommand(BaseCommand):
     long_url: str
+    alias: str | None = None
 
 
 @dataclass(frozen=True)
@@ -21,5 +32,6 @@ class CreateShortURLCommandHandler(
     async def handle(self, command: CreateShortURLCommand) -> str:
         short_url = await self.url_service.get_or_create_short_url(
             long_url=command.long_url,
+            alias=command.alias,
         )
         return short_url
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import date
+
+from application.exceptions.base import ApplicationException
+
+
+@dataclass(eq=False)
+class InvalidStatsRangeException(ApplicationException):
+    date_from: date
+    date_to: date
+    max_days: int
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Invalid date range {self.date_from} - {self.date_to}: the start must "
+            f"not be after the end and the range is limited to {self.max_days} days"
+        )
@@ -1,24 +1,94 @@
-from functools import lru_cache
+from datetime import timedelta
+from functools import (
+    lru_cache,
+    partial,
+)
 
+from authx import (
+    AuthX,
+    AuthXConfig,
+)
 from punq import (
     Container,
     Scope,
 )
 from redis.asyncio import Redis
 
+from application.behaviors.caching import QueryCacheBehavior
+from application.behaviors.hot_keys import HotKeyBehavior
+from application.behaviors.retry import RetryBehavior
+from application.behaviors.timing import TimingBehavior
+from application.behaviors.tracing import TracingBehavior
 from application.commands.url import (
     CreateShortURLCommand,
     CreateShortURLCommandHandler,
 )
+from application.interfaces.clicks import BaseClickStats
+from application.interfaces.visitors import BaseVisitorCounter
 from application.mediator import Mediator
+from application.queries.stats import (
+    GetLinkStatsQuery,
+    GetLinkStatsQueryHandler,
+    GetTopLinksQuery,
+    GetTopLinksQueryHandler,
+    GetUniqueVisitorsQuery,
+    GetUniqueVisitorsQueryHandler,
+)
 from application.queries.url import (
+    CheckAliasAvailabilityQuery,
+    CheckAliasAvailabilityQueryHandler,
     GetLongURLQuery,
     GetLongURLQueryHandler,
 )
 from domain.interfaces.repositories.url import BaseURLRepository
+from domain.services.blocklist import (
+    AliasBlocklist,
+    BLOCKED_ALIAS_SUBSTRINGS,
+)
+from domain.services.hot_keys import HotKeys
 from domain.services.url import URLService
+from infrastructure.analytics.clicks import SQLAlchemyClickStats
+from infrastructure.analytics.visitors import RedisVisitorCounter
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    InMemoryAPIKeyRepository,
+)
+from infrastructure.auth.quota import QuotaTracker
+from infrastructure.cache.memory import InMemoryQueryCache
+from infrastructure.cache.redis import RedisQueryCache
+from infrastructure.changefeed.consumer import ChangeFeedConsumer
+from infrastructure.changefeed.relay import OutboxRelay
 from infrastructure.database.gateways.postgres import Database
-from infrastructure.database.repositories.url import SQLAlchemyRedisURLRepository
+from infrastructure.database.repositories.api_key import SQLAlchemyAPIKeyRepository
+from infrastructure.database.repositories.url import (
+    InMemoryURLRepository,
+    LookupFileURLRepository,
+    SQLAlchemyRedisURLRepository,
+    SQLiteURLRepository,
+    WriteBehindURLRepository,
+)
+from infrastructure.health.readiness import ReadinessChecker
+from infrastructure.metrics.timing import PrometheusHandlerTimer
+from infrastructure.ratelimit.limiter import (
+    RateLimiter,
+    RateLimitRule,
+)
+from infrastructure.resilience.circuit_breaker import CircuitBreaker
+from infrastructure.scheduler.locks import (
+    LocalJobLock,
+    RedisJobLock,
+)
+from infrastructure.scheduler.scheduler import (
+    Job,
+    Scheduler,
+)
+from infrastructure.scheduler.schedules import (
+    CronSchedule,
+    IntervalSchedule,
+)
+from infrastructure.tracing.apm import ElasticAPMTracer
+from infrastructure.writebehind.flusher import WriteBehindFlusher
 from settings.config import Config
 
 
@@ -36,7 +106,14 @@ def _init_container() -> Container:
         config: Config = container.resolve(Config)
         return Database(
             url=config.postgres_connection_uri,
-            ro_url=config.postgres_connection_uri,
+            ro_url=config.postgres_read_only_connection_uri,
+            pool_size=config.postgres_pool_size,
+            max_overflow=config.postgres_max_overflow,
+            read_only_breaker=CircuitBreaker(
+                name="postgres_read_only",
+                failure_threshold=config.postgres_read_only_breaker_failure_threshold,
+                reset_timeout=config.postgres_read_only_breaker_reset_timeout,
+            ),
         )
 
     container.register(Database, factory=init_database, scope=Scope.singleton)
@@ -47,19 +124,335 @@ def _init_container() -> Container:
             host=config.redis_host,
             port=config.redis_port,
             decode_responses=True,
+            max_connections=config.redis_max_connections,
         )
 
     container.register(Redis, factory=init_redis, scope=Scope.singleton)
 
-    container.register(BaseURLRepository, SQLAlchemyRedisURLRepository)
+    def init_readiness_checker():
+        config: Config = container.resolve(Config)
+        uses_storage = config.url_repository_backend == "postgres"
+        return ReadinessChecker(
+            database=container.resolve(Database) if uses_storage else None,
+            cache=container.resolve(Redis) if uses_storage else None,
+            timeout=config.readiness_probe_timeout,
+            cache_ttl=config.readiness_cache_ttl,
+            optional=frozenset(config.readiness_optional_dependencies),
+        )
+
+    container.register(
+        ReadinessChecker,
+        factory=init_readiness_checker,
+        scope=Scope.singleton,
+    )
+
+    def init_url_repository():
+        config: Config = container.resolve(Config)
+
+        if config.url_repository_backend == "memory":
+            return InMemoryURLRepository(snapshot_path=config.memory_snapshot_path)
+
+        if config.url_repository_backend == "sqlite":
+            return SQLiteURLRepository(
+                path=config.sqlite_path,
+                mmap_size=config.sqlite_mmap_size,
+                read_only=config.sqlite_read_only,
+            )
+
+        if config.url_repository_backend == "lookup":
+            return LookupFileURLRepository(path=config.lookup_file_path)
+
+        cache_breaker = CircuitBreaker(
+            name="redis_cache",
+            failure_threshold=config.redis_breaker_failure_threshold,
+            reset_timeout=config.redis_breaker_reset_timeout,
+            call_timeout=config.redis_breaker_call_timeout,
+        )
+
+        if config.write_behind_enabled:
+            return WriteBehindURLRepository(
+                database=container.resolve(Database),
+                cache=container.resolve(Redis),
+                cache_breaker=cache_breaker,
+                fallback_concurrency=config.redis_fallback_concurrency,
+                outbox_enabled=config.changefeed_relay_enabled,
+                stream=config.write_behind_stream,
+            )
+
+        return SQLAlchemyRedisURLRepository(
+            database=container.resolve(Database),
+            cache=container.resolve(Redis),
+            cache_breaker=cache_breaker,
+            fallback_concurrency=config.redis_fallback_concurrency,
+            outbox_enabled=config.changefeed_relay_enabled,
+        )
+
+    container.register(
+        BaseURLRepository,
+        factory=init_url_repository,
+        scope=Scope.singleton,
+    )
+
+    def init_write_behind_flusher():
+        config: Config = container.resolve(Config)
+        return WriteBehindFlusher(
+            database=container.resolve(Database),
+            redis=container.resolve(Redis),
+            stream=config.write_behind_stream,
+            batch_size=config.write_behind_batch_size,
+            outbox_enabled=config.changefeed_relay_enabled,
+        )
+
+    container.register(
+        WriteBehindFlusher,
+        factory=init_write_behind_flusher,
+        scope=Scope.singleton,
+    )
+
+    def init_outbox_relay():
+        config: Config = container.resolve(Config)
+        return OutboxRelay(
+            database=container.resolve(Database),
+            redis=container.resolve(Redis),
+            stream=config.changefeed_stream,
+            batch_size=config.changefeed_batch_size,
+            max_length=config.changefeed_stream_max_length,
+        )
+
+    container.register(OutboxRelay, factory=init_outbox_relay, scope=Scope.singleton)
+
+    def init_change_feed_consumer():
+        config: Config = container.resolve(Config)
+        # The SQLite file is shared by the worker processes, memory stores
+        # are not
+        lock_path = None
+        if config.url_repository_backend == "sqlite":
+            lock_path = config.sqlite_path.with_name(
+                f"{config.sqlite_path.name}.changefeed.lock",
+            )
+
+        return ChangeFeedConsumer(
+            redis=container.resolve(Redis),
+            stream=config.changefeed_stream,
+            repository=container.resolve(BaseURLRepository),
+            lock_path=lock_path,
+            batch_size=config.changefeed_batch_size,
+        )
+
+    container.register(
+        ChangeFeedConsumer,
+        factory=init_change_feed_consumer,
+        scope=Scope.singleton,
+    )
+
+    def init_rate_limiter():
+        config: Config = container.resolve(Config)
+        uses_redis = config.url_repository_backend == "postgres"
+        return RateLimiter(
+            rules={
+                "create": RateLimitRule(
+                    limit=config.rate_limit_create_requests,
+                    window=config.rate_limit_create_window,
+                ),
+                "resolve": RateLimitRule(
+                    limit=config.rate_limit_resolve_requests,
+                    window=config.rate_limit_resolve_window,
+                ),
+            },
+            redis=container.resolve(Redis) if uses_redis else None,
+        )
+
+    container.register(RateLimiter, factory=init_rate_limiter, scope=Scope.singleton)
+
+    def init_api_key_repository():
+        config: Config = container.resolve(Config)
+        if config.url_repository_backend == "postgres":
+            return SQLAlchemyAPIKeyRepository(database=container.resolve(Database))
+        return InMemoryAPIKeyRepository()
+
+    container.register(
+        BaseAPIKeyRepository,
+        factory=init_api_key_repository,
+        scope=Scope.singleton,
+    )
+
+    def init_authenticator():
+        config: Config = container.resolve(Config)
+        uses_redis = config.url_repository_backend == "postgres"
+        jwt = None
+        if config.auth_jwt_secret:
+            jwt = AuthX(
+                config=AuthXConfig(
+                    JWT_SECRET_KEY=config.auth_jwt_secret,
+                    JWT_TOKEN_LOCATION=["headers"],
+                ),
+            )
+        return Authenticator(
+            keys=container.resolve(BaseAPIKeyRepository),
+            jwt=jwt,
+            redis=container.resolve(Redis) if uses_redis else None,
+            cache_ttl=config.auth_cache_ttl,
+            negative_cache_ttl=config.auth_negative_cache_ttl,
+            max_size=config.auth_cache_max_size,
+            default_quota=config.auth_default_quota,
+            revocation_channel=config.auth_revocation_channel,
+        )
+
+    container.register(
+        Authenticator,
+        factory=init_authenticator,
+        scope=Scope.singleton,
+    )
+
+    def init_quota_tracker():
+        config: Config = container.resolve(Config)
+        uses_redis = config.url_repository_backend == "postgres"
+        return QuotaTracker(redis=container.resolve(Redis) if uses_redis else None)
+
+    container.register(
+        QuotaTracker,
+        factory=init_quota_tracker,
+        scope=Scope.singleton,
+    )
+
+    def init_query_cache_behavior():
+        config: Config = container.resolve(Config)
+        return QueryCacheBehavior(
+            backends={
+                "memory": InMemoryQueryCache(max_size=config.query_cache_max_size),
+                "redis": RedisQueryCache(redis=container.resolve(Redis)),
+            },
+        )
+
+    container.register(
+        QueryCacheBehavior,
+        factory=init_query_cache_behavior,
+        scope=Scope.singleton,
+    )
+
+    def init_alias_blocklist():
+        config: Config = container.resolve(Config)
+        return AliasBlocklist.from_words(
+            substrings=(*BLOCKED_ALIAS_SUBSTRINGS, *config.alias_blocklist),
+        )
+
+    container.register(
+        AliasBlocklist,
+        factory=init_alias_blocklist,
+        scope=Scope.singleton,
+    )
+
+    def init_visitor_counter():
+        config: Config = container.resolve(Config)
+        return RedisVisitorCounter(
+            redis=container.resolve(Redis),
+            retention_days=config.unique_visitors_retention_days,
+            max_buffered=config.unique_visitors_max_buffered,
+        )
+
+    container.register(
+        BaseVisitorCounter,
+        factory=init_visitor_counter,
+        scope=Scope.singleton,
+    )
+
+    def init_click_stats():
+        config: Config = container.resolve(Config)
+        return SQLAlchemyClickStats(
+            database=container.resolve(Database),
+            minute_retention=timedelta(hours=config.link_stats_minute_retention_hours),
+            hour_retention=timedelta(days=config.link_stats_hour_retention_days),
+            max_buffered=config.link_stats_max_buffered,
+        )
+
+    container.register(
+        BaseClickStats,
+        factory=init_click_stats,
+        scope=Scope.singleton,
+    )
+
+    def init_scheduler():
+        config: Config = container.resolve(Config)
+        uses_redis = config.url_repository_backend == "postgres"
+        scheduler = Scheduler(
+            lock=(
+                RedisJobLock(redis=container.resolve(Redis))
+                if uses_redis
+                else LocalJobLock()
+            ),
+        )
+
+        if config.link_stats_enabled:
+            click_stats: SQLAlchemyClickStats = container.resolve(BaseClickStats)
+            scheduler.add_job(
+                Job(
+                    name="compact_click_rollups",
+                    func=click_stats.compact,
+                    schedule=IntervalSchedule(config.link_stats_compaction_interval),
+                    timeout=config.link_stats_compaction_interval,
+                    jitter=config.scheduler_jitter,
+                ),
+            )
+
+        if config.cache_refresh_cron and config.warmup_preload_codes and uses_redis:
+            repository: BaseURLRepository = container.resolve(BaseURLRepository)
+            scheduler.add_job(
+                Job(
+                    name="refresh_cache",
+                    func=partial(
+                        repository.preload_cache,
+                        config.warmup_preload_codes,
+                    ),
+                    schedule=CronSchedule(config.cache_refresh_cron),
+                    timeout=60.0,
+                    jitter=config.scheduler_jitter,
+                ),
+            )
+
+        return scheduler
+
+    container.register(Scheduler, factory=init_scheduler, scope=Scope.singleton)
+
+    def init_hot_keys():
+        config: Config = container.resolve(Config)
+        return HotKeys(
+            url_repository=container.resolve(BaseURLRepository),
+            size=config.hot_keys_size,
+            min_count=config.hot_keys_min_count,
+        )
+
+    container.register(HotKeys, factory=init_hot_keys, scope=Scope.singleton)
 
     container.register(URLService)
 
     container.register(CreateShortURLCommandHandler)
     container.register(GetLongURLQueryHandler)
+    container.register(CheckAliasAvailabilityQueryHandler)
+    container.register(GetUniqueVisitorsQueryHandler)
+    container.register(GetLinkStatsQueryHandler)
+    container.register(GetTopLinksQueryHandler)
 
     def init_mediator():
-        mediator = Mediator()
+        config: Config = container.resolve(Config)
+        mediator = Mediator(
+            behaviors=[TracingBehavior(tracer=ElasticAPMTracer())],
+            concurrent_commands=config.mediator_concurrent_commands,
+        )
+
+        # Before the query cache, which answers most resolves of hot codes
+        if config.hot_keys_enabled:
+            mediator.add_behavior(
+                HotKeyBehavior(hot_keys=container.resolve(HotKeys)),
+            )
+
+        # Cache hits skip the handler, so they are not counted as its timing
+        if config.query_cache_enabled:
+            mediator.add_behavior(container.resolve(QueryCacheBehavior))
+
+        # Inside the cache, so that a retried miss is still coalesced;
+        # every attempt is timed on its own
+        mediator.add_behavior(RetryBehavior())
+        mediator.add_behavior(TimingBehavior(timer=PrometheusHandlerTimer()))
 
         mediator.register_command(
             CreateShortURLCommand,
@@ -69,6 +462,22 @@ def _init_container() -> Container:
             GetLongURLQuery,
             container.resolve(GetLongURLQueryHandler),
         )
+        mediator.register_query(
+            CheckAliasAvailabilityQuery,
+            container.resolve(CheckAliasAvailabilityQueryHandler),
+        )
+        mediator.register_query(
+            GetUniqueVisitorsQuery,
+            container.resolve(GetUniqueVisitorsQueryHandler),
+        )
+        mediator.register_query(
+            GetLinkStatsQuery,
+            container.resolve(GetLinkStatsQueryHandler),
+        )
+        mediator.register_query(
+            GetTopLinksQuery,
+            container.resolve(GetTopLinksQueryHandler),
+        )
 
         return mediator
 
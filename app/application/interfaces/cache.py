@@ -0,0 +1,23 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import Any
+
+
+class BaseQueryCache(ABC):
+    """Storage for cached query results.
+
+    ``None`` is reserved for a miss, so handlers returning ``None`` are
+    never cached.
+
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
@@ -0,0 +1,39 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+
+Granularity = Literal["minute", "hour", "day"]
+
+
+@dataclass(frozen=True, slots=True)
+class ClickCount:
+    # Start of the bucket, naive UTC
+    bucket: datetime
+    clicks: int
+
+
+class BaseClickStats(ABC):
+    """Resolve counts per short URL, pre-aggregated by time bucket."""
+
+    @abstractmethod
+    def record(self, short_url: str) -> None:
+        """Called on every resolve, must not block on I/O."""
+
+    @abstractmethod
+    async def get_series(
+        self,
+        short_url: str,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+    ) -> list[ClickCount]:
+        """Non-empty buckets in ``[start, end)``, oldest first."""
+
+    @abstractmethod
+    async def get_top(self, limit: int) -> list[tuple[str, int]]:
+        """Most resolved short URLs of all time with their click counts."""
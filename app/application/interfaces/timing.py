@@ -0,0 +1,20 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+
+class BaseHandlerTimer(ABC):
+    """Sink for the duration of command and query handler calls."""
+
+    @abstractmethod
+    def observe(
+        self,
+        kind: str,
+        message: str,
+        handler: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        """``kind`` is ``command`` or ``query``, ``outcome`` is ``ok`` or
+        ``error``."""
@@ -0,0 +1,13 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from contextlib import AbstractAsyncContextManager
+
+
+class BaseTracer(ABC):
+    """Opens spans inside the trace of the current request."""
+
+    @abstractmethod
+    def span(self, name: str, action: str) -> AbstractAsyncContextManager:
+        """Span around a handler call, a no-op outside a sampled trace."""
@@ -0,0 +1,18 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from datetime import date
+from typing import Sequence
+
+
+class BaseVisitorCounter(ABC):
+    """Approximate distinct visitors per short URL and day."""
+
+    @abstractmethod
+    def record(self, short_url: str, fingerprint: str) -> None:
+        """Called on every resolve, must not block on I/O."""
+
+    @abstractmethod
+    async def count(self, short_url: str, days: Sequence[date]) -> int:
+        """Distinct visitors over the union of ``days``."""
@@ -1,13 +1,20 @@
+import asyncio
 from collections import defaultdict
 from dataclasses import (
     dataclass,
     field,
 )
+from functools import partial
 from typing import (
     Any,
     Iterable,
 )
 
+from application.behaviors.base import (
+    BaseBehavior,
+    Handler,
+    NextCall,
+)
 from application.commands.base import (
     BaseCommand,
     BaseCommandHandler,
@@ -38,12 +45,38 @@ class Mediator:
         kw_only=True,
     )
 
+    behaviors: list[BaseBehavior] = field(
+        default_factory=list,
+        kw_only=True,
+    )
+
+    # Run the handlers of one command concurrently. Only for handlers that
+    # do not depend on each other's side effects.
+    concurrent_commands: bool = field(default=False, kw_only=True)
+
+    # Dispatch tables: message type -> handlers already wrapped in the
+    # behavior pipeline, so dispatch is a single dict lookup.
+    _command_pipelines: dict[type, tuple[NextCall, ...]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _query_pipelines: dict[type, NextCall] = field(
+        default_factory=dict,
+        init=False,
+    )
+
+    def __post_init__(self):
+        self._rebuild_pipelines()
+
     def register_command(
         self,
         command: CommandType,
         command_handlers: Iterable[BaseCommandHandler[CommandType, CommandResultType]],
     ):
         self.commands_map[command].extend(command_handlers)
+        self._command_pipelines[command] = tuple(
+            self._build_pipeline(handler) for handler in self.commands_map[command]
+        )
 
     def register_query(
         self,
@@ -51,22 +84,43 @@ class Mediator:
         query_handler: BaseQueryHandler[QueryType, QueryResultType],
     ):
         self.queries_map[query] = query_handler
+        self._query_pipelines[query] = self._build_pipeline(query_handler)
+
+    def add_behavior(self, behavior: BaseBehavior):
+        self.behaviors.append(behavior)
+        self._rebuild_pipelines()
+
+    def _build_pipeline(self, handler: Handler) -> NextCall:
+        call_next = handler.handle
+        for behavior in reversed(self.behaviors):
+            call_next = partial(behavior.handle, handler=handler, call_next=call_next)
+        return call_next
+
+    def _rebuild_pipelines(self):
+        self._command_pipelines = {
+            command: tuple(self._build_pipeline(handler) for handler in handlers)
+            for command, handlers in self.commands_map.items()
+        }
+        self._query_pipelines = {
+            query: self._build_pipeline(handler)
+            for query, handler in self.queries_map.items()
+        }
 
     async def handle_command(self, command: BaseCommand) -> Iterable[CommandResultType]:
-        command_type = command.__class__
+        pipelines = self._command_pipelines.get(command.__class__)
 
-        handlers = self.commands_map.get(command_type)
+        if not pipelines:
+            raise CommandHandlersNotRegisteredException(command.__class__)
 
-        if not handlers:
-            raise CommandHandlersNotRegisteredException(command_type)
+        if self.concurrent_commands and len(pipelines) > 1:
+            return list(await asyncio.gather(*(call(command) for call in pipelines)))
 
-        return [await handler.handle(command) for handler in handlers]
+        return [await call(command) for call in pipelines]
 
     async def handle_query(self, query: BaseQuery) -> QueryResultType:
-        query_type = query.__class__
-        handler = self.queries_map.get(query_type)
+        pipeline = self._query_pipelines.get(query.__class__)
 
-        if not handler:
-            raise QueryHandlerNotRegisteredException(query_type)
+        if not pipeline:
+            raise QueryHandlerNotRegisteredException(query.__class__)
 
-        return await handler.handle(query=query)
+        return await pipeline(query)
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+
+from application.behaviors.caching import cached_query
+from application.exceptions.stats import InvalidStatsRangeException
+from application.interfaces.clicks import (
+    BaseClickStats,
+    ClickCount,
+    Granularity,
+)
+from application.interfaces.visitors import BaseVisitorCounter
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.services.url import URLService
+
+
+# PFCOUNT merges one HyperLogLog per day, the range bounds its cost
+MAX_VISITORS_RANGE_DAYS = 366
+
+# Keeps a series under ~1500 points
+MAX_SERIES_RANGE_DAYS: dict[Granularity, int] = {
+    "minute": 1,
+    "hour": 31,
+    "day": 366,
+}
+
+BUCKET_SIZES: dict[Granularity, timedelta] = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+
+@dataclass(frozen=True)
+class GetUniqueVisitorsQuery(BaseQuery):
+    short_url: str
+    date_from: date
+    date_to: date
+
+
+@dataclass(frozen=True)
+class GetUniqueVisitorsQueryHandler(
+    BaseQueryHandler[GetUniqueVisitorsQuery, int],
+):
+    url_service: URLService
+    visitor_counter: BaseVisitorCounter
+
+    async def handle(self, query: GetUniqueVisitorsQuery) -> int:
+        number_of_days = (query.date_to - query.date_from).days + 1
+        if not 0 < number_of_days <= MAX_VISITORS_RANGE_DAYS:
+            raise InvalidStatsRangeException(
+                date_from=query.date_from,
+                date_to=query.date_to,
+                max_days=MAX_VISITORS_RANGE_DAYS,
+            )
+
+        # Unknown codes are reported as such instead of zero visitors
+        await self.url_service.get_long_url(short_url=query.short_url)
+
+        days = [query.date_from + timedelta(days=day) for day in range(number_of_days)]
+        return await self.visitor_counter.count(query.short_url, days)
+
+
+@dataclass(frozen=True)
+class GetLinkStatsQuery(BaseQuery):
+    short_url: str
+    granularity: Granularity
+    date_from: date
+    date_to: date
+
+
+@dataclass(frozen=True)
+class GetLinkStatsQueryHandler(
+    BaseQueryHandler[GetLinkStatsQuery, list[ClickCount]],
+):
+    url_service: URLService
+    click_stats: BaseClickStats
+
+    async def handle(self, query: GetLinkStatsQuery) -> list[ClickCount]:
+        max_days = MAX_SERIES_RANGE_DAYS[query.granularity]
+        number_of_days = (query.date_to - query.date_from).days + 1
+        if not 0 < number_of_days <= max_days:
+            raise InvalidStatsRangeException(
+                date_from=query.date_from,
+                date_to=query.date_to,
+                max_days=max_days,
+            )
+
+        await self.url_service.get_long_url(short_url=query.short_url)
+
+        start = datetime.combine(query.date_from, time())
+        end = datetime.combine(query.date_to + timedelta(days=1), time())
+        counts = await self.click_stats.get_series(
+            query.short_url,
+            query.granularity,
+            start,
+            end,
+        )
+
+        # The rollups only store non-empty buckets, charts want every one
+        clicks = {count.bucket: count.clicks for count in counts}
+        bucket_size = BUCKET_SIZES[query.granularity]
+        series = []
+        bucket = start
+        while bucket < end:
+            series.append(ClickCount(bucket=bucket, clicks=clicks.get(bucket, 0)))
+            bucket += bucket_size
+
+        return series
+
+
+# The ranking is shared by all callers and changes with every flush anyway
+@cached_query(key=lambda query: str(query.limit), ttl=10)
+@dataclass(frozen=True)
+class GetTopLinksQuery(BaseQuery):
+    limit: int
+
+
+@dataclass(frozen=True)
+class GetTopLinksQueryHandler(
+    BaseQueryHandler[GetTopLinksQuery, list[tuple[str, int]]],
+):
+    click_stats: BaseClickStats
+
+    async def handle(self, query: GetTopLinksQuery) -> list[tuple[str, int]]:
+        return await self.click_stats.get_top(query.limit)
@@ -1,12 +1,22 @@
 from dataclasses import dataclass
 
+from application.behaviors.caching import cached_query
+from application.behaviors.hot_keys import tracks_hot_keys
+from application.behaviors.retry import retries
 from application.queries.base import (
     BaseQuery,
     BaseQueryHandler,
 )
+from domain.exceptions.url import URLStorageUnavailableException
 from domain.services.url import URLService
 
 
+# Short code -> long URL mappings never change once created. A resolve that
+# found the database fallback saturated while Redis is down gets one more
+# try after a short pause instead of an immediate 503.
+@tracks_hot_keys(key=lambda query: query.short_url)
+@cached_query(key=lambda query: query.short_url, ttl=300)
+@retries(URLStorageUnavailableException, attempts=2, delay=0.05)
 @dataclass(frozen=True)
 class GetLongURLQuery(BaseQuery):
     short_url: str
@@ -23,3 +33,19 @@ class GetLongURLQueryHandler(
             short_url=query.short_url,
         )
         return long_url
+
+
+@cached_query(key=lambda query: query.alias, ttl=5)
+@dataclass(frozen=True)
+class CheckAliasAvailabilityQuery(BaseQuery):
+    alias: str
+
+
+@dataclass(frozen=True)
+class CheckAliasAvailabilityQueryHandler(
+    BaseQueryHandler[CheckAliasAvailabilityQuery, bool],
+):
+    url_service: URLService
+
+    async def handle(self, query: CheckAliasAvailabilityQuery) -> bool:
+        return await self.url_service.is_alias_available(alias=query.alias)
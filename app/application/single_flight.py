@@ -0,0 +1,57 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    TypeVar,
+)
+
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlight(Generic[K, T]):
+    """Collapses concurrent calls for one key into a single call.
+
+    The first caller runs ``func`` and the others wait for its result or
+    exception. When the running call is cancelled the waiters are not:
+    the next one in line runs ``func`` itself.
+
+    """
+
+    _calls: dict[K, asyncio.Future] = field(default_factory=dict, init=False)
+
+    async def do(self, key: K, func: Callable[[], Awaitable[T]]) -> T:
+        while (in_flight := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # Retry only if the call we waited for was cancelled and
+                # this task was not
+                if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except Exception as exception:
+            future.set_exception(exception)
+            # Nobody may be waiting, mark the exception as retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            # Cancelled or failed with a BaseException, wake the waiters up
+            if not future.done():
+                future.cancel()
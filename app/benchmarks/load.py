@@ -0,0 +1,343 @@
+"""Load test for the create and resolve paths of the real application.
+
+Requests are driven either in-process through ``httpx.ASGITransport``
+(no network, measures the application itself) or over HTTP against a
+uvicorn server, which can be started by the benchmark. The request mix
+is configurable:
+
+- ``create`` - ``POST /api/v1/urls`` with a new long URL
+- ``hit`` - resolve of a code that has been resolved before (warm caches)
+- ``miss`` - first resolve of a seeded code (cold query cache)
+- ``unknown`` - resolve of a code that does not exist
+
+Run from ``app/``::
+
+    python -m benchmarks.load --backend memory --requests 20000
+    python -m benchmarks.load --backend postgres --spawn-server --output load.json
+
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from contextlib import (
+    asynccontextmanager,
+    AsyncExitStack,
+)
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from pathlib import Path
+from statistics import (
+    mean,
+    quantiles,
+)
+from typing import AsyncIterator
+
+import httpx
+import orjson
+
+
+SCENARIOS = ("create", "hit", "miss", "unknown")
+DEFAULT_MIX = "create=10,hit=70,miss=10,unknown=10"
+CODE_ALPHABET = string.ascii_letters + string.digits
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    statuses: dict[str, int]
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class LoadResult:
+    target: str
+    backend: str
+    concurrency: int
+    requests: int
+    duration_s: float
+    throughput_rps: float
+    scenarios: dict[str, ScenarioResult]
+    commit: str | None
+    python: str = field(default_factory=platform.python_version)
+    started_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
+    )
+
+
+@dataclass
+class Samples:
+    latencies: list[float] = field(default_factory=list)
+    statuses: dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+    def add(self, latency: float, status: int | None) -> None:
+        self.latencies.append(latency)
+        key = str(status) if status is not None else "exception"
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if status is None or status >= 500:
+            self.errors += 1
+
+    def summarize(self) -> ScenarioResult:
+        milliseconds = [latency * 1000 for latency in self.latencies]
+        if len(milliseconds) > 1:
+            percentiles = quantiles(milliseconds, n=100, method="inclusive")
+            p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+        else:
+            p50 = p95 = p99 = milliseconds[0] if milliseconds else 0.0
+
+        return ScenarioResult(
+            requests=len(milliseconds),
+            errors=self.errors,
+            statuses=self.statuses,
+            mean_ms=round(mean(milliseconds), 3) if milliseconds else 0.0,
+            p50_ms=round(p50, 3),
+            p95_ms=round(p95, 3),
+            p99_ms=round(p99, 3),
+        )
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario: {name}")
+        weights[name] = int(weight)
+
+    return weights
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def random_long_url(rng: random.Random) -> str:
+    path = "".join(rng.choices(string.ascii_lowercase, k=24))
+    return f"https://example.com/{path}?id={rng.getrandbits(64)}"
+
+
+@asynccontextmanager
+async def asgi_client(backend: str) -> AsyncIterator[httpx.AsyncClient]:
+    os.environ["URL_REPOSITORY_BACKEND"] = backend
+
+    from presentation.api.main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    # ASGITransport does not send lifespan events, run startup explicitly
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://benchmark",
+        ) as client:
+            yield client
+
+
+@asynccontextmanager
+async def server_process(backend: str, port: int) -> AsyncIterator[str]:
+    env = {
+        **os.environ,
+        "URL_REPOSITORY_BACKEND": backend,
+        "SERVER_PORT": str(port),
+        "SERVER_HOST": "127.0.0.1",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "presentation.api.server"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(300):
+                try:
+                    response = await client.get("/healthcheck/ready")
+                    if response.status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("Server did not become ready")
+
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+async def seed(
+    client: httpx.AsyncClient,
+    rng: random.Random,
+    count: int,
+) -> list[str]:
+    codes = []
+    for _ in range(count):
+        response = await client.post(
+            "/api/v1/urls",
+            json={"long_url": random_long_url(rng)},
+        )
+        response.raise_for_status()
+        codes.append(response.json()["data"]["short_url"])
+
+    return codes
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    weights: dict[str, int],
+    requests: int,
+    concurrency: int,
+    rng: random.Random,
+) -> tuple[dict[str, Samples], float]:
+    schedule = rng.choices(
+        list(weights),
+        weights=list(weights.values()),
+        k=requests,
+    )
+    cold_count = schedule.count("miss")
+
+    hot_codes = await seed(client, rng, max(1, min(1000, requests // 100)))
+    cold_codes = await seed(client, rng, cold_count)
+    for code in hot_codes:
+        await client.get(f"/api/v1/urls/{code}")
+
+    samples = {name: Samples() for name in weights}
+    queue = iter(schedule)
+
+    async def send(scenario: str) -> httpx.Response:
+        if scenario == "create":
+            return await client.post(
+                "/api/v1/urls",
+                json={"long_url": random_long_url(rng)},
+            )
+        if scenario == "hit":
+            return await client.get(f"/api/v1/urls/{rng.choice(hot_codes)}")
+        if scenario == "miss":
+            return await client.get(f"/api/v1/urls/{cold_codes.pop()}")
+
+        unknown = "".join(rng.choices(CODE_ALPHABET, k=12))
+        return await client.get(f"/api/v1/urls/{unknown}")
+
+    async def worker() -> None:
+        for scenario in queue:
+            started_at = time.perf_counter()
+            try:
+                status = (await send(scenario)).status_code
+            except httpx.HTTPError:
+                status = None
+            samples[scenario].add(time.perf_counter() - started_at, status)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started_at
+
+
+async def run(args: argparse.Namespace) -> LoadResult:
+    rng = random.Random(args.seed)
+
+    async with AsyncExitStack() as stack:
+        if args.url or args.spawn_server:
+            base_url = args.url or await stack.enter_async_context(
+                server_process(args.backend, args.port),
+            )
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(
+                    base_url=base_url,
+                    limits=httpx.Limits(max_connections=args.concurrency),
+                ),
+            )
+            target = base_url
+        else:
+            client = await stack.enter_async_context(asgi_client(args.backend))
+            target = "asgi"
+
+        samples, duration = await run_load(
+            client,
+            args.mix,
+            args.requests,
+            args.concurrency,
+            rng,
+        )
+
+    return LoadResult(
+        target=target,
+        backend=args.backend,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        duration_s=round(duration, 3),
+        throughput_rps=round(args.requests / duration, 1),
+        scenarios={name: sample.summarize() for name, sample in samples.items()},
+        commit=git_commit(),
+    )
+
+
+def print_result(result: LoadResult) -> None:
+    print(
+        f"{result.target} / {result.backend}: {result.requests} requests, "
+        f"concurrency {result.concurrency}, {result.throughput_rps} req/s",
+    )
+    print(
+        f"{'scenario':<10} {'requests':>9} {'errors':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}",
+    )
+    for name, scenario in result.scenarios.items():
+        print(
+            f"{name:<10} {scenario.requests:>9} {scenario.errors:>7} "
+            f"{scenario.p50_ms:>8.2f} {scenario.p95_ms:>8.2f} {scenario.p99_ms:>8.2f}",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend", choices=("memory", "sqlite", "postgres"), default="memory"
+    )
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--url", help="Benchmark a running server instead")
+    parser.add_argument("--spawn-server", action="store_true")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", type=Path, help="Save the result as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_result(result)
+
+    if args.output:
+        args.output.write_bytes(
+            orjson.dumps(asdict(result), option=orjson.OPT_INDENT_2),
+        )
+
+
+if __name__ == "__main__":
+    main()
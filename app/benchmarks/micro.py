@@ -0,0 +1,198 @@
+"""CPU time and memory per call for the hot domain and application paths.
+
+For every case the fastest of ``--repeat`` rounds of ``--number`` calls is
+reported, together with two tracemalloc figures:
+
+- ``peak`` - highest traced memory during a single call, i.e. how much
+  the call allocates at once, including temporaries
+- ``retained`` - memory still held after ``--number`` calls, divided by
+  the number of calls (stored pairs, caches, leaks)
+
+Run from ``app/``::
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter mediator --output micro.json
+
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from itertools import count
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+import orjson
+from punq import Scope
+
+from application.init import _init_container
+from application.mediator import Mediator
+from application.queries.url import (
+    GetLongURLQuery,
+    GetLongURLQueryHandler,
+)
+from domain.entities.url import URLEntity
+from domain.interfaces.repositories.url import BaseURLRepository
+from domain.services.url import URLService
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.converters.url import (
+    convert_url_entity_to_model,
+    convert_url_model_to_entity,
+)
+from infrastructure.database.repositories.url import InMemoryURLRepository
+from settings.config import Config
+
+
+LONG_URL = "https://example.com/some/fairly/long/path?utm_source=newsletter&utm_campaign=launch"
+
+Call = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class CaseResult:
+    per_call_us: float
+    peak_bytes: int
+    retained_bytes_per_call: float
+
+
+async def build_cases() -> dict[str, Call]:
+    long_url = LongURLValueObject(value=LONG_URL)
+    entity = URLEntity(short_url="4c92Xq1d", long_url=long_url)
+    model = convert_url_entity_to_model(entity)
+
+    container = _init_container()
+    container.register(
+        Config,
+        instance=Config(URL_REPOSITORY_BACKEND="memory", WARMUP_ENABLED=False),
+        scope=Scope.singleton,
+    )
+    container.register(
+        BaseURLRepository,
+        instance=InMemoryURLRepository(),
+        scope=Scope.singleton,
+    )
+    service: URLService = container.resolve(URLService)
+    mediator: Mediator = container.resolve(Mediator)
+    sequence = count()
+
+    bare_mediator = Mediator()
+    bare_mediator.register_query(
+        GetLongURLQuery,
+        container.resolve(GetLongURLQueryHandler),
+    )
+
+    short_url = await service.get_or_create_short_url(LONG_URL)
+
+    async def validate_long_url():
+        return LongURLValueObject(value=LONG_URL)
+
+    async def create_entity():
+        return URLEntity(short_url="4c92Xq1d", long_url=long_url)
+
+    async def entity_to_model():
+        return convert_url_entity_to_model(entity)
+
+    async def model_to_entity():
+        return convert_url_model_to_entity(model)
+
+    async def generate_short_url():
+        # A new long URL every call, so dedup never short-circuits
+        return await service.get_or_create_short_url(f"{LONG_URL}&n={next(sequence)}")
+
+    async def mediator_bare_query():
+        return await bare_mediator.handle_query(GetLongURLQuery(short_url=short_url))
+
+    async def mediator_pipeline_query():
+        return await mediator.handle_query(GetLongURLQuery(short_url=short_url))
+
+    return {
+        "value_object.validate": validate_long_url,
+        "entity.create": create_entity,
+        "converter.entity_to_model": entity_to_model,
+        "converter.model_to_entity": model_to_entity,
+        "service.get_or_create_short_url": generate_short_url,
+        "mediator.query.bare": mediator_bare_query,
+        "mediator.query.pipeline": mediator_pipeline_query,
+    }
+
+
+async def measure(call: Call, number: int, repeat: int) -> CaseResult:
+    await call()
+
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            await call()
+        timings.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await call()
+        _, peak = tracemalloc.get_traced_memory()
+
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(number):
+            await call()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        per_call_us=round(min(timings) / number * 1e6, 3),
+        peak_bytes=peak - baseline,
+        retained_bytes_per_call=round((after - before) / number, 1),
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, CaseResult]:
+    cases = await build_cases()
+    results = {}
+
+    print(f"{'case':<34} {'per call':>11} {'peak':>10} {'retained':>12}")
+    for name, call in cases.items():
+        if args.filter and args.filter not in name:
+            continue
+
+        result = await measure(call, args.number, args.repeat)
+        results[name] = result
+        print(
+            f"{name:<34} {result.per_call_us:>8.2f} us {result.peak_bytes:>8} B "
+            f"{result.retained_bytes_per_call:>8.1f} B/op",
+        )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="Only run cases containing this text")
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        args.output.write_bytes(
+            orjson.dumps(
+                {name: asdict(result) for name, result in results.items()},
+                option=orjson.OPT_INDENT_2,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Serialization cost per request for the create, resolve and healthcheck
+responses.
+
+Compares the previous rendering path (a parametrized ``ApiResponse`` model
+passed through FastAPI's ``serialize_response`` and the stdlib
+``JSONResponse``) with the lean orjson envelope the routes return now.
+
+Run from ``app/``::
+
+    python -m benchmarks.serialization
+
+"""
+
+import argparse
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from presentation.api.responses import api_response
+from presentation.api.schemas import (
+    ApiResponse,
+    PingResponseSchema,
+)
+from presentation.api.v1.url.schemas import (
+    CreateShortURLResponseSchema,
+    GetLongURLResponseSchema,
+)
+
+
+LONG_URL = "https://example.com/some/fairly/long/path?utm_source=newsletter&utm_campaign=launch"
+
+CASES: dict[str, tuple[type, type, dict[str, Any]]] = {
+    "create": (
+        CreateShortURLResponseSchema,
+        ApiResponse[CreateShortURLResponseSchema],
+        {"short_url": "4c92Xq1d"},
+    ),
+    "resolve": (
+        GetLongURLResponseSchema,
+        ApiResponse[GetLongURLResponseSchema],
+        {"long_url": LONG_URL},
+    ),
+    "healthcheck": (
+        PingResponseSchema,
+        ApiResponse[PingResponseSchema],
+        {"result": True},
+    ),
+}
+
+
+Renderer = Callable[[], Awaitable[bytes]]
+
+
+def _response_model_path(schema: type, envelope: type, payload: dict) -> Renderer:
+    field = create_model_field(name="Response", type_=envelope, mode="serialization")
+
+    async def render() -> bytes:
+        # What the handlers used to do: subscript the generic, build the
+        # envelope, let FastAPI revalidate it and encode with the stdlib.
+        content = ApiResponse[schema](data=schema(**payload))
+        serialized = await serialize_response(field=field, response_content=content)
+        return JSONResponse(content=jsonable_encoder(serialized)).body
+
+    return render
+
+
+def _orjson_path(payload: dict) -> Renderer:
+    async def render() -> bytes:
+        return api_response(payload).body
+
+    return render
+
+
+async def _per_call_us(render: Renderer, number: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            await render()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings) / number * 1e6
+
+
+async def run(number: int, repeat: int) -> None:
+    print(f"{'endpoint':<12} {'response_model':>16} {'orjson':>10} {'speedup':>8}")
+    for name, (schema, envelope, payload) in CASES.items():
+        legacy = await _per_call_us(
+            _response_model_path(schema, envelope, payload),
+            number,
+            repeat,
+        )
+        lean = await _per_call_us(_orjson_path(payload), number, repeat)
+        print(f"{name:<12} {legacy:>13.2f} us {lean:>7.2f} us {legacy / lean:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(number=args.number, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,16 @@ from uuid import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity(ABC):
     id: UUID = field(default_factory=uuid4, kw_only=True)
     created_at: datetime = field(default_factory=datetime.now, kw_only=True)
-    updated_at: datetime = field(default_factory=datetime.now, kw_only=True)
+    # Defaults to ``created_at``: one clock read per new entity instead of two
+    updated_at: datetime | None = field(default=None, kw_only=True)
+
+    def __post_init__(self):
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -4,7 +4,7 @@ from domain.entities.base import BaseEntity
 from domain.value_objects.url import LongURLValueObject
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class URLEntity(BaseEntity):
     short_url: str
     long_url: LongURLValueObject
@@ -14,3 +14,12 @@ class URLEntity(BaseEntity):
 
     def __eq__(self, other: "URLEntity") -> bool:
         return self.short_url == other.short_url
+
+
+@dataclass(frozen=True, slots=True)
+class URLPair:
+    """Read model for resolve and dedup paths that only need the two URLs,
+    without building the entity and revalidating the long URL."""
+
+    short_url: str
+    long_url: str
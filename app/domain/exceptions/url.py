@@ -37,3 +37,45 @@ class URLTooLongError(DomainException):
     @property
     def message(self) -> str:
         return f"URL is too long: {self.url_length} characters (maximum: {self.max_length})"
+
+
+@dataclass(eq=False)
+class InvalidAliasError(DomainException):
+    alias: str
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Invalid alias '{self.alias}': {self.reason}"
+
+
+@dataclass(eq=False)
+class BlockedAliasError(DomainException):
+    alias: str
+
+    @property
+    def message(self) -> str:
+        return f"Alias '{self.alias}' is reserved or not allowed"
+
+
+@dataclass(eq=False)
+class ShortURLAlreadyExistsException(DomainException):
+    short_url: str
+
+    @property
+    def message(self) -> str:
+        return f"Short URL is already taken: {self.short_url}"
+
+
+@dataclass(eq=False)
+class ReadOnlyURLStorageException(DomainException):
+    @property
+    def message(self) -> str:
+        return "Short URLs can not be created on a read-only replica"
+
+
+@dataclass(eq=False)
+class URLStorageUnavailableException(DomainException):
+    @property
+    def message(self) -> str:
+        return "Short URL storage is temporarily unavailable, retry later"
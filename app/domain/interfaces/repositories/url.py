@@ -2,16 +2,71 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from typing import Iterable
 
-from domain.entities.url import URLEntity
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
 
 
 class BaseURLRepository(ABC):
     @abstractmethod
-    async def add(self, url_pair: URLEntity) -> None: ...
+    async def add(self, url_pair: URLEntity) -> None:
+        """Persist a new pair.
+
+        Raises ``ShortURLAlreadyExistsException`` if the short URL is
+        already taken.
+
+        """
 
     @abstractmethod
     async def get_by_short_url(self, short_url: str) -> str | None: ...
 
     @abstractmethod
     async def get_by_long_url(self, long_url: str) -> URLEntity | None: ...
+
+    @abstractmethod
+    async def exists(self, short_url: str) -> bool: ...
+
+    async def get_pair_by_long_url(self, long_url: str) -> URLPair | None:
+        """Same lookup as ``get_by_long_url`` for callers that only need the
+        short URL. Backends override it to skip building the entity."""
+        entity = await self.get_by_long_url(long_url)
+        if entity is None:
+            return None
+
+        return URLPair(
+            short_url=entity.short_url,
+            long_url=entity.long_url.as_generic_type(),
+        )
+
+    async def preload_cache(self, limit: int) -> None:
+        """Load up to ``limit`` popular pairs into the cache layer.
+
+        No-op for backends without a separate cache.
+
+        """
+
+    async def apply_changes(
+        self,
+        url_pairs: Iterable[URLEntity],
+        offset: str,
+    ) -> None:
+        """Store pairs replicated from the primary, skipping known ones,
+        together with the change stream ``offset`` they were read up to.
+
+        Only local replica backends support it.
+
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} can not be used as a replica",
+        )
+
+    async def get_change_offset(self) -> str | None:
+        """Offset saved by the last ``apply_changes``, ``None`` if the
+        change stream has to be read from the beginning."""
+        return None
+
+    async def close(self) -> None:
+        """Flush state that must survive a restart. Called on shutdown."""
@@ -0,0 +1,131 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Iterable
+
+
+# Path segments owned by the application itself: an alias equal to one of them
+# would shadow a real route.
+RESERVED_ALIASES = (
+    "admin",
+    "api",
+    "docs",
+    "healthcheck",
+    "metrics",
+    "openapi",
+    "redoc",
+    "static",
+    "stats",
+    "urls",
+)
+
+BLOCKED_ALIAS_SUBSTRINGS = (
+    "bitch",
+    "cunt",
+    "fuck",
+    "porn",
+    "shit",
+)
+
+_LEET_TRANSLATION = str.maketrans(
+    {
+        "0": "o",
+        "1": "i",
+        "3": "e",
+        "4": "a",
+        "5": "s",
+        "7": "t",
+        "-": None,
+        "_": None,
+    },
+)
+
+# Marks the end of a word inside a trie node. Aliases never contain an empty
+# character, so it cannot clash with a real child key.
+_TERMINAL = ""
+
+
+def normalize_alias(alias: str) -> str:
+    """Fold case, separators and common digit substitutions so that
+    ``F-u_c_K`` and ``fuck`` hit the same trie path."""
+    return alias.lower().translate(_LEET_TRANSLATION)
+
+
+@dataclass
+class Trie:
+    """Nested-dict prefix tree.
+
+    Every node is a plain ``dict`` keyed by a single character, which
+    keeps the structure compact and makes a lookup one dict access per
+    character of the input.
+
+    """
+
+    _root: dict = field(default_factory=dict, kw_only=True)
+    _size: int = field(default=0, kw_only=True)
+
+    def add(self, word: str) -> None:
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+
+        if _TERMINAL not in node:
+            node[_TERMINAL] = True
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        node = self._root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return False
+
+        return _TERMINAL in node
+
+    def find_in(self, text: str) -> str | None:
+        """Return the first stored word that occurs anywhere in ``text``."""
+        for start in range(len(text)):
+            node = self._root
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                if _TERMINAL in node:
+                    return text[start : end + 1]
+
+        return None
+
+
+@dataclass
+class AliasBlocklist:
+    """Reserved words (blocked on exact match) and blocked substrings
+    (profanity, blocked anywhere inside an alias)."""
+
+    _reserved: Trie = field(default_factory=Trie, kw_only=True)
+    _substrings: Trie = field(default_factory=Trie, kw_only=True)
+
+    @classmethod
+    def from_words(
+        cls,
+        reserved: Iterable[str] = RESERVED_ALIASES,
+        substrings: Iterable[str] = BLOCKED_ALIAS_SUBSTRINGS,
+    ) -> "AliasBlocklist":
+        blocklist = cls()
+
+        for word in reserved:
+            blocklist._reserved.add(word.lower())
+
+        for word in substrings:
+            blocklist._substrings.add(normalize_alias(word))
+
+        return blocklist
+
+    def is_blocked(self, alias: str) -> bool:
+        if alias.lower() in self._reserved:
+            return True
+
+        return self._substrings.find_in(normalize_alias(alias)) is not None
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from array import array
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Iterable
+
+from domain.interfaces.repositories.url import BaseURLRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CountMinSketch:
+    """Approximate per-key counters in a fixed ``depth x width`` table.
+
+    An estimate never undercounts; it overcounts by at most
+    ``2 * total / width`` with probability ``1 - 2**-depth``. The row
+    indexes come from one ``hash()`` call split into two halves (double
+    hashing), so an update costs a single string hash.
+
+    """
+
+    width: int = 4096
+    depth: int = 4
+
+    _rows: list[array] = field(init=False)
+
+    def __post_init__(self):
+        self._rows = [array("Q", bytes(8 * self.width)) for _ in range(self.depth)]
+
+    def add(self, key: str) -> int:
+        """Count one occurrence and return the new estimate."""
+        value = hash(key)
+        first = value & 0xFFFFFFFF
+        second = (value >> 32) | 1
+        width = self.width
+
+        estimate = None
+        for row_number, row in enumerate(self._rows):
+            index = (first + row_number * second) % width
+            count = row[index] + 1
+            row[index] = count
+            if estimate is None or count < estimate:
+                estimate = count
+
+        return estimate
+
+    def decay(self) -> None:
+        """Halve every counter so that old traffic fades out."""
+        for row in self._rows:
+            for index, count in enumerate(row):
+                if count:
+                    row[index] = count >> 1
+
+
+@dataclass
+class HeavyHitters:
+    """Top-``size`` keys by estimated count over a stream.
+
+    The candidates are a plain dict; the smallest candidate is cached, so
+    the common case (a key that is already tracked or too cold to enter)
+    does not scan it.
+
+    """
+
+    size: int = 100
+    sketch: CountMinSketch = field(default_factory=CountMinSketch)
+
+    _top: dict[str, int] = field(default_factory=dict, init=False)
+    _min_key: str | None = field(default=None, init=False)
+    _min_count: int = field(default=0, init=False)
+
+    def add(self, key: str) -> None:
+        estimate = self.sketch.add(key)
+        top = self._top
+
+        if key in top:
+            top[key] = estimate
+            if key == self._min_key:
+                self._update_min()
+            return
+
+        if len(top) < self.size:
+            top[key] = estimate
+            if self._min_key is None or estimate < self._min_count:
+                self._min_key, self._min_count = key, estimate
+            return
+
+        if estimate > self._min_count:
+            del top[self._min_key]
+            top[key] = estimate
+            self._update_min()
+
+    def top(self, limit: int | None = None) -> list[tuple[str, int]]:
+        ranked = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def decay(self) -> None:
+        self.sketch.decay()
+        self._top = {key: count >> 1 for key, count in self._top.items() if count >> 1}
+        self._update_min()
+
+    def _update_min(self) -> None:
+        if not self._top:
+            self._min_key, self._min_count = None, 0
+            return
+
+        self._min_key = min(self._top, key=self._top.__getitem__)
+        self._min_count = self._top[self._min_key]
+
+
+@dataclass
+class HotKeys:
+    """Finds the most resolved short URLs of this worker and pins their
+    targets in process memory.
+
+    Resolves are only counted on the hot path; ``refresh`` (run on a
+    timer) looks up the current top keys in the repository, replaces the
+    pinned mappings in one assignment and ages the counts. Pairs never
+    change once created, so a pinned mapping can not go stale.
+
+    """
+
+    url_repository: BaseURLRepository
+    size: int = 100
+    min_count: int = 10
+
+    _heavy_hitters: HeavyHitters = field(init=False)
+    _pinned: dict[str, str] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        self._heavy_hitters = HeavyHitters(size=self.size)
+
+    def record(self, short_url: str) -> None:
+        self._heavy_hitters.add(short_url)
+
+    def get_pinned(self, short_url: str) -> str | None:
+        return self._pinned.get(short_url)
+
+    def is_pinned(self, short_url: str) -> bool:
+        return short_url in self._pinned
+
+    def top(self, limit: int | None = None) -> list[tuple[str, int]]:
+        return self._heavy_hitters.top(limit)
+
+    async def refresh(self) -> None:
+        pinned = {}
+        for short_url in self._hot_candidates():
+            long_url = self._pinned.get(short_url)
+            if long_url is None:
+                long_url = await self.url_repository.get_by_short_url(short_url)
+            # Hot unknown codes are reported but there is nothing to pin
+            if long_url is not None:
+                pinned[short_url] = long_url
+
+        self._pinned = pinned
+        self._heavy_hitters.decay()
+
+    async def run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep the previous pins, they are still correct
+                logger.exception("Hot key refresh failed")
+
+    def _hot_candidates(self) -> Iterable[str]:
+        for short_url, count in self._heavy_hitters.top():
+            if count < self.min_count:
+                break
+            yield short_url
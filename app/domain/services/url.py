@@ -4,40 +4,109 @@ from uuid import uuid4
 import base62
 
 from domain.entities.url import URLEntity
-from domain.exceptions.url import LongURLNotFoundException
+from domain.exceptions.url import (
+    BlockedAliasError,
+    LongURLNotFoundException,
+    ShortURLAlreadyExistsException,
+)
 from domain.interfaces.repositories.url import BaseURLRepository
-from domain.value_objects.url import LongURLValueObject
+from domain.services.blocklist import AliasBlocklist
+from domain.services.hot_keys import HotKeys
+from domain.value_objects.url import (
+    LongURLValueObject,
+    ShortURLAliasValueObject,
+)
+
+
+# 48-bit codes make collisions very unlikely, but the unique constraint on
+# short_url is the source of truth, so a clash is simply retried.
+MAX_GENERATION_ATTEMPTS = 3
 
 
 @dataclass
 class URLService:
     url_repository: BaseURLRepository
+    alias_blocklist: AliasBlocklist
+    hot_keys: HotKeys
 
-    async def get_or_create_short_url(self, long_url: str) -> str:
-        existing_pair = await self.url_repository.get_by_long_url(long_url)
+    async def get_or_create_short_url(
+        self,
+        long_url: str,
+        alias: str | None = None,
+    ) -> str:
+        if alias is not None:
+            return await self._create_with_alias(long_url=long_url, alias=alias)
+
+        existing_pair = await self.url_repository.get_pair_by_long_url(long_url)
 
         if existing_pair:
             return existing_pair.short_url
 
-        new_id = uuid4()
+        long_url_value = LongURLValueObject(value=long_url)
+
+        for attempt in range(MAX_GENERATION_ATTEMPTS):
+            new_id = uuid4()
+
+            # Просто используем числовое представление UUID (обрезаем если нужно)
+            numeric_value = new_id.int & ((1 << 48) - 1)  # Берем младшие 48 бит
+
+            # Кодируем в base62
+            short_url = base62.encode(numeric_value)
+
+            new_pair = URLEntity(
+                id=new_id,
+                long_url=long_url_value,
+                short_url=short_url,
+            )
 
-        # Просто используем числовое представление UUID (обрезаем если нужно)
-        numeric_value = new_id.int & ((1 << 48) - 1)  # Берем младшие 48 бит
+            try:
+                await self.url_repository.add(new_pair)
+            except ShortURLAlreadyExistsException:
+                if attempt == MAX_GENERATION_ATTEMPTS - 1:
+                    raise
+                continue
 
-        # Кодируем в base62
-        short_url = base62.encode(numeric_value)
+            return short_url
 
-        new_pair = URLEntity(
-            id=new_id,
-            long_url=LongURLValueObject(value=long_url),
-            short_url=short_url,
+    async def _create_with_alias(self, long_url: str, alias: str) -> str:
+        long_url_value = LongURLValueObject(value=long_url)
+        self._validate_alias(alias)
+
+        # Repeating the same request is idempotent; any other target is a
+        # conflict. The unique constraint still guards the race between this
+        # check and the insert.
+        current_long_url = await self.url_repository.get_by_short_url(alias)
+        if current_long_url == long_url:
+            return alias
+        if current_long_url is not None:
+            raise ShortURLAlreadyExistsException(short_url=alias)
+
+        await self.url_repository.add(
+            URLEntity(
+                long_url=long_url_value,
+                short_url=alias,
+            ),
         )
 
-        await self.url_repository.add(new_pair)
+        return alias
+
+    async def is_alias_available(self, alias: str) -> bool:
+        self._validate_alias(alias)
 
-        return short_url
+        return not await self.url_repository.exists(alias)
+
+    def _validate_alias(self, alias: str) -> None:
+        ShortURLAliasValueObject(value=alias)
+
+        if self.alias_blocklist.is_blocked(alias):
+            raise BlockedAliasError(alias=alias)
 
     async def get_long_url(self, short_url: str) -> str:
+        # The most resolved codes of this worker never reach the repository
+        long_url = self.hot_keys.get_pinned(short_url)
+        if long_url is not None:
+            return long_url
+
         long_url = await self.url_repository.get_by_short_url(short_url)
 
         if not long_url:
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Generic,
+    Self,
     TypeVar,
 )
 
@@ -13,13 +14,21 @@ from typing import (
 ValueType = TypeVar("ValueType", bound=Any)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[ValueType]):
     value: ValueType
 
     def __post_init__(self):
         self.validate()
 
+    @classmethod
+    def from_trusted(cls, value: ValueType) -> Self:
+        """Build a value object from already validated data (e.g. loaded from
+        storage) without running ``validate`` again."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        return instance
+
     @abstractmethod
     def validate(self): ...
 
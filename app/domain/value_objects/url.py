@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 
 from domain.exceptions.url import (
     EmptyURLError,
+    InvalidAliasError,
     InvalidURLError,
     URLTooLongError,
 )
@@ -16,8 +17,12 @@ from domain.value_objects.base import BaseValueObject
 
 MAX_URL_LENGTH = 2048
 
+MIN_ALIAS_LENGTH = 3
+MAX_ALIAS_LENGTH = 32
+ALIAS_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LongURLValueObject(BaseValueObject[str]):
     value: str
 
@@ -87,3 +92,24 @@ class LongURLValueObject(BaseValueObject[str]):
 
     def as_generic_type(self) -> str:
         return str(self.value)
+
+
+@dataclass(frozen=True, slots=True)
+class ShortURLAliasValueObject(BaseValueObject[str]):
+    value: str
+
+    def validate(self):
+        if not MIN_ALIAS_LENGTH <= len(self.value) <= MAX_ALIAS_LENGTH:
+            raise InvalidAliasError(
+                alias=self.value,
+                reason=f"Alias must be between {MIN_ALIAS_LENGTH} and {MAX_ALIAS_LENGTH} characters long",
+            )
+
+        if not ALIAS_PATTERN.fullmatch(self.value):
+            raise InvalidAliasError(
+                alias=self.value,
+                reason="Alias may only contain latin letters, digits, '-' and '_'",
+            )
+
+    def as_generic_type(self) -> str:
+        return str(self.value)
@@ -0,0 +1,279 @@
+import asyncio
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+
+from sqlalchemy import (
+    BigInteger,
+    delete,
+    func,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+
+from application.interfaces.clicks import (
+    BaseClickStats,
+    ClickCount,
+    Granularity,
+)
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.clicks import (
+    URLClickDayModel,
+    URLClickHourModel,
+    URLClickMinuteModel,
+    URLClickTotalModel,
+)
+from infrastructure.metrics.prometheus import (
+    CLICK_EVENTS_DROPPED,
+    DB_QUERY_DURATION,
+    observe_duration,
+)
+
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+EPOCH = datetime(1970, 1, 1)
+
+# Rows per upsert statement, asyncpg accepts at most 32767 bind parameters
+# and a row takes three
+FLUSH_CHUNK_SIZE = 5_000
+
+# Finest first, a series of one granularity reads its own table and the
+# finer ones that are not compacted yet
+ROLLUPS: dict[Granularity, type] = {
+    "minute": URLClickMinuteModel,
+    "hour": URLClickHourModel,
+    "day": URLClickDayModel,
+}
+
+FLUSH_DURATION = DB_QUERY_DURATION.labels(repository="click_stats", method="flush")
+COMPACT_DURATION = DB_QUERY_DURATION.labels(repository="click_stats", method="compact")
+SERIES_DURATION = DB_QUERY_DURATION.labels(
+    repository="click_stats",
+    method="get_series",
+)
+TOP_DURATION = DB_QUERY_DURATION.labels(repository="click_stats", method="get_top")
+
+
+def truncate(granularity: Granularity, column):
+    # Inlined, so that GROUP BY matches the selected expression
+    return func.date_trunc(literal_column(f"'{granularity}'"), column)
+
+
+def upsert_clicks(model: type, rows: list[dict]):
+    stmt = insert(model).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=model.__table__.primary_key.columns,
+        set_={"clicks": model.clicks + stmt.excluded.clicks},
+    )
+
+
+def compact_clicks(source: type, target: Granularity, cutoff: datetime):
+    """Move the ``source`` rows older than ``cutoff`` into the ``target``
+    rollup in one statement, so a row is never counted twice or lost."""
+    target_model = ROLLUPS[target]
+    moved = (
+        delete(source)
+        .where(source.bucket < cutoff)
+        .returning(source.short_url, source.bucket, source.clicks)
+        .cte("moved")
+    )
+    bucket = truncate(target, moved.c.bucket)
+    stmt = insert(target_model).from_select(
+        ["short_url", "bucket", "clicks"],
+        select(
+            moved.c.short_url,
+            bucket,
+            func.sum(moved.c.clicks, type_=BigInteger),
+        ).group_by(moved.c.short_url, bucket),
+    )
+    # A data-modifying CTE is only allowed at the top level of the statement
+    return stmt.on_conflict_do_update(
+        index_elements=target_model.__table__.primary_key.columns,
+        set_={"clicks": target_model.clicks + stmt.excluded.clicks},
+    ).add_cte(moved)
+
+
+@dataclass
+class SQLAlchemyClickStats(BaseClickStats):
+    """Click rollups in Postgres.
+
+    Resolves only increment an in-process counter per code and minute;
+    ``run`` upserts the counters into the minute rollup and the all-time
+    totals in one transaction per interval, ``FLUSH_CHUNK_SIZE`` rows a
+    statement. ``compact`` moves minute rows
+    older than ``minute_retention`` into the hour rollup and hour rows
+    older than ``hour_retention`` into the day rollup, so a long chart
+    reads a few hundred rows at most.
+
+    """
+
+    database: Database
+    minute_retention: timedelta = timedelta(days=2)
+    hour_retention: timedelta = timedelta(days=35)
+    max_buffered: int = 100_000
+
+    # (short URL, minutes since the epoch) -> clicks
+    _buffer: dict[tuple[str, int], int] = field(default_factory=dict, init=False)
+
+    def record(self, short_url: str) -> None:
+        key = (short_url, int(time.time()) // MINUTE)
+        clicks = self._buffer.get(key)
+        if clicks is not None:
+            self._buffer[key] = clicks + 1
+        elif len(self._buffer) < self.max_buffered:
+            self._buffer[key] = 1
+        else:
+            CLICK_EVENTS_DROPPED.inc()
+
+    async def flush(self) -> None:
+        buffer, self._buffer = self._buffer, {}
+        if not buffer:
+            return
+
+        # Sorted, so that concurrent flushes of several workers lock the
+        # rows in the same order instead of deadlocking
+        minute_rows = [
+            {
+                "short_url": short_url,
+                "bucket": EPOCH + timedelta(minutes=minute_number),
+                "clicks": clicks,
+            }
+            for (short_url, minute_number), clicks in sorted(buffer.items())
+        ]
+        totals: dict[str, int] = {}
+        for row in minute_rows:
+            totals[row["short_url"]] = totals.get(row["short_url"], 0) + row["clicks"]
+        total_rows = [
+            {"short_url": short_url, "clicks": clicks}
+            for short_url, clicks in totals.items()
+        ]
+
+        try:
+            with observe_duration(FLUSH_DURATION):
+                async with self.database.get_session() as session:
+                    for model, rows in (
+                        (URLClickMinuteModel, minute_rows),
+                        (URLClickTotalModel, total_rows),
+                    ):
+                        for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+                            chunk = rows[start : start + FLUSH_CHUNK_SIZE]
+                            await session.execute(upsert_clicks(model, chunk))
+                    await session.commit()
+        except Exception:
+            self._restore(buffer)
+            raise
+
+    async def compact(self, now: datetime | None = None) -> None:
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        # Whole buckets only, a partly moved hour or day would still add up
+        # but would be split across two tables for longer
+        minute_cutoff = (now - self.minute_retention).replace(
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        hour_cutoff = (now - self.hour_retention).replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+
+        with observe_duration(COMPACT_DURATION):
+            async with self.database.get_session() as session:
+                await session.execute(
+                    compact_clicks(URLClickMinuteModel, "hour", minute_cutoff),
+                )
+                await session.execute(
+                    compact_clicks(URLClickHourModel, "day", hour_cutoff),
+                )
+                await session.commit()
+
+    async def get_series(
+        self,
+        short_url: str,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+    ) -> list[ClickCount]:
+        selects = []
+        for rollup_granularity, model in ROLLUPS.items():
+            selects.append(
+                select(
+                    truncate(granularity, model.bucket).label("bucket"),
+                    model.clicks,
+                ).where(
+                    model.short_url == short_url,
+                    model.bucket >= start,
+                    model.bucket < end,
+                ),
+            )
+            if rollup_granularity == granularity:
+                break
+
+        rollups = union_all(*selects).subquery()
+        stmt = (
+            select(
+                rollups.c.bucket,
+                # sum(bigint) is numeric in Postgres
+                func.sum(rollups.c.clicks).cast(BigInteger),
+            )
+            .group_by(rollups.c.bucket)
+            .order_by(rollups.c.bucket)
+        )
+
+        with observe_duration(SERIES_DURATION):
+            async with self.database.get_read_only_session() as session:
+                rows = (await session.execute(stmt)).all()
+
+        return [ClickCount(bucket=bucket, clicks=clicks) for bucket, clicks in rows]
+
+    async def get_top(self, limit: int) -> list[tuple[str, int]]:
+        stmt = (
+            select(URLClickTotalModel.short_url, URLClickTotalModel.clicks)
+            .order_by(URLClickTotalModel.clicks.desc())
+            .limit(limit)
+        )
+
+        with observe_duration(TOP_DURATION):
+            async with self.database.get_read_only_session() as session:
+                rows = (await session.execute(stmt)).all()
+
+        return [(short_url, clicks) for short_url, clicks in rows]
+
+    async def run(self, interval: float) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.warning("Click stats flush failed", exc_info=True)
+        finally:
+            try:
+                await asyncio.wait_for(self.flush(), timeout=interval)
+            except Exception:
+                logger.warning("Final click stats flush failed", exc_info=True)
+
+    def _restore(self, buffer: dict[tuple[str, int], int]) -> None:
+        # A failed batch is retried with the next flush, counts of new keys
+        # are dropped while the buffer is full
+        for key, clicks in buffer.items():
+            if key in self._buffer:
+                self._buffer[key] += clicks
+            elif len(self._buffer) < self.max_buffered:
+                self._buffer[key] = clicks
+            else:
+                CLICK_EVENTS_DROPPED.inc(clicks)
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    date,
+    timedelta,
+)
+from typing import Sequence
+
+from redis.asyncio import Redis
+
+from application.interfaces.visitors import BaseVisitorCounter
+from infrastructure.metrics.prometheus import VISITOR_EVENTS_DROPPED
+
+
+logger = logging.getLogger(__name__)
+
+DAY = 86_400
+EPOCH = date(1970, 1, 1)
+
+
+def get_visitors_key(short_url: str, day: date) -> str:
+    # The hash tag keeps all days of a code in one cluster slot, so PFCOUNT
+    # can merge them in one call
+    return f"visitors:{{{short_url}}}:{day:%Y%m%d}"
+
+
+@dataclass
+class RedisVisitorCounter(BaseVisitorCounter):
+    """One HyperLogLog per code and day in Redis.
+
+    A HyperLogLog takes at most ~12 KB whatever the traffic, with a
+    standard error of 0.81%. Resolves only add the fingerprint to an
+    in-process buffer (a set, so repeated visits within a flush collapse);
+    ``run`` sends the buffer as pipelined ``PFADD`` calls on an interval.
+    When the buffer is full, new visits are dropped and counted in
+    ``visitor_events_dropped_total``.
+
+    """
+
+    redis: Redis
+    retention_days: int = 400
+    max_buffered: int = 100_000
+
+    # (short URL, days since the epoch) -> fingerprints
+    _buffer: dict[tuple[str, int], set[str]] = field(default_factory=dict, init=False)
+    _buffered: int = field(default=0, init=False)
+
+    def record(self, short_url: str, fingerprint: str) -> None:
+        if self._buffered >= self.max_buffered:
+            VISITOR_EVENTS_DROPPED.inc()
+            return
+
+        key = (short_url, int(time.time()) // DAY)
+        fingerprints = self._buffer.get(key)
+        if fingerprints is None:
+            fingerprints = self._buffer[key] = set()
+
+        if fingerprint not in fingerprints:
+            fingerprints.add(fingerprint)
+            self._buffered += 1
+
+    async def count(self, short_url: str, days: Sequence[date]) -> int:
+        keys = [get_visitors_key(short_url, day) for day in days]
+        return await self.redis.pfcount(*keys)
+
+    async def flush(self) -> None:
+        buffer, self._buffer, self._buffered = self._buffer, {}, 0
+        if not buffer:
+            return
+
+        ttl = self.retention_days * DAY
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for (short_url, day_number), fingerprints in buffer.items():
+                key = get_visitors_key(short_url, EPOCH + timedelta(days=day_number))
+                pipeline.pfadd(key, *fingerprints)
+                pipeline.expire(key, ttl)
+            await pipeline.execute()
+
+    async def run(self, interval: float) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.flush()
+                except Exception:
+                    # Counts are approximate anyway, a failed batch is dropped
+                    logger.warning("Unique visitors flush failed", exc_info=True)
+        finally:
+            # Shutdown: send what is buffered, without delaying it for long
+            try:
+                await asyncio.wait_for(self.flush(), timeout=interval)
+            except Exception:
+                logger.warning("Final unique visitors flush failed", exc_info=True)
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from authx import (
+    AuthX,
+    RequestToken,
+)
+from authx.exceptions import AuthXException
+from redis.asyncio import Redis
+
+from application.single_flight import SingleFlight
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    check_secret,
+    parse_api_key,
+)
+from infrastructure.metrics.prometheus import CACHE_REQUESTS
+
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_HITS = CACHE_REQUESTS.labels(tier="auth", result="hit")
+AUTH_CACHE_MISSES = CACHE_REQUESTS.labels(tier="auth", result="miss")
+
+# Delay before the revocation listener resubscribes after a Redis error
+RESUBSCRIBE_DELAY = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    subject: str
+    kind: str
+    # Short URLs a day, ``None`` is unlimited
+    quota: int | None = None
+
+
+@dataclass
+class Authenticator:
+    """Verifies API keys and JWTs once and caches the principal.
+
+    The cache is keyed by a BLAKE2b digest of the token, so a warm token
+    costs one hash and one dict lookup instead of a bcrypt check. Entries
+    live for ``cache_ttl`` seconds (never longer than the JWT itself) and
+    are dropped on every worker as soon as the subject is revoked: the
+    revocation is published on a Redis channel that each worker listens
+    to. Failed verifications are cached for ``negative_cache_ttl`` seconds,
+    so a wrong secret repeated with a known prefix costs no further bcrypt
+    checks.
+
+    """
+
+    keys: BaseAPIKeyRepository
+    jwt: AuthX | None = None
+    redis: Redis | None = None
+    cache_ttl: float = 300.0
+    negative_cache_ttl: float = 10.0
+    max_size: int = 10_000
+    default_quota: int | None = None
+    revocation_channel: str = "auth:revocations"
+
+    # ``None`` is a failed verification
+    _cache: dict[bytes, tuple[float, Principal | None]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _digests_by_subject: dict[str, set[bytes]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _in_flight: SingleFlight[bytes, Principal | None] = field(
+        default_factory=SingleFlight,
+        init=False,
+    )
+    # Bumped on every revocation, a verification that started before it is
+    # not cached
+    _generation: int = field(default=0, init=False)
+
+    async def authenticate(self, token: str) -> Principal | None:
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+        entry = self._cache.get(digest)
+        if entry is not None and entry[0] > time.monotonic():
+            AUTH_CACHE_HITS.inc()
+            return entry[1]
+
+        AUTH_CACHE_MISSES.inc()
+
+        # A burst of requests with a cold token runs a single bcrypt check
+        return await self._in_flight.do(digest, lambda: self._load(token, digest))
+
+    async def _load(self, token: str, digest: bytes) -> Principal | None:
+        generation = self._generation
+        principal, ttl = await self._verify(token)
+        if principal is None:
+            # Revocations cannot make a failure stale
+            self._store(digest, None, self.negative_cache_ttl)
+        elif generation == self._generation:
+            self._store(digest, principal, ttl)
+        return principal
+
+    def forget(self, subject: str) -> None:
+        """Drop the cached tokens of a subject on this worker."""
+        self._generation += 1
+        for digest in self._digests_by_subject.pop(subject, ()):
+            self._cache.pop(digest, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+        self._digests_by_subject.clear()
+
+    async def revoke(self, subject: str) -> None:
+        """Drop the subject here and tell the other workers to do the
+        same. The key itself must already be revoked in the repository."""
+        self.forget(subject)
+        if self.redis is not None:
+            await self.redis.publish(self.revocation_channel, subject)
+
+    async def listen_revocations(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.revocation_channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.forget(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Revocation listener failed", exc_info=True)
+
+            # Revocations may have been missed while disconnected
+            self.clear()
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+    async def _verify(self, token: str) -> tuple[Principal | None, float]:
+        parsed = parse_api_key(token)
+        if parsed is not None:
+            return await self._verify_api_key(*parsed), self.cache_ttl
+
+        if self.jwt is not None:
+            return self._verify_jwt(token)
+
+        return None, 0.0
+
+    async def _verify_api_key(self, prefix: str, secret: str) -> Principal | None:
+        api_key = await self.keys.get_by_prefix(prefix)
+        if api_key is None or api_key.revoked:
+            return None
+
+        if not await asyncio.to_thread(check_secret, secret, api_key.secret_hash):
+            return None
+
+        return Principal(
+            subject=api_key.subject,
+            kind="api_key",
+            quota=api_key.quota if api_key.quota is not None else self.default_quota,
+        )
+
+    def _verify_jwt(self, token: str) -> tuple[Principal | None, float]:
+        try:
+            payload = self.jwt.verify_token(
+                RequestToken(token=token, location="headers"),
+                verify_csrf=False,
+            )
+        except AuthXException:
+            return None, 0.0
+
+        ttl = self.cache_ttl
+        if payload.exp is not None:
+            expires_at = payload.exp
+            if isinstance(expires_at, datetime):
+                expires_at = expires_at.timestamp()
+            ttl = min(ttl, expires_at - datetime.now(timezone.utc).timestamp())
+
+        quota = getattr(payload, "quota", None)
+        return (
+            Principal(
+                subject=f"jwt:{payload.sub}",
+                kind="jwt",
+                quota=quota if quota is not None else self.default_quota,
+            ),
+            ttl,
+        )
+
+    def _store(
+        self,
+        digest: bytes,
+        principal: Principal | None,
+        ttl: float,
+    ) -> None:
+        if ttl <= 0:
+            return
+
+        if len(self._cache) >= self.max_size:
+            self._evict()
+
+        self._cache[digest] = (time.monotonic() + ttl, principal)
+        if principal is not None:
+            self._digests_by_subject.setdefault(principal.subject, set()).add(digest)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [
+            digest
+            for digest, (expires_at, _) in self._cache.items()
+            if expires_at <= now
+        ]
+        # Nothing expired, drop the oldest entry (dicts keep insertion order)
+        for digest in expired or [next(iter(self._cache))]:
+            _, principal = self._cache.pop(digest)
+            if principal is None:
+                continue
+            digests = self._digests_by_subject.get(principal.subject)
+            if digests is not None:
+                digests.discard(digest)
+                if not digests:
+                    del self._digests_by_subject[principal.subject]
@@ -0,0 +1,103 @@
+import secrets
+import threading
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+
+import bcrypt
+
+
+# Keys look like ``usk_<prefix>_<secret>``. The prefix is public and is the
+# lookup id, only a bcrypt hash of the secret is stored.
+API_KEY_SCHEME = "usk"
+API_KEY_PREFIX_BYTES = 6
+API_KEY_SECRET_BYTES = 32
+
+
+@dataclass(frozen=True, slots=True)
+class APIKey:
+    prefix: str
+    name: str
+    secret_hash: str
+    # Short URLs a day, ``None`` falls back to the default quota
+    quota: int | None = None
+    revoked: bool = False
+
+    @property
+    def subject(self) -> str:
+        return f"key:{self.prefix}"
+
+
+def generate_api_key(name: str, quota: int | None = None) -> tuple[str, APIKey]:
+    """Return the token to hand out once and the record to store."""
+    prefix = secrets.token_hex(API_KEY_PREFIX_BYTES)
+    secret = secrets.token_urlsafe(API_KEY_SECRET_BYTES)
+    secret_hash = bcrypt.hashpw(secret.encode(), bcrypt.gensalt()).decode()
+
+    token = f"{API_KEY_SCHEME}_{prefix}_{secret}"
+    return token, APIKey(
+        prefix=prefix,
+        name=name,
+        secret_hash=secret_hash,
+        quota=quota,
+    )
+
+
+def parse_api_key(token: str) -> tuple[str, str] | None:
+    """Split a token into prefix and secret, ``None`` if it is not an API
+    key (it may still be a JWT)."""
+    scheme, _, rest = token.partition("_")
+    prefix, _, secret = rest.partition("_")
+
+    if scheme != API_KEY_SCHEME or not prefix or not secret:
+        return None
+    return prefix, secret
+
+
+def check_secret(secret: str, secret_hash: str) -> bool:
+    # Deliberately slow (bcrypt work factor), callers run it in a thread
+    return bcrypt.checkpw(secret.encode(), secret_hash.encode())
+
+
+@dataclass
+class BaseAPIKeyRepository(ABC):
+    @abstractmethod
+    async def get_by_prefix(self, prefix: str) -> APIKey | None: ...
+
+    @abstractmethod
+    async def add(self, api_key: APIKey) -> None: ...
+
+    @abstractmethod
+    async def revoke(self, prefix: str) -> bool:
+        """Mark the key revoked, ``False`` if there is no such key."""
+
+
+@dataclass
+class InMemoryAPIKeyRepository(BaseAPIKeyRepository):
+    """Keys of a single process, for the memory and SQLite backends and
+    the tests."""
+
+    _keys: dict[str, APIKey] = field(default_factory=dict, kw_only=True)
+    _lock: threading.Lock = field(default_factory=threading.Lock, kw_only=True)
+
+    async def get_by_prefix(self, prefix: str) -> APIKey | None:
+        return self._keys.get(prefix)
+
+    async def add(self, api_key: APIKey) -> None:
+        with self._lock:
+            self._keys[api_key.prefix] = api_key
+
+    async def revoke(self, prefix: str) -> bool:
+        with self._lock:
+            api_key = self._keys.get(prefix)
+            if api_key is None:
+                return False
+
+            self._keys[prefix] = replace(api_key, revoked=True)
+            return True
@@ -0,0 +1,52 @@
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from redis.asyncio import Redis
+
+
+logger = logging.getLogger(__name__)
+
+DAY = 86_400
+
+
+@dataclass
+class QuotaTracker:
+    """Counts usage per subject in fixed windows (a day by default).
+
+    The counter lives in Redis so that every worker shares it; without
+    Redis, or when it fails, the count is kept per process.
+
+    """
+
+    redis: Redis | None = None
+    window: int = DAY
+
+    _counters: dict[str, int] = field(default_factory=dict, init=False)
+    _current_window: int = field(default=0, init=False)
+
+    async def consume(self, subject: str, limit: int) -> bool:
+        """Count one use, ``False`` once the subject is over ``limit``."""
+        window = int(time.time()) // self.window
+
+        if self.redis is not None:
+            key = f"quota:{subject}:{window}"
+            try:
+                async with self.redis.pipeline(transaction=False) as pipeline:
+                    pipeline.incr(key)
+                    pipeline.expire(key, self.window * 2)
+                    used, _ = await pipeline.execute()
+                return used <= limit
+            except Exception:
+                logger.warning("Quota check in Redis failed", exc_info=True)
+
+        if window != self._current_window:
+            self._counters.clear()
+            self._current_window = window
+
+        used = self._counters.get(subject, 0) + 1
+        self._counters[subject] = used
+        return used <= limit
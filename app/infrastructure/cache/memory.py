@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from time import monotonic
+from typing import Any
+
+from application.interfaces.cache import BaseQueryCache
+from infrastructure.metrics.prometheus import CACHE_REQUESTS
+
+
+MEMORY_HITS = CACHE_REQUESTS.labels(tier="query_memory", result="hit")
+MEMORY_MISSES = CACHE_REQUESTS.labels(tier="query_memory", result="miss")
+
+
+@dataclass
+class InMemoryQueryCache(BaseQueryCache):
+    """Per-process LRU cache with a TTL per entry."""
+
+    max_size: int = 10_000
+
+    # key -> (expires_at, value), ordered from least to most recently used
+    _entries: OrderedDict[str, tuple[float, Any]] = field(
+        default_factory=OrderedDict,
+        init=False,
+    )
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= monotonic():
+            MEMORY_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        MEMORY_HITS.inc()
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
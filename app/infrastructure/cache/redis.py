@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from redis.asyncio import Redis
+
+from application.interfaces.cache import BaseQueryCache
+from infrastructure.metrics.prometheus import CACHE_REQUESTS
+
+
+REDIS_HITS = CACHE_REQUESTS.labels(tier="query_redis", result="hit")
+REDIS_MISSES = CACHE_REQUESTS.labels(tier="query_redis", result="miss")
+
+
+@dataclass
+class RedisQueryCache(BaseQueryCache):
+    """Query results shared between workers, serialized with orjson."""
+
+    redis: Redis
+    prefix: str = "query"
+
+    async def get(self, key: str) -> Any | None:
+        value = await self.redis.get(f"{self.prefix}:{key}")
+
+        if value is None:
+            REDIS_MISSES.inc()
+            return None
+
+        REDIS_HITS.inc()
+        return orjson.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self.redis.set(
+            f"{self.prefix}:{key}",
+            orjson.dumps(value),
+            px=int(ttl * 1000),
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.redis.delete(*(f"{self.prefix}:{key}" for key in keys))
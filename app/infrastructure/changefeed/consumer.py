@@ -0,0 +1,109 @@
+import asyncio
+import fcntl
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from redis.asyncio import Redis
+
+from domain.interfaces.repositories.url import BaseURLRepository
+from infrastructure.changefeed.events import (
+    URL_CREATED,
+    URLChangeEvent,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Stream id before the first entry: a fresh node reads everything the stream
+# still holds, then keeps tailing it.
+STREAM_START = "0-0"
+
+# Interval at which a standby process retries to become the consumer
+LOCK_RETRY_INTERVAL = 5.0
+
+
+def try_lock(path: Path) -> int | None:
+    """Descriptor holding an exclusive lock on ``path``, ``None`` if another
+    process holds it. The lock is released when the process exits."""
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(descriptor)
+        return None
+
+    return descriptor
+
+
+@dataclass
+class ChangeFeedConsumer:
+    """Tails the change stream and applies events to a local store.
+
+    The repository stores each batch together with the offset it was read
+    up to, so the offset never runs ahead of the data; a restart replays
+    at most one batch and appliers must tolerate duplicates.
+
+    A store shared by the worker processes (SQLite) is written by one
+    consumer only: the process holding the lock on ``lock_path`` consumes,
+    the others stand by until it exits. Without ``lock_path`` every
+    process consumes into its own store.
+
+    """
+
+    redis: Redis
+    stream: str
+    repository: BaseURLRepository
+    lock_path: Path | None = None
+    batch_size: int = 500
+    block_ms: int = 5000
+
+    async def consume_batch(self, offset: str) -> str:
+        response = await self.redis.xread(
+            {self.stream: offset},
+            count=self.batch_size,
+            block=self.block_ms,
+        )
+        if not response:
+            return offset
+
+        _, entries = response[0]
+        return await self.apply_entries(entries, offset)
+
+    async def apply_entries(
+        self,
+        entries: list[tuple[str, dict[str, str]]],
+        offset: str,
+    ) -> str:
+        if not entries:
+            return offset
+
+        created = []
+        for _, fields in entries:
+            event = URLChangeEvent.from_stream_fields(fields)
+            if event.event == URL_CREATED:
+                created.append(event.to_entity())
+
+        offset = entries[-1][0]
+        await self.repository.apply_changes(created, offset)
+        return offset
+
+    async def run(self, retry_interval: float = 1.0) -> None:
+        lock = None
+        if self.lock_path is not None:
+            while (lock := try_lock(self.lock_path)) is None:
+                await asyncio.sleep(LOCK_RETRY_INTERVAL)
+
+        try:
+            offset = await self.repository.get_change_offset() or STREAM_START
+
+            while True:
+                try:
+                    offset = await self.consume_batch(offset)
+                except Exception:
+                    logger.exception("Change feed consumer failed at %s", offset)
+                    await asyncio.sleep(retry_interval)
+        finally:
+            if lock is not None:
+                os.close(lock)
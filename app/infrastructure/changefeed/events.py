@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from domain.entities.url import URLEntity
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.models.outbox import URLOutboxModel
+
+
+URL_CREATED = "url_created"
+
+
+@dataclass(frozen=True)
+class URLChangeEvent:
+    event: str
+    url_id: UUID
+    short_url: str
+    long_url: str
+    url_created_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: URLEntity, event: str) -> "URLChangeEvent":
+        return cls(
+            event=event,
+            url_id=entity.id,
+            short_url=entity.short_url,
+            long_url=entity.long_url.as_generic_type(),
+            url_created_at=entity.created_at,
+        )
+
+    @classmethod
+    def from_outbox(cls, model: URLOutboxModel) -> "URLChangeEvent":
+        return cls(
+            event=model.event,
+            url_id=model.url_id,
+            short_url=model.short_url,
+            long_url=model.long_url,
+            url_created_at=model.url_created_at,
+        )
+
+    @classmethod
+    def from_stream_fields(cls, fields: dict[str, str]) -> "URLChangeEvent":
+        return cls(
+            event=fields["event"],
+            url_id=UUID(fields["url_id"]),
+            short_url=fields["short_url"],
+            long_url=fields["long_url"],
+            url_created_at=datetime.fromisoformat(fields["url_created_at"]),
+        )
+
+    def to_outbox(self) -> URLOutboxModel:
+        return URLOutboxModel(
+            event=self.event,
+            url_id=self.url_id,
+            short_url=self.short_url,
+            long_url=self.long_url,
+            url_created_at=self.url_created_at,
+        )
+
+    def to_stream_fields(self) -> dict[str, str]:
+        return {
+            "event": self.event,
+            "url_id": str(self.url_id),
+            "short_url": self.short_url,
+            "long_url": self.long_url,
+            "url_created_at": self.url_created_at.isoformat(),
+        }
+
+    def to_entity(self) -> URLEntity:
+        return URLEntity(
+            id=self.url_id,
+            short_url=self.short_url,
+            long_url=LongURLValueObject.from_trusted(self.long_url),
+            created_at=self.url_created_at,
+            updated_at=self.url_created_at,
+        )
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from sqlalchemy import (
+    delete,
+    select,
+)
+
+from infrastructure.changefeed.events import URLChangeEvent
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.outbox import URLOutboxModel
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxRelay:
+    """Moves events from ``url_outbox`` to a Redis stream.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and deleted in the
+    transaction that publishes them, so every worker can run a relay. If
+    the commit fails after ``XADD`` the batch is published again: delivery
+    is at least once and consumers must be idempotent.
+
+    """
+
+    database: Database
+    redis: Redis
+    stream: str
+    batch_size: int = 500
+    # Approximate stream length kept for consumers that fall behind
+    max_length: int = 1_000_000
+
+    async def relay_batch(self) -> int:
+        async with self.database.get_session() as session:
+            claimed = (
+                select(URLOutboxModel.id)
+                .order_by(URLOutboxModel.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            stmt = (
+                delete(URLOutboxModel)
+                .where(URLOutboxModel.id.in_(claimed.scalar_subquery()))
+                .returning(URLOutboxModel)
+            )
+            models = sorted(
+                (await session.scalars(stmt)).all(),
+                key=lambda model: model.id,
+            )
+
+            if not models:
+                return 0
+
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                for model in models:
+                    pipeline.xadd(
+                        self.stream,
+                        URLChangeEvent.from_outbox(model).to_stream_fields(),
+                        maxlen=self.max_length,
+                        approximate=True,
+                    )
+                await pipeline.execute()
+
+        return len(models)
+
+    async def run(self, poll_interval: float) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                logger.exception("Outbox relay failed")
+                relayed = 0
+
+            # A full batch means there is more backlog, keep draining
+            if relayed < self.batch_size:
+                await asyncio.sleep(poll_interval)
@@ -17,7 +17,7 @@ def convert_url_model_to_entity(model: URLModel) -> URLEntity:
     return URLEntity(
         id=model.id,
         short_url=model.short_url,
-        long_url=LongURLValueObject(value=model.long_url),
+        long_url=LongURLValueObject.from_trusted(model.long_url),
         created_at=model.created_at,
         updated_at=model.updated_at,
     )
@@ -1,22 +1,47 @@
-from contextlib import asynccontextmanager
+from contextlib import (
+    asynccontextmanager,
+    AsyncExitStack,
+)
 from typing import (
     Any,
     AsyncGenerator,
 )
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import (
+    InterfaceError,
+    OperationalError,
+    SQLAlchemyError,
+)
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
 )
 
+from infrastructure.resilience.circuit_breaker import CircuitBreaker
+
+
+# Errors that mean the server is unreachable, not that the query is wrong
+UNAVAILABLE_ERRORS = (InterfaceError, OperationalError, OSError, TimeoutError)
+
 
 class Database:
-    def __init__(self, url: str, ro_url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        ro_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        read_only_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self._max_overflow = max_overflow
+        self._read_only_breaker = read_only_breaker
         self._async_engine = create_async_engine(
             url=url,
             pool_pre_ping=False,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             # echo=False,
             isolation_level="READ COMMITTED",
         )
@@ -28,6 +53,8 @@ class Database:
         self._read_only_async_engine = create_async_engine(
             url=ro_url,
             pool_pre_ping=False,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             # echo=False,
             isolation_level="AUTOCOMMIT",
         )
@@ -36,6 +63,36 @@ class Database:
             expire_on_commit=False,
         )
 
+    @property
+    def engines(self) -> tuple[AsyncEngine, AsyncEngine]:
+        return self._async_engine, self._read_only_async_engine
+
+    def pool_status(self, engine: AsyncEngine) -> dict[str, float]:
+        pool = engine.pool
+        capacity = pool.size() + self._max_overflow
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            # overflow() counts down from -pool_size until the pool is full
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(pool.checkedout() / capacity, 3) if capacity else 0.0,
+        }
+
+    async def warm_up(self) -> None:
+        """Fill both pools up to ``pool_size`` so the first requests do not
+        pay for connection setup."""
+        for engine in self.engines:
+            # All connections are held at once, otherwise the pool would hand
+            # the same one out again.
+            async with AsyncExitStack() as stack:
+                for _ in range(engine.pool.size()):
+                    connection = await stack.enter_async_context(engine.connect())
+                    await connection.exec_driver_sql("SELECT 1")
+
+    async def dispose(self) -> None:
+        await self._async_engine.dispose()
+        await self._read_only_async_engine.dispose()
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, Any]:
         session: AsyncSession = self._async_session()
@@ -50,10 +107,28 @@ class Database:
 
     @asynccontextmanager
     async def get_read_only_session(self) -> AsyncGenerator[AsyncSession, Any]:
-        session: AsyncSession = self._read_only_async_session()
+        """Session on the read-only engine, or on the primary while the
+        read-only breaker is open.
+
+        A query that fails because the replica is unreachable is not
+        retried, the breaker only routes the following sessions.
+
+        """
+        breaker = self._read_only_breaker
+        use_replica = breaker is None or breaker.allow()
+        if use_replica:
+            session: AsyncSession = self._read_only_async_session()
+        else:
+            session = self._async_session()
+
         try:
             yield session
-        except SQLAlchemyError:
+        except UNAVAILABLE_ERRORS:
+            if use_replica and breaker is not None:
+                breaker.record_failure()
             raise
+        else:
+            if use_replica and breaker is not None:
+                breaker.record_success()
         finally:
             await session.close()
@@ -13,6 +13,14 @@ from settings import config as app_config
 from infrastructure.database.models.base import BaseModel
 
 
+from infrastructure.database.models.api_key import APIKeyModel  # noqa: F401
+from infrastructure.database.models.clicks import (  # noqa: F401
+    URLClickDayModel,
+    URLClickHourModel,
+    URLClickMinuteModel,
+    URLClickTotalModel,
+)
+from infrastructure.database.models.outbox import URLOutboxModel  # noqa: F401
 from infrastructure.database.models.url import URLModel  # noqa: F401
 
 
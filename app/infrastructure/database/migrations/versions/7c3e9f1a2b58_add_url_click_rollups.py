@@ -0,0 +1,64 @@
+"""add url click rollups
+
+Revision ID: 7c3e9f1a2b58
+Revises: 5d8e0a2b6c41
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e9f1a2b58"
+down_revision: Union[str, Sequence[str], None] = "5d8e0a2b6c41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ("url_click_minute", "url_click_hour", "url_click_day")
+# Compacted into the next rollup, selected by bucket alone
+COMPACTED_TABLES = ("url_click_minute", "url_click_hour")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ROLLUP_TABLES:
+        op.create_table(
+            table_name,
+            sa.Column("short_url", sa.String(length=255), nullable=False),
+            sa.Column("bucket", sa.DateTime(), nullable=False),
+            sa.Column("clicks", sa.BigInteger(), nullable=False),
+            sa.PrimaryKeyConstraint("short_url", "bucket"),
+        )
+    for table_name in COMPACTED_TABLES:
+        op.create_index(
+            f"ix_{table_name}_bucket",
+            table_name,
+            ["bucket"],
+            unique=False,
+        )
+    op.create_table(
+        "url_click_total",
+        sa.Column("short_url", sa.String(length=255), nullable=False),
+        sa.Column("clicks", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("short_url"),
+    )
+    op.create_index(
+        "ix_url_click_total_clicks",
+        "url_click_total",
+        ["clicks"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_url_click_total_clicks", table_name="url_click_total")
+    op.drop_table("url_click_total")
+    for table_name in COMPACTED_TABLES:
+        op.drop_index(f"ix_{table_name}_bucket", table_name=table_name)
+    for table_name in reversed(ROLLUP_TABLES):
+        op.drop_table(table_name)
@@ -0,0 +1,41 @@
+"""add url_outbox
+
+Revision ID: 9b2f4c1d7e3a
+Revises: 3184274a08cf
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2f4c1d7e3a"
+down_revision: Union[str, Sequence[str], None] = "3184274a08cf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "url_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("event", sa.String(length=32), nullable=False),
+        sa.Column("url_id", sa.UUID(), nullable=False),
+        sa.Column("short_url", sa.String(length=255), nullable=False),
+        sa.Column("long_url", sa.String(length=2048), nullable=False),
+        sa.Column("url_created_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("url_outbox")
@@ -0,0 +1,27 @@
+import datetime
+
+from sqlalchemy import (
+    Integer,
+    sql,
+    String,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from infrastructure.database.models.base import BaseModel
+
+
+class APIKeyModel(BaseModel):
+    __tablename__ = "api_key"
+
+    prefix: Mapped[str] = mapped_column(String(32), primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    secret_hash: Mapped[str] = mapped_column(String(72), nullable=False)
+    quota: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    revoked_at: Mapped[datetime.datetime | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        nullable=False,
+        server_default=sql.func.now(),
+    )
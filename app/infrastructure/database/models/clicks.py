@@ -0,0 +1,47 @@
+import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Index,
+    String,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from infrastructure.database.models.base import BaseModel
+
+
+class URLClickRollup:
+    """Clicks of one short URL in one bucket (naive UTC bucket start)."""
+
+    short_url: Mapped[str] = mapped_column(String(255), primary_key=True)
+    bucket: Mapped[datetime.datetime] = mapped_column(primary_key=True)
+    clicks: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# Compaction selects by bucket alone
+class URLClickMinuteModel(URLClickRollup, BaseModel):
+    __tablename__ = "url_click_minute"
+    __table_args__ = (Index("ix_url_click_minute_bucket", "bucket"),)
+
+
+class URLClickHourModel(URLClickRollup, BaseModel):
+    __tablename__ = "url_click_hour"
+    __table_args__ = (Index("ix_url_click_hour_bucket", "bucket"),)
+
+
+class URLClickDayModel(URLClickRollup, BaseModel):
+    __tablename__ = "url_click_day"
+
+
+class URLClickTotalModel(BaseModel):
+    """All-time clicks per short URL, incremented with every flush so the
+    ranking never has to be recomputed."""
+
+    __tablename__ = "url_click_total"
+    __table_args__ = (Index("ix_url_click_total_clicks", "clicks"),)
+
+    short_url: Mapped[str] = mapped_column(String(255), primary_key=True)
+    clicks: Mapped[int] = mapped_column(BigInteger, nullable=False)
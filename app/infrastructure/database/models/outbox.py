@@ -0,0 +1,39 @@
+import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    Identity,
+    sql,
+    String,
+)
+from sqlalchemy.dialects.postgresql import UUID as UUIDType
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from infrastructure.database.models.base import BaseModel
+
+
+class URLOutboxModel(BaseModel):
+    """Change events written in the same transaction as the change itself.
+
+    The relay deletes rows once they are published, so the table only
+    holds the backlog that has not reached the stream yet.
+
+    """
+
+    __tablename__ = "url_outbox"
+
+    # Monotonic, so the relay publishes events in commit order per batch
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event: Mapped[str] = mapped_column(String(32), nullable=False)
+    url_id: Mapped[UUID] = mapped_column(UUIDType[UUID](as_uuid=True), nullable=False)
+    short_url: Mapped[str] = mapped_column(String(255), nullable=False)
+    long_url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    url_created_at: Mapped[datetime.datetime] = mapped_column(nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        nullable=False,
+        server_default=sql.func.now(),
+    )
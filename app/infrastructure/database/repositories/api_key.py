@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    select,
+    sql,
+    update,
+)
+
+from infrastructure.auth.keys import (
+    APIKey,
+    BaseAPIKeyRepository,
+)
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.api_key import APIKeyModel
+
+
+@dataclass
+class SQLAlchemyAPIKeyRepository(BaseAPIKeyRepository):
+    database: Database
+
+    async def get_by_prefix(self, prefix: str) -> APIKey | None:
+        # Lookups are cached by the authenticator, so they go to the primary:
+        # a lagging replica could bring a just revoked key back into the cache
+        async with self.database.get_session() as session:
+            model = await session.scalar(
+                select(APIKeyModel).where(APIKeyModel.prefix == prefix),
+            )
+
+        if model is None:
+            return None
+
+        return APIKey(
+            prefix=model.prefix,
+            name=model.name,
+            secret_hash=model.secret_hash,
+            quota=model.quota,
+            revoked=model.revoked_at is not None,
+        )
+
+    async def add(self, api_key: APIKey) -> None:
+        async with self.database.get_session() as session:
+            session.add(
+                APIKeyModel(
+                    prefix=api_key.prefix,
+                    name=api_key.name,
+                    secret_hash=api_key.secret_hash,
+                    quota=api_key.quota,
+                ),
+            )
+            await session.commit()
+
+    async def revoke(self, prefix: str) -> bool:
+        async with self.database.get_session() as session:
+            result = await session.execute(
+                update(APIKeyModel)
+                .where(
+                    APIKeyModel.prefix == prefix,
+                    APIKeyModel.revoked_at.is_(None),
+                )
+                .values(revoked_at=sql.func.now()),
+            )
+            await session.commit()
+
+        return result.rowcount > 0
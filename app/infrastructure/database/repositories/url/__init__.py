@@ -1,4 +1,14 @@
 from .composed import SQLAlchemyRedisURLRepository
+from .lookup_file import LookupFileURLRepository
+from .memory import InMemoryURLRepository
+from .sqlite import SQLiteURLRepository
+from .write_behind import WriteBehindURLRepository
 
 
-__all__ = ("SQLAlchemyRedisURLRepository",)
+__all__ = (
+    "InMemoryURLRepository",
+    "LookupFileURLRepository",
+    "SQLAlchemyRedisURLRepository",
+    "SQLiteURLRepository",
+    "WriteBehindURLRepository",
+)
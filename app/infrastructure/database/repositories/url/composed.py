@@ -1,22 +1,115 @@
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
 
+from prometheus_client import Histogram
 from redis.asyncio import Redis
-from sqlalchemy import select
+from sqlalchemy import (
+    exists,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
 
-from domain.entities.url import URLEntity
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import (
+    ShortURLAlreadyExistsException,
+    URLStorageUnavailableException,
+)
 from domain.interfaces.repositories.url import BaseURLRepository
+from infrastructure.changefeed.events import (
+    URL_CREATED,
+    URLChangeEvent,
+)
 from infrastructure.database.converters.url import (
     convert_url_entity_to_model,
     convert_url_model_to_entity,
 )
 from infrastructure.database.gateways.postgres import Database
 from infrastructure.database.models.url import URLModel
+from infrastructure.metrics.prometheus import (
+    CACHE_OPERATION_DURATION,
+    CACHE_REQUESTS,
+    DB_QUERY_DURATION,
+    observe_duration,
+    SHORT_URLS_CREATED,
+)
+from infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Labelled children are bound once, resolving labels costs a lock and a dict
+# lookup on every call.
+REDIS_HITS = CACHE_REQUESTS.labels(tier="redis", result="hit")
+REDIS_MISSES = CACHE_REQUESTS.labels(tier="redis", result="miss")
+# Redis was down or its breaker open, the lookup went to Postgres
+REDIS_BYPASSES = CACHE_REQUESTS.labels(tier="redis", result="bypass")
+REDIS_GET_DURATION = CACHE_OPERATION_DURATION.labels(tier="redis", operation="get")
+REDIS_SET_DURATION = CACHE_OPERATION_DURATION.labels(tier="redis", operation="set")
+REDIS_EXISTS_DURATION = CACHE_OPERATION_DURATION.labels(
+    tier="redis",
+    operation="exists",
+)
+
+
+def db_query_duration(method: str):
+    return DB_QUERY_DURATION.labels(repository="sqlalchemy_redis", method=method)
+
+
+ADD_DURATION = db_query_duration("add")
+GET_BY_SHORT_URL_DURATION = db_query_duration("get_by_short_url")
+GET_BY_LONG_URL_DURATION = db_query_duration("get_by_long_url")
+EXISTS_DURATION = db_query_duration("exists")
+PRELOAD_CACHE_DURATION = db_query_duration("preload_cache")
+
+# Sentinel for a cache call that did not reach Redis
+CACHE_UNAVAILABLE = object()
+
+# Longest wait for a database slot while the cache is bypassed
+FALLBACK_WAIT_TIMEOUT = 0.5
 
 
 @dataclass
 class SQLAlchemyRedisURLRepository(BaseURLRepository):
+    """Postgres with a Redis read-through cache.
+
+    Cache calls go through ``cache_breaker``: while Redis is failing they
+    fail fast, lookups are answered by Postgres and cache writes are
+    skipped. At most ``fallback_concurrency`` of those lookups run at
+    once per worker, callers that can not get a slot quickly are turned
+    away with a 503 instead of queueing on the connection pool.
+
+    """
+
     database: Database
     cache: Redis
+    cache_breaker: CircuitBreaker = field(
+        default_factory=lambda: CircuitBreaker(name="redis_cache"),
+    )
+    fallback_concurrency: int = 20
+    # Write change feed events to url_outbox, only read by the relay
+    outbox_enabled: bool = False
+
+    _fallback_slots: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self):
+        self._fallback_slots = asyncio.Semaphore(self.fallback_concurrency)
 
     async def add(self, url_pair: URLEntity) -> None:
         short_url = url_pair.short_url
@@ -24,35 +117,171 @@ class SQLAlchemyRedisURLRepository(BaseURLRepository):
 
         model = convert_url_entity_to_model(url_pair)
 
-        async with self.database.get_session() as session:
-            session.add(model)
-            await session.commit()
+        try:
+            with observe_duration(ADD_DURATION):
+                async with self.database.get_session() as session:
+                    session.add(model)
+                    if self.outbox_enabled:
+                        # Committed atomically with the pair, the relay
+                        # publishes it later
+                        session.add(
+                            URLChangeEvent.from_entity(
+                                url_pair,
+                                URL_CREATED,
+                            ).to_outbox(),
+                        )
+                    await session.commit()
+        except IntegrityError as exc:
+            raise ShortURLAlreadyExistsException(short_url=short_url) from exc
+
+        SHORT_URLS_CREATED.inc()
 
-        await self.cache.set(short_url, long_url)
+        # The pair is stored, a failed cache write only costs a miss later
+        await self._call_cache(REDIS_SET_DURATION, self.cache.set, short_url, long_url)
 
     async def get_by_short_url(self, short_url: str) -> str | None:
-        cached_long_url = await self.cache.get(short_url)
+        cached_long_url = await self._call_cache(
+            REDIS_GET_DURATION,
+            self.cache.get,
+            short_url,
+        )
+
+        if cached_long_url is CACHE_UNAVAILABLE:
+            REDIS_BYPASSES.inc()
+            return await self._fall_back(self._select_long_url, short_url)
+
         if cached_long_url:
+            REDIS_HITS.inc()
             return cached_long_url
 
-        async with self.database.get_read_only_session() as session:
-            stmt = select(URLModel).where(URLModel.short_url == short_url)
-            result = await session.execute(stmt)
-            model = result.scalar_one_or_none()
+        REDIS_MISSES.inc()
 
-        if model:
-            long_url = model.long_url
-            await self.cache.set(short_url, long_url)
-            return long_url
+        long_url = await self._select_long_url(short_url)
+        if long_url:
+            await self._call_cache(
+                REDIS_SET_DURATION,
+                self.cache.set,
+                short_url,
+                long_url,
+            )
 
-        return None
+        return long_url
 
     async def get_by_long_url(self, long_url: str) -> URLEntity | None:
-        async with self.database.get_read_only_session() as session:
-            stmt = select(URLModel).where(URLModel.long_url == long_url)
-            result = await session.execute(stmt)
-            model = result.scalar_one_or_none()
+        with observe_duration(GET_BY_LONG_URL_DURATION):
+            async with self.database.get_read_only_session() as session:
+                # Custom aliases may point several codes at one long URL, the
+                # first one created is the deduplication answer, as in the
+                # other backends.
+                stmt = (
+                    select(URLModel)
+                    .where(URLModel.long_url == long_url)
+                    .order_by(URLModel.created_at)
+                    .limit(1)
+                )
+                result = await session.execute(stmt)
+                model = result.scalar_one_or_none()
 
         if model:
             return convert_url_model_to_entity(model)
         return None
+
+    async def get_pair_by_long_url(self, long_url: str) -> URLPair | None:
+        with observe_duration(GET_BY_LONG_URL_DURATION):
+            async with self.database.get_read_only_session() as session:
+                stmt = (
+                    select(URLModel.short_url)
+                    .where(URLModel.long_url == long_url)
+                    .order_by(URLModel.created_at)
+                    .limit(1)
+                )
+                short_url = await session.scalar(stmt)
+
+        if short_url:
+            return URLPair(short_url=short_url, long_url=long_url)
+        return None
+
+    async def exists(self, short_url: str) -> bool:
+        cached = await self._call_cache(
+            REDIS_EXISTS_DURATION,
+            self.cache.exists,
+            short_url,
+        )
+
+        if cached is CACHE_UNAVAILABLE:
+            REDIS_BYPASSES.inc()
+            return await self._fall_back(self._select_exists, short_url)
+
+        if cached:
+            return True
+
+        return await self._select_exists(short_url)
+
+    async def preload_cache(self, limit: int) -> None:
+        # There are no click statistics to rank by, the newest links are the
+        # ones most likely to be resolved right after a deploy.
+        with observe_duration(PRELOAD_CACHE_DURATION):
+            async with self.database.get_read_only_session() as session:
+                stmt = (
+                    select(URLModel.short_url, URLModel.long_url)
+                    .order_by(URLModel.created_at.desc())
+                    .limit(limit)
+                )
+                rows = (await session.execute(stmt)).all()
+
+        if not rows:
+            return
+
+        await self.cache_breaker.call(partial(self.cache.mset, dict(rows)))
+
+    async def _select_long_url(self, short_url: str) -> str | None:
+        with observe_duration(GET_BY_SHORT_URL_DURATION):
+            async with self.database.get_read_only_session() as session:
+                stmt = select(URLModel.long_url).where(URLModel.short_url == short_url)
+                return await session.scalar(stmt)
+
+    async def _select_exists(self, short_url: str) -> bool:
+        with observe_duration(EXISTS_DURATION):
+            async with self.database.get_read_only_session() as session:
+                stmt = select(exists().where(URLModel.short_url == short_url))
+                return bool(await session.scalar(stmt))
+
+    async def _call_cache(
+        self,
+        histogram: Histogram,
+        method: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> Any:
+        """The result of a Redis call, ``CACHE_UNAVAILABLE`` if it failed or
+        the breaker is open."""
+
+        async def timed_call() -> Any:
+            with observe_duration(histogram):
+                return await method(*args)
+
+        try:
+            return await self.cache_breaker.call(timed_call)
+        except CircuitOpenError:
+            return CACHE_UNAVAILABLE
+        except Exception:
+            logger.warning("Redis call failed, bypassing the cache", exc_info=True)
+            return CACHE_UNAVAILABLE
+
+    async def _fall_back(
+        self,
+        query: Callable[[str], Awaitable[Any]],
+        short_url: str,
+    ) -> Any:
+        slots = self._fallback_slots
+        if slots.locked():
+            try:
+                await asyncio.wait_for(slots.acquire(), timeout=FALLBACK_WAIT_TIMEOUT)
+            except TimeoutError as exc:
+                raise URLStorageUnavailableException() from exc
+        else:
+            await slots.acquire()
+
+        try:
+            return await query(short_url)
+        finally:
+            slots.release()
@@ -0,0 +1,60 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+
+from domain.entities.url import URLEntity
+from domain.exceptions.url import ReadOnlyURLStorageException
+from domain.interfaces.repositories.url import BaseURLRepository
+from infrastructure.lookup.format import LookupFile
+from infrastructure.metrics.prometheus import (
+    DB_QUERY_DURATION,
+    observe_duration,
+)
+
+
+GET_BY_SHORT_URL_DURATION = DB_QUERY_DURATION.labels(
+    repository="lookup_file",
+    method="get_by_short_url",
+)
+
+
+@dataclass
+class LookupFileURLRepository(BaseURLRepository):
+    """Serves resolves from an exported lookup file.
+
+    Nothing is loaded on startup: the file is memory-mapped and every
+    lookup is a binary search over it, so a node needs neither Postgres
+    nor Redis and pages in only the parts of the file it touches. The
+    data is a snapshot, creation is rejected.
+
+    """
+
+    path: Path
+
+    _file: LookupFile = field(init=False)
+
+    def __post_init__(self):
+        self._file = LookupFile(path=self.path)
+
+    def __len__(self) -> int:
+        return len(self._file)
+
+    async def add(self, url_pair: URLEntity) -> None:
+        raise ReadOnlyURLStorageException()
+
+    async def get_by_short_url(self, short_url: str) -> str | None:
+        with observe_duration(GET_BY_SHORT_URL_DURATION):
+            return self._file.get(short_url)
+
+    async def get_by_long_url(self, long_url: str) -> URLEntity | None:
+        # The file has no index by long URL. Only creation looks pairs up by
+        # long URL, and creation is rejected anyway.
+        return None
+
+    async def exists(self, short_url: str) -> bool:
+        return self._file.get(short_url) is not None
+
+    async def close(self) -> None:
+        self._file.close()
@@ -1,34 +1,165 @@
+import asyncio
+import os
+import sys
+import threading
 from dataclasses import (
     dataclass,
     field,
 )
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+from uuid import UUID
 
-from domain.entities.url import URLEntity
+import orjson
+
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import ShortURLAlreadyExistsException
 from domain.interfaces.repositories.url import BaseURLRepository
+from domain.value_objects.url import LongURLValueObject
+
+
+@dataclass(frozen=True, slots=True)
+class URLRecord:
+    """Stored form of a pair: four slots instead of a full entity with a
+    value object and a per-instance ``__dict__``."""
+
+    id: UUID
+    short_url: str
+    long_url: str
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: URLEntity) -> "URLRecord":
+        return cls(
+            id=entity.id,
+            short_url=sys.intern(entity.short_url),
+            long_url=entity.long_url.as_generic_type(),
+            created_at=entity.created_at,
+        )
+
+    def to_entity(self) -> URLEntity:
+        return URLEntity(
+            id=self.id,
+            short_url=self.short_url,
+            long_url=LongURLValueObject.from_trusted(self.long_url),
+            created_at=self.created_at,
+            updated_at=self.created_at,
+        )
 
 
 @dataclass
-class DummyInMemoryURLRepository(BaseURLRepository):
-    _url_pairs: list[URLEntity] = field(default_factory=list, kw_only=True)
+class InMemoryURLRepository(BaseURLRepository):
+    """Dict-indexed repository for tests, benchmarks and single-node
+    deployments.
+
+    Lookups are O(1) by short code and by long URL. Reads are plain dict
+    accesses; writes take a lock so the repository can also be shared with
+    worker threads (e.g. a snapshot running in ``asyncio.to_thread``).
+
+    """
+
+    snapshot_path: Path | None = None
+
+    _by_short_url: dict[str, URLRecord] = field(default_factory=dict, init=False)
+    # Points at the first pair created for a long URL, which is the one
+    # returned on deduplication. Keys share the string stored in the record.
+    _by_long_url: dict[str, URLRecord] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    # Not part of the snapshot: a snapshot is only written on shutdown, so a
+    # restarted replica reads the change stream from the beginning
+    _change_offset: str | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            self.load_snapshot(self.snapshot_path)
 
     async def add(self, url_pair: URLEntity) -> None:
-        self._url_pairs.append(url_pair)
+        record = URLRecord.from_entity(url_pair)
+
+        with self._lock:
+            self._insert(record)
+
+    async def apply_changes(
+        self,
+        url_pairs: Iterable[URLEntity],
+        offset: str,
+    ) -> None:
+        """Insert replicated pairs, skipping the ones already stored."""
+        records = [URLRecord.from_entity(url_pair) for url_pair in url_pairs]
+
+        with self._lock:
+            for record in records:
+                if record.short_url not in self._by_short_url:
+                    self._insert(record)
+            self._change_offset = offset
+
+    async def get_change_offset(self) -> str | None:
+        return self._change_offset
 
     async def get_by_short_url(self, short_url: str) -> str | None:
-        try:
-            entity = next(
-                entity for entity in self._url_pairs if entity.short_url == short_url
-            )
-            return entity.long_url.as_generic_type()
-        except StopIteration:
-            return None
+        record = self._by_short_url.get(short_url)
+        return record.long_url if record is not None else None
 
     async def get_by_long_url(self, long_url: str) -> URLEntity | None:
-        try:
-            return next(
-                url_pair
-                for url_pair in self._url_pairs
-                if url_pair.long_url.value == long_url
-            )
-        except StopIteration:
+        record = self._by_long_url.get(long_url)
+        return record.to_entity() if record is not None else None
+
+    async def get_pair_by_long_url(self, long_url: str) -> URLPair | None:
+        record = self._by_long_url.get(long_url)
+        if record is None:
             return None
+
+        return URLPair(short_url=record.short_url, long_url=record.long_url)
+
+    async def exists(self, short_url: str) -> bool:
+        return short_url in self._by_short_url
+
+    async def close(self) -> None:
+        if self.snapshot_path is not None:
+            await asyncio.to_thread(self.save_snapshot, self.snapshot_path)
+
+    def __len__(self) -> int:
+        return len(self._by_short_url)
+
+    def save_snapshot(self, path: Path) -> None:
+        """Write all pairs as JSON lines, atomically replacing ``path``."""
+        with self._lock:
+            records = list(self._by_short_url.values())
+
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        with temporary_path.open("wb") as snapshot:
+            for record in records:
+                snapshot.write(
+                    orjson.dumps(
+                        record,
+                        option=orjson.OPT_APPEND_NEWLINE,
+                    ),
+                )
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+
+        os.replace(temporary_path, path)
+
+    def load_snapshot(self, path: Path) -> None:
+        with path.open("rb") as snapshot, self._lock:
+            for line in snapshot:
+                data = orjson.loads(line)
+                self._insert(
+                    URLRecord(
+                        id=UUID(data["id"]),
+                        short_url=sys.intern(data["short_url"]),
+                        long_url=data["long_url"],
+                        created_at=datetime.fromisoformat(data["created_at"]),
+                    ),
+                )
+
+    def _insert(self, record: URLRecord) -> None:
+        if record.short_url in self._by_short_url:
+            raise ShortURLAlreadyExistsException(short_url=record.short_url)
+
+        self._by_short_url[record.short_url] = record
+        self._by_long_url.setdefault(record.long_url, record)
@@ -0,0 +1,212 @@
+import sqlite3
+import threading
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+from uuid import UUID
+
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import (
+    ReadOnlyURLStorageException,
+    ShortURLAlreadyExistsException,
+)
+from domain.interfaces.repositories.url import BaseURLRepository
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.metrics.prometheus import (
+    DB_QUERY_DURATION,
+    observe_duration,
+    SHORT_URLS_CREATED,
+)
+
+
+def db_query_duration(method: str):
+    return DB_QUERY_DURATION.labels(repository="sqlite", method=method)
+
+
+ADD_DURATION = db_query_duration("add")
+APPLY_CHANGES_DURATION = db_query_duration("apply_changes")
+GET_BY_SHORT_URL_DURATION = db_query_duration("get_by_short_url")
+GET_BY_LONG_URL_DURATION = db_query_duration("get_by_long_url")
+EXISTS_DURATION = db_query_duration("exists")
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS urls (
+        short_url TEXT PRIMARY KEY,
+        long_url TEXT NOT NULL,
+        id TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS urls_long_url_idx ON urls (long_url, created_at)",
+    # Change stream offset of a replica, a single row
+    """
+    CREATE TABLE IF NOT EXISTS change_offset (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        stream_id TEXT NOT NULL
+    )
+    """,
+)
+
+INSERT_COLUMNS = "urls (short_url, long_url, id, created_at) VALUES (?, ?, ?, ?)"
+
+
+@dataclass
+class SQLiteURLRepository(BaseURLRepository):
+    """Embedded backend for single-node and edge deployments.
+
+    The database runs in WAL mode with the file memory-mapped, so a
+    resolve is a B-tree lookup in the page cache without network hops.
+    Statements are executed directly on the event loop: a primary-key
+    lookup takes microseconds, far less than handing it to a thread.
+
+    With ``read_only`` set the node is a replica: ``add`` is rejected and
+    pairs arrive only through ``apply_changes``.
+
+    """
+
+    path: Path
+    mmap_size: int = 256 * 1024 * 1024
+    read_only: bool = False
+
+    _connection: sqlite3.Connection = field(init=False)
+    _write_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self):
+        self._connection = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        # Durable across application crashes; an OS crash may lose the last
+        # transactions, which a replica re-reads from the change stream.
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        self._connection.execute("PRAGMA temp_store = MEMORY")
+
+        for statement in SCHEMA:
+            self._connection.execute(statement)
+
+    async def add(self, url_pair: URLEntity) -> None:
+        if self.read_only:
+            raise ReadOnlyURLStorageException()
+
+        try:
+            with observe_duration(ADD_DURATION), self._write_lock:
+                self._connection.execute(
+                    f"INSERT INTO {INSERT_COLUMNS}",
+                    self._to_row(url_pair),
+                )
+        except sqlite3.IntegrityError as exc:
+            raise ShortURLAlreadyExistsException(
+                short_url=url_pair.short_url,
+            ) from exc
+
+        SHORT_URLS_CREATED.inc()
+
+    async def apply_changes(
+        self,
+        url_pairs: Iterable[URLEntity],
+        offset: str,
+    ) -> None:
+        """Insert pairs replicated from the primary and the offset in one
+        transaction.
+
+        Pairs that are already stored are skipped, so a change stream can be
+        replayed from an older offset. The offset is never ahead of the
+        stored pairs, even after an OS crash: WAL transactions are lost
+        from the end only.
+
+        """
+        with (
+            observe_duration(APPLY_CHANGES_DURATION),
+            self._write_lock,
+            self._connection,
+        ):
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                f"INSERT OR IGNORE INTO {INSERT_COLUMNS}",
+                map(self._to_row, url_pairs),
+            )
+            self._connection.execute(
+                "INSERT INTO change_offset (id, stream_id) VALUES (1, ?) "
+                "ON CONFLICT (id) DO UPDATE SET stream_id = excluded.stream_id",
+                (offset,),
+            )
+
+    async def get_change_offset(self) -> str | None:
+        row = self._connection.execute(
+            "SELECT stream_id FROM change_offset WHERE id = 1",
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    async def get_by_short_url(self, short_url: str) -> str | None:
+        with observe_duration(GET_BY_SHORT_URL_DURATION):
+            row = self._connection.execute(
+                "SELECT long_url FROM urls WHERE short_url = ?",
+                (short_url,),
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    async def get_by_long_url(self, long_url: str) -> URLEntity | None:
+        with observe_duration(GET_BY_LONG_URL_DURATION):
+            row = self._connection.execute(
+                "SELECT short_url, long_url, id, created_at FROM urls "
+                "WHERE long_url = ? ORDER BY created_at LIMIT 1",
+                (long_url,),
+            ).fetchone()
+
+        return self._to_entity(row) if row is not None else None
+
+    async def get_pair_by_long_url(self, long_url: str) -> URLPair | None:
+        with observe_duration(GET_BY_LONG_URL_DURATION):
+            row = self._connection.execute(
+                "SELECT short_url FROM urls "
+                "WHERE long_url = ? ORDER BY created_at LIMIT 1",
+                (long_url,),
+            ).fetchone()
+
+        return URLPair(short_url=row[0], long_url=long_url) if row else None
+
+    async def exists(self, short_url: str) -> bool:
+        with observe_duration(EXISTS_DURATION):
+            row = self._connection.execute(
+                "SELECT 1 FROM urls WHERE short_url = ?",
+                (short_url,),
+            ).fetchone()
+
+        return row is not None
+
+    async def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def _to_row(url_pair: URLEntity) -> tuple[str, str, str, str]:
+        return (
+            url_pair.short_url,
+            url_pair.long_url.as_generic_type(),
+            str(url_pair.id),
+            url_pair.created_at.isoformat(),
+        )
+
+    @staticmethod
+    def _to_entity(row: tuple[str, str, str, str]) -> URLEntity:
+        short_url, long_url, id_, created_at = row
+        created_at = datetime.fromisoformat(created_at)
+
+        return URLEntity(
+            id=UUID(id_),
+            short_url=short_url,
+            long_url=LongURLValueObject.from_trusted(long_url),
+            created_at=created_at,
+            updated_at=created_at,
+        )
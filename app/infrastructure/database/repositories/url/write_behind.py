@@ -0,0 +1,145 @@
+import hashlib
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import partial
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    TimeoutError as RedisTimeoutError,
+)
+from sqlalchemy import (
+    exists,
+    select,
+)
+
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import (
+    ShortURLAlreadyExistsException,
+    URLStorageUnavailableException,
+)
+from infrastructure.database.models.url import URLModel
+from infrastructure.database.repositories.url.composed import (
+    CACHE_UNAVAILABLE,
+    EXISTS_DURATION,
+    REDIS_GET_DURATION,
+    REDIS_SET_DURATION,
+    SQLAlchemyRedisURLRepository,
+)
+from infrastructure.metrics.prometheus import (
+    observe_duration,
+    SHORT_URLS_CREATED,
+)
+from infrastructure.resilience.circuit_breaker import CircuitOpenError
+from infrastructure.writebehind.entries import convert_url_entity_to_fields
+
+
+# Reserves the short code, points the long URL at it unless it already has
+# a code and queues the pair in one atomic step. The keys are written without
+# a TTL, so resolves and deduplication are served from them until the flusher
+# has stored the pair in Postgres.
+RESERVE_AND_QUEUE = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX') then
+    return 0
+end
+redis.call('SET', KEYS[3], KEYS[1], 'NX')
+redis.call('XADD', KEYS[2], '*', unpack(ARGV, 2))
+return 1
+"""
+
+# Codes are limited to [A-Za-z0-9_-], so this prefix never clashes with one
+LONG_URL_KEY_PREFIX = "long_url:"
+
+
+def get_long_url_key(long_url: str) -> str:
+    digest = hashlib.blake2b(long_url.encode(), digest_size=16).hexdigest()
+    return f"{LONG_URL_KEY_PREFIX}{digest}"
+
+
+@dataclass
+class WriteBehindURLRepository(SQLAlchemyRedisURLRepository):
+    """Acknowledges a new pair after one Redis script and one primary key
+    lookup in Postgres.
+
+    The pair is queued on a stream that ``WriteBehindFlusher`` drains into
+    Postgres in batches. Redis has to run with AOF and an eviction policy
+    that never drops keys without a TTL (``noeviction`` or ``volatile-*``),
+    otherwise a queued pair could be lost before it is flushed.
+
+    ``SET NX`` alone is not authoritative: Postgres may hold a code whose
+    key is missing in Redis (a cache write skipped while the breaker was
+    open, a Redis restart), so the code is looked up in Postgres before it
+    is reserved. Deduplication reads a long URL -> code key written by the
+    same script instead of scanning Postgres; pairs stored before
+    write-behind was enabled have no such key and are not deduplicated.
+
+    """
+
+    stream: str = "url_writes"
+
+    _reserve_and_queue: AsyncScript = field(init=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._reserve_and_queue = self.cache.register_script(RESERVE_AND_QUEUE)
+
+    async def add(self, url_pair: URLEntity) -> None:
+        if await self._select_stored(url_pair.short_url):
+            raise ShortURLAlreadyExistsException(short_url=url_pair.short_url)
+
+        fields = convert_url_entity_to_fields(url_pair)
+        args = [fields["long_url"]]
+        for name, value in fields.items():
+            args.extend((name, value))
+
+        # Redis is the only store of a new pair here, there is nothing to
+        # fall back to while it is down
+        try:
+            with observe_duration(REDIS_SET_DURATION):
+                reserved = await self.cache_breaker.call(
+                    partial(
+                        self._reserve_and_queue,
+                        keys=[
+                            url_pair.short_url,
+                            self.stream,
+                            get_long_url_key(fields["long_url"]),
+                        ],
+                        args=args,
+                    ),
+                )
+        except (
+            CircuitOpenError,
+            RedisConnectionError,
+            RedisTimeoutError,
+            TimeoutError,
+        ) as exc:
+            raise URLStorageUnavailableException() from exc
+
+        if not reserved:
+            raise ShortURLAlreadyExistsException(short_url=url_pair.short_url)
+
+        SHORT_URLS_CREATED.inc()
+
+    async def get_pair_by_long_url(self, long_url: str) -> URLPair | None:
+        short_url = await self._call_cache(
+            REDIS_GET_DURATION,
+            self.cache.get,
+            get_long_url_key(long_url),
+        )
+        # Without Redis nothing can be created here anyway
+        if short_url is CACHE_UNAVAILABLE or short_url is None:
+            return None
+
+        return URLPair(short_url=short_url, long_url=long_url)
+
+    async def _select_stored(self, short_url: str) -> bool:
+        # On the primary, the code may have been stored a moment ago
+        with observe_duration(EXISTS_DURATION):
+            async with self.database.get_session() as session:
+                stmt = select(exists().where(URLModel.short_url == short_url))
+                return bool(await session.scalar(stmt))
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Awaitable,
+)
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.database.gateways.postgres import Database
+
+
+@dataclass
+class DependencyStatus:
+    healthy: bool
+    latency_ms: float
+    error: str | None = None
+    pool: dict[str, float] | None = None
+
+
+@dataclass
+class ReadinessReport:
+    ready: bool
+    dependencies: dict[str, DependencyStatus]
+    checked_at: float
+
+
+@dataclass
+class ReadinessChecker:
+    """Probes Postgres (both engines) and Redis with a tight timeout.
+
+    Dependencies left as ``None`` (the memory backend has none) are not
+    probed.
+
+    The report is cached for ``cache_ttl`` seconds and concurrent callers
+    share one in-flight probe, so a load balancer polling every pod can
+    not turn health checks into load.
+
+    """
+
+    database: Database | None
+    cache: Redis | None
+    timeout: float
+    cache_ttl: float
+    # Reported, but the pod stays ready without them (served degraded
+    # behind the circuit breakers)
+    optional: frozenset[str] = frozenset()
+
+    _report: ReadinessReport | None = field(default=None, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    async def check(self) -> ReadinessReport:
+        if self._is_fresh():
+            return self._report
+
+        async with self._lock:
+            if not self._is_fresh():
+                self._report = await self._probe_all()
+
+        return self._report
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._report is not None
+            and time.monotonic() - self._report.checked_at < self.cache_ttl
+        )
+
+    async def _probe_all(self) -> ReadinessReport:
+        probes: dict[str, Awaitable[Any]] = {}
+
+        if self.database is not None:
+            engine, read_only_engine = self.database.engines
+            probes["postgres"] = self._probe_postgres(engine)
+            probes["postgres_read_only"] = self._probe_postgres(read_only_engine)
+
+        if self.cache is not None:
+            probes["redis"] = self._probe_redis()
+
+        statuses = await asyncio.gather(*map(self._measure, probes.values()))
+        dependencies = dict(zip(probes, statuses))
+
+        if self.database is not None:
+            dependencies["postgres"].pool = self.database.pool_status(engine)
+            dependencies["postgres_read_only"].pool = self.database.pool_status(
+                read_only_engine,
+            )
+
+        return ReadinessReport(
+            ready=all(
+                status.healthy
+                for name, status in dependencies.items()
+                if name not in self.optional
+            ),
+            dependencies=dependencies,
+            checked_at=time.monotonic(),
+        )
+
+    async def _measure(self, probe: Awaitable[Any]) -> DependencyStatus:
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe, timeout=self.timeout)
+        except TimeoutError:
+            error = f"timed out after {self.timeout}s"
+        except Exception as exc:
+            error = str(exc) or exc.__class__.__name__
+        else:
+            error = None
+
+        return DependencyStatus(
+            healthy=error is None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000, 3),
+            error=error,
+        )
+
+    async def _probe_postgres(self, engine: AsyncEngine) -> None:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+
+    async def _probe_redis(self) -> None:
+        await self.cache.ping()
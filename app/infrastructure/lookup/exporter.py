@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import select
+
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.url import URLModel
+from infrastructure.lookup.format import LookupFileWriter
+
+
+@dataclass
+class LookupFileExporter:
+    """Streams the ``url`` table into a lookup file.
+
+    Rows are read with a server-side cursor ordered by ``short_url`` in the
+    ``C`` collation, i.e. by bytes, which is the order the lookup file is
+    searched in. Only ``batch_size`` rows are held in memory at a time.
+
+    """
+
+    database: Database
+    batch_size: int = 10_000
+
+    async def export(self, path: Path) -> int:
+        query = (
+            select(URLModel.short_url, URLModel.long_url)
+            .order_by(URLModel.short_url.collate("C"))
+            .execution_options(yield_per=self.batch_size)
+        )
+
+        with LookupFileWriter(path=path) as writer:
+            async with self.database.get_read_only_session() as session:
+                result = await session.stream(query)
+                async for rows in result.partitions():
+                    for short_url, long_url in rows:
+                        writer.add(short_url, long_url)
+
+            return writer.finish()
@@ -0,0 +1,175 @@
+"""Sorted, memory-mappable short URL -> long URL lookup file.
+
+Layout (little-endian)::
+
+    header   magic, version, reserved, entry count, heap offset (32 bytes)
+    index    one fixed-size entry per pair, sorted by short URL bytes:
+             heap offset (u64), short URL length (u16), long URL length (u32)
+    heap     short URL followed by long URL, UTF-8, no separators
+
+Opening a file only checks the header, a lookup is a binary search over
+the index directly on the mapping.
+
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Self,
+)
+
+
+MAGIC = b"URLLKUP\x00"
+VERSION = 1
+
+HEADER = struct.Struct("<8sIIQQ")
+ENTRY = struct.Struct("<QHxxI")
+
+MAX_SHORT_URL_LENGTH = 0xFFFF
+
+
+class LookupFileError(Exception):
+    pass
+
+
+@dataclass
+class LookupFileWriter:
+    """Writes pairs that arrive already sorted by short URL.
+
+    The index and the heap are spooled to two temporary files and
+    concatenated at the end, so memory use does not depend on the number
+    of pairs. The result replaces ``path`` atomically.
+
+    """
+
+    path: Path
+
+    _index: BinaryIO = field(init=False)
+    _heap: BinaryIO = field(init=False)
+    _count: int = field(default=0, init=False)
+    _heap_size: int = field(default=0, init=False)
+    _last_short_url: bytes | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        self._index = tempfile.TemporaryFile()
+        self._heap = tempfile.TemporaryFile()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._index.close()
+        self._heap.close()
+
+    def add(self, short_url: str, long_url: str) -> None:
+        short = short_url.encode()
+        long = long_url.encode()
+
+        # Bytewise order is what the reader searches by (COLLATE "C" in
+        # Postgres), a duplicate would make lookups ambiguous
+        if self._last_short_url is not None and short <= self._last_short_url:
+            raise LookupFileError(
+                f"Short URLs are not strictly sorted: {short_url!r}",
+            )
+        if len(short) > MAX_SHORT_URL_LENGTH:
+            raise LookupFileError(f"Short URL is too long: {short_url!r}")
+
+        self._index.write(ENTRY.pack(self._heap_size, len(short), len(long)))
+        self._heap.write(short)
+        self._heap.write(long)
+
+        self._heap_size += len(short) + len(long)
+        self._count += 1
+        self._last_short_url = short
+
+    def finish(self) -> int:
+        """Write the file and return the number of pairs in it."""
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        heap_offset = HEADER.size + self._count * ENTRY.size
+
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, self._count, heap_offset))
+            for spool in (self._index, self._heap):
+                spool.seek(0)
+                shutil.copyfileobj(spool, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, self.path)
+        return self._count
+
+
+@dataclass
+class LookupFile:
+    path: Path
+
+    _file: BinaryIO = field(init=False)
+    _mmap: mmap.mmap = field(init=False)
+    _count: int = field(init=False)
+    _heap_offset: int = field(init=False)
+
+    def __post_init__(self):
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            self._file.close()
+            raise LookupFileError(f"Lookup file is empty: {self.path}") from exc
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise LookupFileError(f"Lookup file is truncated: {self.path}")
+
+        magic, version, _, count, heap_offset = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise LookupFileError(
+                f"Not a lookup file of version {VERSION}: {self.path}"
+            )
+        expected_heap_offset = HEADER.size + count * ENTRY.size
+        if heap_offset != expected_heap_offset or heap_offset > len(self._mmap):
+            self.close()
+            raise LookupFileError(f"Lookup file is truncated: {self.path}")
+
+        self._count = count
+        self._heap_offset = heap_offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, short_url: str) -> str | None:
+        key = short_url.encode()
+        data = self._mmap
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            offset, short_length, long_length = ENTRY.unpack_from(
+                data,
+                HEADER.size + middle * ENTRY.size,
+            )
+            start = self._heap_offset + offset
+            candidate = data[start : start + short_length]
+
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                start += short_length
+                return data[start : start + long_length].decode()
+
+        return None
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,19 @@
+from application.interfaces.timing import BaseHandlerTimer
+from infrastructure.metrics.prometheus import MEDIATOR_HANDLER_DURATION
+
+
+class PrometheusHandlerTimer(BaseHandlerTimer):
+    def observe(
+        self,
+        kind: str,
+        message: str,
+        handler: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        MEDIATOR_HANDLER_DURATION.labels(
+            kind=kind,
+            message=message,
+            handler=handler,
+            outcome=outcome,
+        ).observe(duration)
@@ -0,0 +1,131 @@
+import logging
+import math
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from infrastructure.metrics.prometheus import RATE_LIMITED_REQUESTS
+from infrastructure.ratelimit.token_bucket import TokenBuckets
+
+
+logger = logging.getLogger(__name__)
+
+# Sliding window counter: the previous fixed window is weighted by how much of
+# it still overlaps the sliding window. Two counters per key instead of a log
+# of every request. Redis time is used, so worker clocks do not matter.
+SLIDING_WINDOW = """
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local current_start = now - (now % window)
+local current_key = KEYS[1] .. ':' .. current_start
+local previous_key = KEYS[1] .. ':' .. (current_start - window)
+local current = tonumber(redis.call('GET', current_key) or '0')
+local previous = tonumber(redis.call('GET', previous_key) or '0')
+local elapsed = now - current_start
+local estimated = previous * (window - elapsed) / window + current
+if estimated >= limit then
+    return {0, 0, window - elapsed}
+end
+redis.call('INCR', current_key)
+redis.call('PEXPIRE', current_key, window * 2)
+return {1, math.floor(limit - estimated - 1), window - elapsed}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    limit: int
+    window: float
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the budget is (partially) restored
+    reset_after: int
+
+
+@dataclass
+class RateLimiter:
+    """Per-client limits shared by every worker.
+
+    A local token bucket is checked first: a client that is over the limit
+    on this worker alone is rejected without a Redis round trip. Otherwise
+    the shared sliding window in Redis decides. When Redis is unavailable
+    (or not configured) the local bucket is the only limit.
+
+    """
+
+    rules: dict[str, RateLimitRule]
+    redis: Redis | None = None
+
+    _buckets: dict[str, TokenBuckets] = field(init=False)
+    _sliding_window: AsyncScript | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        self._buckets = {
+            name: TokenBuckets(capacity=rule.limit, window=rule.window)
+            for name, rule in self.rules.items()
+        }
+        if self.redis is not None:
+            self._sliding_window = self.redis.register_script(SLIDING_WINDOW)
+
+    async def hit(self, rule_name: str, client: str) -> RateLimitDecision:
+        rule = self.rules[rule_name]
+        window = math.ceil(rule.window)
+
+        allowed, local_remaining = self._buckets[rule_name].take(client)
+        if not allowed:
+            return self._reject(rule_name, rule, reset_after=window)
+
+        local_decision = RateLimitDecision(
+            allowed=True,
+            limit=rule.limit,
+            remaining=local_remaining,
+            reset_after=window,
+        )
+        if self._sliding_window is None:
+            return local_decision
+
+        try:
+            allowed, remaining, reset_after_ms = await self._sliding_window(
+                keys=[f"ratelimit:{{{rule_name}:{client}}}"],
+                args=[int(rule.window * 1000), rule.limit],
+            )
+        except Exception:
+            # Fail open: the local bucket has already accepted the request
+            logger.warning("Rate limit check in Redis failed", exc_info=True)
+            return local_decision
+
+        reset_after = math.ceil(reset_after_ms / 1000)
+        if not allowed:
+            return self._reject(rule_name, rule, reset_after=reset_after)
+
+        return RateLimitDecision(
+            allowed=True,
+            limit=rule.limit,
+            remaining=max(remaining, 0),
+            reset_after=reset_after,
+        )
+
+    @staticmethod
+    def _reject(
+        rule_name: str,
+        rule: RateLimitRule,
+        reset_after: int,
+    ) -> RateLimitDecision:
+        RATE_LIMITED_REQUESTS.labels(rule=rule_name).inc()
+        return RateLimitDecision(
+            allowed=False,
+            limit=rule.limit,
+            remaining=0,
+            reset_after=reset_after,
+        )
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from time import monotonic
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    capacity: float
+    refill_rate: float
+    tokens: float
+    updated_at: float
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.refill_rate,
+        )
+        self.updated_at = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class TokenBuckets:
+    """Per-process token buckets, one per key, least recently used ones are
+    dropped beyond ``max_size`` so a scan of random clients can not grow
+    memory without bound."""
+
+    capacity: int
+    window: float
+    max_size: int = 100_000
+
+    _buckets: OrderedDict[str, TokenBucket] = field(
+        default_factory=OrderedDict,
+        init=False,
+    )
+
+    def take(self, key: str) -> tuple[bool, int]:
+        """Take a token for ``key``, return whether it was granted and how
+        many whole tokens are left."""
+        now = monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = TokenBucket(
+                capacity=self.capacity,
+                refill_rate=self.capacity / self.window,
+                tokens=self.capacity,
+                updated_at=now,
+            )
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_size:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        return bucket.take(now), int(bucket.tokens)
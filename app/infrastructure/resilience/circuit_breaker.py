@@ -0,0 +1,115 @@
+import asyncio
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+    TypeVar,
+)
+
+from infrastructure.metrics.prometheus import (
+    CIRCUIT_BREAKER_REJECTED,
+    CIRCUIT_BREAKER_STATE,
+)
+
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Exported as numbers, so that "max by (breaker)" finds the worst worker
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+@dataclass
+class CircuitBreaker:
+    """Stops calling a dependency after ``failure_threshold`` failures in
+    a row.
+
+    While open, calls fail immediately. After ``reset_timeout`` seconds
+    one call is let through as a probe (half-open): its success closes
+    the breaker, its failure opens it again. A probe that never reports
+    back (a cancelled request) is replaced after another
+    ``reset_timeout``.
+
+    ``call`` also bounds each call by ``call_timeout``, so a dependency
+    that hangs counts as failing instead of holding the caller until the
+    client gives up.
+
+    """
+
+    name: str
+    failure_threshold: int = 5
+    reset_timeout: float = 5.0
+    call_timeout: float | None = None
+
+    _state: str = field(default=CLOSED, init=False)
+    _failures: int = field(default=0, init=False)
+    _opened_at: float = field(default=0.0, init=False)
+    _probe_started_at: float | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        self._set_state(CLOSED)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        if self._state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self._state == OPEN:
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            self._set_state(HALF_OPEN)
+
+        if (
+            self._probe_started_at is not None
+            and now - self._probe_started_at < self.reset_timeout
+        ):
+            return False
+
+        self._probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_started_at = None
+        if self._state != CLOSED:
+            self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_started_at = None
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._set_state(OPEN)
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        if not self.allow():
+            CIRCUIT_BREAKER_REJECTED.labels(breaker=self.name).inc()
+            raise CircuitOpenError(f"Circuit breaker {self.name!r} is open")
+
+        try:
+            result = await asyncio.wait_for(func(), timeout=self.call_timeout)
+        except Exception:
+            self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(breaker=self.name).set(STATE_VALUES[state])
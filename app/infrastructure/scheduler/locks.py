@@ -0,0 +1,56 @@
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from redis.asyncio import Redis
+
+
+class BaseJobLock(ABC):
+    @abstractmethod
+    async def acquire(self, key: str, ttl: float) -> bool:
+        """Claim ``key`` for ``ttl`` seconds, False if someone else holds
+        it. Claims are never released, they expire."""
+
+
+@dataclass
+class RedisJobLock(BaseJobLock):
+    """Elects one worker of the cluster per job run with ``SET NX``."""
+
+    redis: Redis
+    prefix: str = "scheduler"
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        return bool(
+            await self.redis.set(
+                f"{self.prefix}:{key}",
+                "1",
+                nx=True,
+                px=max(int(ttl * 1000), 1),
+            ),
+        )
+
+
+@dataclass
+class LocalJobLock(BaseJobLock):
+    """For single-node backends: elects one job run per process."""
+
+    _expires_at: dict[str, float] = field(default_factory=dict, init=False)
+
+    async def acquire(self, key: str, ttl: float) -> bool:
+        now = time.monotonic()
+        self._expires_at = {
+            claimed: expires_at
+            for claimed, expires_at in self._expires_at.items()
+            if expires_at > now
+        }
+        if key in self._expires_at:
+            return False
+
+        self._expires_at[key] = now + ttl
+        return True
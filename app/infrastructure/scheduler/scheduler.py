@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from infrastructure.metrics.prometheus import (
+    SCHEDULED_JOB_DURATION,
+    SCHEDULED_JOB_SKIPPED,
+)
+from infrastructure.scheduler.locks import BaseJobLock
+from infrastructure.scheduler.schedules import Schedule
+
+
+logger = logging.getLogger(__name__)
+
+# Keeps a run claimed a little after the slowest worker could still try it
+LOCK_MARGIN = 5.0
+
+
+@dataclass(frozen=True)
+class Job:
+    name: str
+    func: Callable[[], Awaitable[None]]
+    schedule: Schedule
+    timeout: float
+    # Each worker waits a random part of this after the run time, so the
+    # workers do not hit the lock (and the job its storage) at once
+    jitter: float = 0.0
+    # One worker of the cluster runs it instead of every worker
+    exclusive: bool = True
+
+
+@dataclass
+class Scheduler:
+    """Runs async jobs on interval or cron schedules.
+
+    Run times are aligned to the wall clock, so for an exclusive job all
+    workers compete for the same ``<job>:<run time>`` key and the winner
+    keeps it until well after every other worker has given up; a run is
+    therefore executed once even when it finishes before the others wake
+    up. A job that is still running when its next run is due skips that
+    run instead of overlapping with itself.
+
+    """
+
+    lock: BaseJobLock
+    jobs: list[Job] = field(default_factory=list)
+
+    def add_job(self, job: Job) -> None:
+        if any(added.name == job.name for added in self.jobs):
+            raise ValueError(f"Job {job.name!r} is already scheduled")
+        self.jobs.append(job)
+
+    async def run(self) -> None:
+        if not self.jobs:
+            return
+
+        await asyncio.gather(*(self.run_job(job) for job in self.jobs))
+
+    async def run_job(self, job: Job) -> None:
+        while True:
+            run_at = job.schedule.next_run(time.time())
+            delay = run_at - time.time() + random.uniform(0, job.jitter)
+            await asyncio.sleep(max(delay, 0))
+
+            if job.exclusive and not await self.claim(job, run_at):
+                continue
+
+            await self.execute(job)
+
+    async def claim(self, job: Job, run_at: float) -> bool:
+        try:
+            claimed = await self.lock.acquire(
+                f"{job.name}:{int(run_at)}",
+                ttl=job.timeout + job.jitter + LOCK_MARGIN,
+            )
+        except Exception:
+            # Running everywhere would be worse than missing one run
+            logger.warning("Could not claim a run of %s", job.name, exc_info=True)
+            SCHEDULED_JOB_SKIPPED.labels(job=job.name, reason="lock_error").inc()
+            return False
+
+        if not claimed:
+            SCHEDULED_JOB_SKIPPED.labels(job=job.name, reason="claimed").inc()
+        return claimed
+
+    async def execute(self, job: Job) -> None:
+        outcome = "success"
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(job.func(), timeout=job.timeout)
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except TimeoutError:
+            outcome = "timeout"
+            logger.error("Job %s timed out after %ss", job.name, job.timeout)
+        except Exception:
+            outcome = "error"
+            logger.exception("Job %s failed", job.name)
+        finally:
+            SCHEDULED_JOB_DURATION.labels(job=job.name, outcome=outcome).observe(
+                time.perf_counter() - started_at,
+            )
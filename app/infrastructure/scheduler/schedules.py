@@ -0,0 +1,144 @@
+import math
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+
+
+class InvalidScheduleError(ValueError):
+    pass
+
+
+class Schedule(ABC):
+    @abstractmethod
+    def next_run(self, after: float) -> float:
+        """First run time (Unix seconds) strictly after ``after``.
+
+        Runs are aligned to the wall clock, so every worker computes the
+        same times and a run can be identified by its job and time.
+
+        """
+
+
+@dataclass(frozen=True)
+class IntervalSchedule(Schedule):
+    seconds: float
+
+    def __post_init__(self):
+        if self.seconds <= 0:
+            raise InvalidScheduleError(f"Interval must be positive: {self.seconds}")
+
+    def next_run(self, after: float) -> float:
+        return (math.floor(after / self.seconds) + 1) * self.seconds
+
+
+# (name, minimum, maximum) of the five fields
+CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    # 0 and 7 are both Sunday
+    ("weekday", 0, 7),
+)
+
+
+def parse_cron_field(value: str, minimum: int, maximum: int) -> frozenset[int]:
+    values = set()
+    for part in value.split(","):
+        body, _, step = part.partition("/")
+        try:
+            step = int(step) if step else 1
+            if body == "*":
+                start, end = minimum, maximum
+            elif "-" in body:
+                start, end = map(int, body.split("-", 1))
+            else:
+                start = end = int(body)
+        except ValueError as exc:
+            raise InvalidScheduleError(f"Invalid cron field: {value!r}") from exc
+
+        if step < 1 or not minimum <= start <= end <= maximum:
+            raise InvalidScheduleError(f"Invalid cron field: {value!r}")
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule(Schedule):
+    """Five-field cron expression evaluated in UTC.
+
+    Supports ``*``, ``a-b``, ``/step`` and lists. As in cron, when both
+    the day of month and the day of week are restricted a day matching
+    either one runs.
+
+    """
+
+    expression: str
+
+    _minutes: frozenset[int] = field(init=False, repr=False)
+    _hours: frozenset[int] = field(init=False, repr=False)
+    _days: frozenset[int] = field(init=False, repr=False)
+    _months: frozenset[int] = field(init=False, repr=False)
+    _weekdays: frozenset[int] = field(init=False, repr=False)
+    _any_day: bool = field(init=False, repr=False)
+    _any_weekday: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        values = self.expression.split()
+        if len(values) != len(CRON_FIELDS):
+            raise InvalidScheduleError(
+                f"Cron expression must have 5 fields: {self.expression!r}",
+            )
+
+        for value, (name, minimum, maximum) in zip(values, CRON_FIELDS):
+            object.__setattr__(
+                self,
+                f"_{name}s",
+                parse_cron_field(value, minimum, maximum),
+            )
+        # Python weekdays: Monday is 0
+        weekdays = frozenset((weekday - 1) % 7 for weekday in self._weekdays)
+        object.__setattr__(self, "_weekdays", weekdays)
+        # Like cron, "*/2" counts as unrestricted here
+        object.__setattr__(self, "_any_day", values[2].startswith("*"))
+        object.__setattr__(self, "_any_weekday", values[4].startswith("*"))
+
+    def next_run(self, after: float) -> float:
+        moment = datetime.fromtimestamp(after, timezone.utc)
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+        # Every combination repeats within 28 years (leap years and weekdays)
+        for _ in range(28 * 366):
+            if self._matches_day(moment):
+                for hour in sorted(self._hours):
+                    if hour < moment.hour:
+                        continue
+                    first_minute = moment.minute if hour == moment.hour else 0
+                    for minute in sorted(self._minutes):
+                        if minute >= first_minute:
+                            return moment.replace(hour=hour, minute=minute).timestamp()
+
+            moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+
+        raise InvalidScheduleError(f"Cron expression never runs: {self.expression!r}")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        if moment.month not in self._months:
+            return False
+
+        day_matches = moment.day in self._days
+        weekday_matches = moment.weekday() in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
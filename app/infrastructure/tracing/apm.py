@@ -0,0 +1,21 @@
+from contextlib import AbstractAsyncContextManager
+
+from elasticapm import async_capture_span
+
+from application.interfaces.tracing import BaseTracer
+
+
+class ElasticAPMTracer(BaseTracer):
+    """Spans of the Elastic APM transaction opened by the middleware.
+
+    Outside a sampled transaction the span is a no-op.
+
+    """
+
+    def span(self, name: str, action: str) -> AbstractAsyncContextManager:
+        return async_capture_span(
+            name,
+            span_type="app",
+            span_subtype="mediator",
+            span_action=action,
+        )
@@ -0,0 +1,25 @@
+from datetime import datetime
+from uuid import UUID
+
+from domain.entities.url import URLEntity
+from domain.value_objects.url import LongURLValueObject
+
+
+def convert_url_entity_to_fields(entity: URLEntity) -> dict[str, str]:
+    return {
+        "id": str(entity.id),
+        "short_url": entity.short_url,
+        "long_url": entity.long_url.as_generic_type(),
+        "created_at": entity.created_at.isoformat(),
+    }
+
+
+def convert_fields_to_url_entity(fields: dict[str, str]) -> URLEntity:
+    created_at = datetime.fromisoformat(fields["created_at"])
+    return URLEntity(
+        id=UUID(fields["id"]),
+        short_url=fields["short_url"],
+        long_url=LongURLValueObject.from_trusted(fields["long_url"]),
+        created_at=created_at,
+        updated_at=created_at,
+    )
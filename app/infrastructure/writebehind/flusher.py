@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import os
+import socket
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.url import URLEntity
+from infrastructure.changefeed.events import (
+    URL_CREATED,
+    URLChangeEvent,
+)
+from infrastructure.database.converters.url import convert_url_entity_to_model
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.url import URLModel
+from infrastructure.metrics.prometheus import (
+    DB_QUERY_DURATION,
+    observe_duration,
+    WRITE_BEHIND_CONFLICTS,
+)
+from infrastructure.writebehind.entries import convert_fields_to_url_entity
+
+
+logger = logging.getLogger(__name__)
+
+FLUSH_DURATION = DB_QUERY_DURATION.labels(repository="write_behind", method="flush")
+
+# Read entries already delivered to this consumer but not acknowledged
+PENDING = "0"
+# Read entries never delivered to any consumer of the group
+NEW = ">"
+
+
+def default_consumer_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass
+class WriteBehindFlusher:
+    """Batch-inserts pairs queued by ``WriteBehindURLRepository``.
+
+    Every worker joins one consumer group. A batch is acknowledged and
+    removed from the stream only after it is committed, a failed batch
+    stays pending and is retried with exponential backoff. Entries left
+    pending by a crashed worker are claimed after ``claim_idle_ms``.
+
+    Inserts use ``ON CONFLICT DO NOTHING``, so retrying a committed batch
+    is harmless. With ``outbox_enabled`` the outbox events of the change
+    feed are written in the same transaction for the rows actually
+    inserted. A skipped row whose code Postgres already maps to another
+    long URL (stored past Redis between the reservation and the flush)
+    cannot be stored: the entry is moved to the ``<stream>:conflicts``
+    stream for manual repair and logged, its Redis key is left as is.
+
+    """
+
+    database: Database
+    redis: Redis
+    stream: str
+    group: str = "url_writes_flusher"
+    consumer: str = field(default_factory=default_consumer_name)
+    batch_size: int = 500
+    block_ms: int = 1000
+    claim_idle_ms: int = 60_000
+    max_backoff: float = 30.0
+    outbox_enabled: bool = False
+
+    @property
+    def conflicts_stream(self) -> str:
+        return f"{self.stream}:conflicts"
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def flush_batch(self, entries: list[tuple[str, dict[str, str]]]) -> int:
+        if not entries:
+            return 0
+
+        entities = [convert_fields_to_url_entity(fields) for _, fields in entries]
+        rows = [
+            {
+                column.key: getattr(model, column.key)
+                for column in URLModel.__table__.columns
+            }
+            for model in map(convert_url_entity_to_model, entities)
+        ]
+
+        with observe_duration(FLUSH_DURATION):
+            async with self.database.get_session() as session:
+                stmt = (
+                    insert(URLModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=[URLModel.short_url])
+                    .returning(URLModel.short_url)
+                )
+                inserted = set((await session.scalars(stmt)).all())
+                if self.outbox_enabled:
+                    session.add_all(
+                        URLChangeEvent.from_entity(entity, URL_CREATED).to_outbox()
+                        for entity in entities
+                        if entity.short_url in inserted
+                    )
+                conflicts = await self._find_conflicts(session, entities, inserted)
+                await session.commit()
+
+        stream_ids = [stream_id for stream_id, _ in entries]
+        fields_by_short_url = {
+            entity.short_url: fields for entity, (_, fields) in zip(entities, entries)
+        }
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for entity, stored_long_url in conflicts:
+                logger.error(
+                    "Short URL %s is already stored for %s, moved queued %s to %s",
+                    entity.short_url,
+                    stored_long_url,
+                    entity.long_url.as_generic_type(),
+                    self.conflicts_stream,
+                )
+                pipeline.xadd(
+                    self.conflicts_stream, fields_by_short_url[entity.short_url]
+                )
+                WRITE_BEHIND_CONFLICTS.inc()
+            pipeline.xack(self.stream, self.group, *stream_ids)
+            pipeline.xdel(self.stream, *stream_ids)
+            await pipeline.execute()
+
+        return len(inserted)
+
+    async def _find_conflicts(
+        self,
+        session: AsyncSession,
+        entities: list[URLEntity],
+        inserted: set[str],
+    ) -> list[tuple[URLEntity, str]]:
+        """Skipped pairs whose code is stored with another long URL. A
+        skipped pair stored with the same long URL is a retried batch."""
+        skipped = {
+            entity.short_url: entity
+            for entity in entities
+            if entity.short_url not in inserted
+        }
+        if not skipped:
+            return []
+
+        stmt = select(URLModel.short_url, URLModel.long_url).where(
+            URLModel.short_url.in_(list(skipped)),
+        )
+        conflicts = []
+        for short_url, long_url in (await session.execute(stmt)).all():
+            entity = skipped[short_url]
+            if long_url != entity.long_url.as_generic_type():
+                conflicts.append((entity, long_url))
+        return conflicts
+
+    async def read_batch(self, start: str) -> list[tuple[str, dict[str, str]]]:
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: start},
+            count=self.batch_size,
+            block=None if start == PENDING else self.block_ms,
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        return entries
+
+    async def claim_abandoned(self) -> list[tuple[str, dict[str, str]]]:
+        _, entries, *_ = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            count=self.batch_size,
+        )
+        return entries
+
+    async def run(self) -> None:
+        await self.ensure_group()
+        backoff = 0.0
+
+        while True:
+            try:
+                # Own unacknowledged entries first: they are left over from a
+                # failed flush or from before a restart.
+                entries = await self.read_batch(PENDING)
+                if not entries:
+                    entries = await self.claim_abandoned()
+                if not entries:
+                    entries = await self.read_batch(NEW)
+
+                await self.flush_batch(entries)
+                backoff = 0.0
+            except Exception:
+                backoff = min(max(backoff * 2, 0.1), self.max_backoff)
+                logger.exception("Write-behind flush failed, retrying in %ss", backoff)
+                await asyncio.sleep(backoff)
@@ -0,0 +1,94 @@
+from fastapi import (
+    Depends,
+    HTTPException,
+    Request,
+    status,
+)
+
+from punq import Container
+
+from application.init import init_container
+from infrastructure.auth.authenticator import (
+    Authenticator,
+    Principal,
+)
+from infrastructure.auth.quota import QuotaTracker
+from settings.config import Config
+
+
+API_KEY_HEADER = "x-api-key"
+
+
+def get_credentials(request: Request) -> str | None:
+    """Bearer token (API key or JWT) or the ``X-API-Key`` header."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token.strip():
+        return token.strip()
+
+    return request.headers.get(API_KEY_HEADER) or None
+
+
+async def get_principal(
+    request: Request,
+    container: Container = Depends(init_container),
+) -> Principal | None:
+    """The authenticated caller, ``None`` while authentication is
+    disabled."""
+    config: Config = container.resolve(Config)
+    if not config.auth_enabled:
+        return None
+
+    token = get_credentials(request)
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="An API key or a bearer token is required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    authenticator: Authenticator = container.resolve(Authenticator)
+    principal = await authenticator.authenticate(token)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+
+async def require_admin(
+    principal: Principal | None = Depends(get_principal),
+    container: Container = Depends(init_container),
+) -> Principal:
+    """An administrator. Without authentication nobody is one, and the
+    admin endpoints do not exist."""
+    if principal is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    config: Config = container.resolve(Config)
+    if principal.subject not in config.auth_admin_subjects:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator credentials are required",
+        )
+
+    return principal
+
+
+async def consume_quota(
+    principal: Principal | None = Depends(get_principal),
+    container: Container = Depends(init_container),
+) -> Principal | None:
+    if principal is None or principal.quota is None:
+        return principal
+
+    quota_tracker: QuotaTracker = container.resolve(QuotaTracker)
+    if not await quota_tracker.consume(principal.subject, principal.quota):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Daily quota of short URLs exceeded",
+        )
+
+    return principal
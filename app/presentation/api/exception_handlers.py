@@ -1,23 +1,52 @@
+import asyncio
+
 from fastapi import (
     FastAPI,
     HTTPException,
     Request,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from elasticapm import get_client
+from elasticapm import (
+    get_client,
+    get_transaction_id,
+)
 
 from domain.exceptions.base import DomainException
-from presentation.api.schemas import ApiResponse
+from domain.exceptions.url import (
+    ReadOnlyURLStorageException,
+    ShortURLAlreadyExistsException,
+    URLStorageUnavailableException,
+)
+from infrastructure.metrics.prometheus import API_ERRORS
+from presentation.api.responses import error_response
+
+
+def _count_error(exc: Exception, status_code: int) -> None:
+    API_ERRORS.labels(
+        exception=exc.__class__.__name__,
+        status=str(status_code),
+    ).inc()
 
 
 def _capture_exception_to_apm(exc: Exception) -> None:
-    """Capture exception to Elastic APM."""
+    """Capture an unexpected exception to Elastic APM.
+
+    Collecting frames and locals is the expensive part of a capture, so it
+    runs in the default executor and the error response is not delayed by
+    it. Expected 4xx errors never get here, they are only counted.
+
+    """
     try:
         client = get_client()
         if client:
-            client.capture_exception(exc_info=(type(exc), exc, exc.__traceback__))
+            asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: client.capture_exception(
+                    exc_info=(type(exc), exc, exc.__traceback__),
+                ),
+            )
     except Exception:
         # Silently fail if APM is not configured
         pass
@@ -30,42 +59,50 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def domain_exception_handler(
         request: Request,
         exc: DomainException,
-    ) -> JSONResponse:
-        _capture_exception_to_apm(exc)
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content=ApiResponse(
-                data={},
-                errors=[exc.message],
-            ).model_dump(),
-        )
+    ) -> ORJSONResponse:
+        _count_error(exc, status.HTTP_400_BAD_REQUEST)
+        return error_response(status.HTTP_400_BAD_REQUEST, exc.message)
+
+    @app.exception_handler(ShortURLAlreadyExistsException)
+    async def conflict_exception_handler(
+        request: Request,
+        exc: ShortURLAlreadyExistsException,
+    ) -> ORJSONResponse:
+        _count_error(exc, status.HTTP_409_CONFLICT)
+        return error_response(status.HTTP_409_CONFLICT, exc.message)
+
+    @app.exception_handler(ReadOnlyURLStorageException)
+    @app.exception_handler(URLStorageUnavailableException)
+    async def storage_unavailable_exception_handler(
+        request: Request,
+        exc: ReadOnlyURLStorageException | URLStorageUnavailableException,
+    ) -> ORJSONResponse:
+        _count_error(exc, status.HTTP_503_SERVICE_UNAVAILABLE)
+        return error_response(status.HTTP_503_SERVICE_UNAVAILABLE, exc.message)
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(
         request: Request,
         exc: HTTPException,
-    ) -> JSONResponse:
-        _capture_exception_to_apm(exc)
+    ) -> ORJSONResponse:
+        _count_error(exc, exc.status_code)
+        if exc.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+            _capture_exception_to_apm(exc)
         error_message = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=ApiResponse(
-                data={},
-                errors=[error_message],
-            ).model_dump(),
-        )
+        response = error_response(exc.status_code, error_message)
+        if exc.headers:
+            response.headers.update(exc.headers)
+        return response
 
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
-        _capture_exception_to_apm(exc)
+    ) -> ORJSONResponse:
+        _count_error(exc, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        # Inside a traced request the APM middleware has already captured the
+        # exception on its way out.
+        if get_transaction_id() is None:
+            _capture_exception_to_apm(exc)
         error_message = str(exc) if str(exc) else "An unexpected error occurred"
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ApiResponse(
-                data={},
-                errors=[error_message],
-            ).model_dump(),
-        )
+        return error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, error_message)
@@ -1,11 +1,19 @@
+from dataclasses import asdict
+
 from fastapi import (
     APIRouter,
+    Depends,
+    Request,
     status,
 )
+from fastapi.responses import ORJSONResponse
 
+from application.init import init_container
+from infrastructure.health.readiness import ReadinessChecker
+from presentation.api.responses import api_response
 from presentation.api.schemas import (
-    ApiResponse,
-    PingResponseSchema,
+    PingApiResponse,
+    ReadinessApiResponse,
 )
 
 
@@ -15,8 +23,48 @@ healthcheck_router = APIRouter(
 )
 
 
-@healthcheck_router.get("", status_code=status.HTTP_200_OK)
-async def get_status() -> ApiResponse[PingResponseSchema]:
-    return ApiResponse[PingResponseSchema](
-        data=PingResponseSchema(result=True),
+@healthcheck_router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=PingApiResponse,
+)
+async def get_status() -> ORJSONResponse:
+    """Liveness: the process is up and serving requests."""
+    return api_response({"result": True})
+
+
+@healthcheck_router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    response_model=ReadinessApiResponse,
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessApiResponse},
+    },
+)
+async def get_readiness(
+    request: Request,
+    container=Depends(init_container),
+) -> ORJSONResponse:
+    """Readiness: warm-up has finished and Postgres and Redis answer."""
+    if not getattr(request.app.state, "ready", False):
+        return api_response(
+            {"ready": False, "dependencies": {}},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            errors=["Application is starting up or shutting down"],
+        )
+
+    checker: ReadinessChecker = container.resolve(ReadinessChecker)
+    report = await checker.check()
+
+    return api_response(
+        {
+            "ready": report.ready,
+            "dependencies": {
+                name: asdict(dependency)
+                for name, dependency in report.dependencies.items()
+            },
+        },
+        status_code=(
+            status.HTTP_200_OK if report.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
     )
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from punq import Container
+from redis.asyncio import Redis
+
+from application.init import init_container
+from application.interfaces.clicks import BaseClickStats
+from application.interfaces.visitors import BaseVisitorCounter
+from application.mediator import Mediator
+from domain.interfaces.repositories.url import BaseURLRepository
+from domain.services.hot_keys import HotKeys
+from infrastructure.analytics.clicks import SQLAlchemyClickStats
+from infrastructure.analytics.visitors import RedisVisitorCounter
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.changefeed.consumer import ChangeFeedConsumer
+from infrastructure.changefeed.relay import OutboxRelay
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.scheduler.scheduler import Scheduler
+from infrastructure.writebehind.flusher import WriteBehindFlusher
+from settings.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+REDIS_WARMUP_CONNECTIONS = 10
+
+
+def get_app_container(app: FastAPI) -> Container:
+    """Resolve the container the same way request handlers do, so that
+    ``dependency_overrides`` (used by the tests) are honoured."""
+    return app.dependency_overrides.get(init_container, init_container)()
+
+
+async def warm_up_redis(redis: Redis, connections: int) -> None:
+    pool = redis.connection_pool
+    acquired = []
+    try:
+        for _ in range(min(connections, pool.max_connections)):
+            connection = await pool.get_connection()
+            acquired.append(connection)
+            await connection.send_command("PING")
+            await connection.read_response()
+    finally:
+        for connection in acquired:
+            await pool.release(connection)
+
+
+async def warm_up_resources(container: Container) -> None:
+    config: Config = container.resolve(Config)
+
+    # Building the mediator resolves every singleton (engines, Redis client,
+    # repositories and handlers) instead of doing it on the first request.
+    container.resolve(Mediator)
+
+    # The memory backend has nothing to warm up
+    if not config.warmup_enabled or config.url_repository_backend != "postgres":
+        return
+
+    try:
+        await container.resolve(Database).warm_up()
+        await warm_up_redis(container.resolve(Redis), REDIS_WARMUP_CONNECTIONS)
+
+        if config.warmup_preload_codes:
+            repository: BaseURLRepository = container.resolve(BaseURLRepository)
+            await repository.preload_cache(config.warmup_preload_codes)
+    except Exception:
+        # A dependency that is down must not crash-loop the pod; the readiness
+        # probe reports it instead.
+        logger.exception("Resource warm-up failed")
+
+
+def start_background_tasks(container: Container) -> list[asyncio.Task]:
+    config: Config = container.resolve(Config)
+    tasks = []
+
+    if config.write_behind_enabled and config.url_repository_backend == "postgres":
+        flusher: WriteBehindFlusher = container.resolve(WriteBehindFlusher)
+        tasks.append(asyncio.create_task(flusher.run()))
+
+    if config.changefeed_relay_enabled:
+        relay: OutboxRelay = container.resolve(OutboxRelay)
+        tasks.append(
+            asyncio.create_task(relay.run(config.changefeed_poll_interval)),
+        )
+
+    if config.hot_keys_enabled:
+        hot_keys: HotKeys = container.resolve(HotKeys)
+        tasks.append(
+            asyncio.create_task(hot_keys.run(config.hot_keys_refresh_interval)),
+        )
+
+    if config.unique_visitors_enabled:
+        visitor_counter: RedisVisitorCounter = container.resolve(BaseVisitorCounter)
+        tasks.append(
+            asyncio.create_task(
+                visitor_counter.run(config.unique_visitors_flush_interval),
+            ),
+        )
+
+    if config.link_stats_enabled:
+        click_stats: SQLAlchemyClickStats = container.resolve(BaseClickStats)
+        tasks.append(
+            asyncio.create_task(click_stats.run(config.link_stats_flush_interval)),
+        )
+
+    if config.scheduler_enabled:
+        scheduler: Scheduler = container.resolve(Scheduler)
+        tasks.append(asyncio.create_task(scheduler.run()))
+
+    if config.auth_enabled:
+        authenticator: Authenticator = container.resolve(Authenticator)
+        if authenticator.redis is not None:
+            tasks.append(asyncio.create_task(authenticator.listen_revocations()))
+
+    if config.changefeed_consumer_enabled:
+        consumer: ChangeFeedConsumer = container.resolve(ChangeFeedConsumer)
+        tasks.append(asyncio.create_task(consumer.run()))
+
+    return tasks
+
+
+async def stop_background_tasks(tasks: list[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def close_resources(container: Container) -> None:
+    await container.resolve(BaseURLRepository).close()
+    await container.resolve(Database).dispose()
+    await container.resolve(Redis).aclose()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container = get_app_container(app)
+
+    # uvicorn does not accept connections until startup has finished, so
+    # requests never race the warm-up.
+    await warm_up_resources(container)
+    background_tasks = start_background_tasks(container)
+    app.state.ready = True
+
+    yield
+
+    app.state.ready = False
+    await stop_background_tasks(background_tasks)
+    await close_resources(container)
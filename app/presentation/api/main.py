@@ -1,9 +1,15 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from presentation.api.exception_handlers import setup_exception_handlers
 from presentation.api.healthcheck import healthcheck_router
+from presentation.api.lifespan import lifespan
+from presentation.api.metrics import metrics_router
 from presentation.api.middleware.apm import setup_apm_middleware
+from presentation.api.middleware.metrics import setup_metrics_middleware
+from presentation.api.middleware.ratelimit import setup_rate_limit_middleware
 from presentation.api.v1 import v1_router
+from settings import config
 
 
 def create_app() -> FastAPI:
@@ -11,12 +17,19 @@ def create_app() -> FastAPI:
         title="URL Shortener",
         description="URL Shortener",
         docs_url="/api/docs",
-        debug=True,
+        debug=config.debug,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     setup_apm_middleware(app)
+    # Rejected requests never reach APM but are still counted by the metrics
+    setup_rate_limit_middleware(app)
+    # Added last so it is the outermost middleware and times everything
+    setup_metrics_middleware(app)
     setup_exception_handlers(app)
 
     app.include_router(healthcheck_router)
+    app.include_router(metrics_router)
     app.include_router(v1_router, prefix="/api/v1")
     return app
@@ -0,0 +1,15 @@
+from fastapi import (
+    APIRouter,
+    Response,
+)
+
+from infrastructure.metrics.prometheus import render_metrics
+
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
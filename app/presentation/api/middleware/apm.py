@@ -1,9 +1,41 @@
 from fastapi import FastAPI
+from starlette.types import (
+    ASGIApp,
+    Receive,
+    Scope,
+    Send,
+)
 
 from elasticapm.contrib.starlette import ElasticAPM
 
+from settings import config
+
+
+class SelectiveElasticAPM:
+    """Runs ``ElasticAPM`` for every request except the excluded path
+    prefixes, which skip the middleware entirely (no transaction, no body
+    buffering)."""
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...]) -> None:
+        self.app = app
+        self.excluded_paths = excluded_paths
+        # настройки Elastic APM (в том числе ELASTIC_APM_TRANSACTION_SAMPLE_RATE)
+        # читаются из переменных окружения (динамически он их не увидит)
+        self.traced_app = ElasticAPM(app)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        await self.traced_app(scope, receive, send)
+
 
 def setup_apm_middleware(app: FastAPI) -> None:
+    if not config.apm_enabled:
+        return
+
     app.add_middleware(
-        ElasticAPM,
-    )  # настройки Elastic APM читаются из переменных окружения (динамически он их не увидит)
+        SelectiveElasticAPM,
+        excluded_paths=tuple(config.apm_excluded_paths),
+    )
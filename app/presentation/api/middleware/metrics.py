@@ -0,0 +1,54 @@
+from time import perf_counter
+
+from fastapi import FastAPI
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from infrastructure.metrics.prometheus import HTTP_REQUEST_DURATION
+
+
+class PrometheusMiddleware:
+    """Records request latency labelled with the route template (e.g.
+    ``/api/v1/urls/{short_url}``) so that label cardinality stays bounded.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``, which would add a task
+    and a stream per request.
+
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=route.path if route is not None else "unmatched",
+                status=str(status_code),
+            ).observe(perf_counter() - started_at)
+
+
+def setup_metrics_middleware(app: FastAPI) -> None:
+    app.add_middleware(PrometheusMiddleware)
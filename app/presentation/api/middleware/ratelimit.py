@@ -0,0 +1,169 @@
+from typing import Callable
+
+from fastapi import (
+    FastAPI,
+    Request,
+    status,
+)
+from starlette.datastructures import Headers
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from punq import Container
+
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.ratelimit.limiter import (
+    RateLimitDecision,
+    RateLimiter,
+)
+from presentation.api.auth import get_credentials
+from presentation.api.lifespan import get_app_container
+from presentation.api.responses import error_response
+from settings import config
+from settings.config import Config
+
+
+URLS_PATH = "/api/v1/urls"
+
+
+def get_rule_name(scope: Scope) -> str | None:
+    """Routing has not happened yet, so requests are matched by method and
+    path: creation and resolving have separate budgets."""
+    path = scope["path"]
+    method = scope["method"]
+
+    if method == "POST" and path.rstrip("/") == URLS_PATH:
+        return "create"
+    if method == "GET" and path.startswith(f"{URLS_PATH}/"):
+        return "resolve"
+    return None
+
+
+def get_client_ip(scope: Scope, forwarded_hops: int) -> str:
+    """Each trusted proxy appends the address it got the request from to
+    ``X-Forwarded-For``, so the client is ``forwarded_hops`` entries from
+    the right. Anything further left is sent by the client itself."""
+    if forwarded_hops:
+        headers = Headers(scope=scope)
+        forwarded_for = [
+            address.strip()
+            for value in headers.getlist("x-forwarded-for")
+            for address in value.split(",")
+        ]
+        if len(forwarded_for) >= forwarded_hops:
+            return forwarded_for[-forwarded_hops]
+
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+async def get_client_key(
+    scope: Scope,
+    authenticator: Authenticator | None,
+    forwarded_hops: int,
+) -> str:
+    """The subject of verified credentials, the IP otherwise: a made-up key
+    must not open a new budget."""
+    token = get_credentials(Request(scope)) if authenticator is not None else None
+    if token is not None:
+        principal = await authenticator.authenticate(token)
+        if principal is not None:
+            return "subject:" + principal.subject
+
+    return "ip:" + get_client_ip(scope, forwarded_hops)
+
+
+def get_rate_limit_headers(decision: RateLimitDecision) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (b"ratelimit-limit", str(decision.limit).encode()),
+        (b"ratelimit-remaining", str(decision.remaining).encode()),
+        (b"ratelimit-reset", str(decision.reset_after).encode()),
+    ]
+    if not decision.allowed:
+        headers.append((b"retry-after", str(decision.reset_after).encode()))
+    return headers
+
+
+class RateLimitMiddleware:
+    """Rejects clients over their budget with ``429`` before the request
+    reaches routing, and adds ``RateLimit-*`` headers to limited routes.
+
+    Credentials are verified here (the authenticator caches the result for
+    the endpoint), and only while authentication is enabled.
+
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        container_factory: Callable[[], Container],
+        forwarded_hops: int = 0,
+    ) -> None:
+        self.app = app
+        self.container_factory = container_factory
+        self.forwarded_hops = forwarded_hops
+        self._limiter: RateLimiter | None = None
+        self._authenticator: Authenticator | None = None
+
+    def _resolve(self) -> None:
+        # The container is only available once the application is built
+        container = self.container_factory()
+        self._limiter = container.resolve(RateLimiter)
+        if container.resolve(Config).auth_enabled:
+            self._authenticator = container.resolve(Authenticator)
+
+    @property
+    def limiter(self) -> RateLimiter:
+        if self._limiter is None:
+            self._resolve()
+        return self._limiter
+
+    @property
+    def authenticator(self) -> Authenticator | None:
+        if self._limiter is None:
+            self._resolve()
+        return self._authenticator
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        rule_name = get_rule_name(scope) if scope["type"] == "http" else None
+        if rule_name is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self.limiter.hit(
+            rule_name,
+            await get_client_key(scope, self.authenticator, self.forwarded_hops),
+        )
+        headers = get_rate_limit_headers(decision)
+
+        if not decision.allowed:
+            response = error_response(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "Rate limit exceeded, retry later",
+            )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def setup_rate_limit_middleware(app: FastAPI) -> None:
+    if not config.rate_limit_enabled:
+        return
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        container_factory=lambda: get_app_container(app),
+        forwarded_hops=config.rate_limit_forwarded_hops,
+    )
@@ -0,0 +1,33 @@
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+
+
+def api_response(
+    data: dict[str, Any] | None = None,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    meta: dict[str, Any] | None = None,
+    errors: list[Any] | None = None,
+) -> ORJSONResponse:
+    """Render the ``ApiResponse`` envelope straight to JSON.
+
+    Returning a ``Response`` makes FastAPI skip ``response_model``
+    validation, so the envelope is neither built as a Pydantic model nor
+    re-validated. Routes still declare ``response_model`` for the
+    OpenAPI schema.
+
+    """
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "data": {} if data is None else data,
+            "meta": {} if meta is None else meta,
+            "errors": [] if errors is None else errors,
+        },
+    )
+
+
+def error_response(status_code: int, message: str) -> ORJSONResponse:
+    return api_response(status_code=status_code, errors=[message])
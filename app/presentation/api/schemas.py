@@ -18,7 +18,25 @@ class PingResponseSchema(BaseModel):
     result: bool
 
 
+class DependencyStatusSchema(BaseModel):
+    healthy: bool
+    latency_ms: float
+    error: str | None = None
+    pool: dict[str, float] | None = None
+
+
+class ReadinessResponseSchema(BaseModel):
+    ready: bool
+    dependencies: dict[str, DependencyStatusSchema]
+
+
 class ApiResponse(BaseModel, Generic[TData]):
     data: TData | dict = Field(default_factory=dict)
     meta: dict[str, Any] = Field(default_factory=dict)
     errors: list[Any] = Field(default_factory=list)
+
+
+# ``ApiResponse[T]`` builds (or looks up) a parametrized model class on every
+# subscription, so routes reuse these module-level parametrizations instead.
+PingApiResponse = ApiResponse[PingResponseSchema]
+ReadinessApiResponse = ApiResponse[ReadinessResponseSchema]
@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+import uvicorn
+
+from settings.config import Config
+
+
+def get_workers_count(config: Config) -> int:
+    if config.process_local_url_store:
+        return 1
+
+    return config.server_workers or os.cpu_count() or 1
+
+
+def prepare_metrics_dir(config: Config) -> None:
+    """Point every worker at one directory for multi-process Prometheus
+    metrics.
+
+    Must run before the workers import ``prometheus_client``. Files left
+    by a previous run are removed, otherwise dead workers' counters
+    would be summed in.
+
+    """
+    directory = config.prometheus_multiproc_dir or tempfile.mkdtemp(
+        prefix="prometheus-",
+    )
+    os.makedirs(directory, exist_ok=True)
+
+    for name in os.listdir(directory):
+        if name.endswith(".db"):
+            os.remove(os.path.join(directory, name))
+
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+
+
+def run() -> None:
+    config = Config()
+    workers = None if config.server_reload else get_workers_count(config)
+
+    if workers and workers > 1:
+        prepare_metrics_dir(config)
+
+    # uvicorn supervises the worker processes itself: on SIGTERM every worker
+    # stops accepting connections, waits for in-flight requests (up to the
+    # graceful shutdown timeout) and then runs the lifespan shutdown, which
+    # closes the database engines and the Redis pool.
+    uvicorn.run(
+        "presentation.api.main:create_app",
+        factory=True,
+        host=config.server_host,
+        port=config.server_port,
+        workers=workers,
+        loop=config.server_loop,
+        http=config.server_http,
+        reload=config.server_reload,
+        timeout_graceful_shutdown=config.server_graceful_shutdown_timeout,
+        access_log=config.server_access_log,
+        log_level="debug" if config.debug else "info",
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -1,8 +1,12 @@
 from fastapi import APIRouter
 
+from presentation.api.v1.admin.handlers import router as admin_router
+from presentation.api.v1.stats.handlers import router as stats_router
 from presentation.api.v1.url.handlers import router as url_router
 
 
 v1_router = APIRouter()
 
 v1_router.include_router(url_router)
+v1_router.include_router(admin_router)
+v1_router.include_router(stats_router)
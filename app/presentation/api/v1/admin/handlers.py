@@ -0,0 +1,53 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+
+from application.init import init_container
+from domain.services.hot_keys import HotKeys
+from presentation.api.auth import require_admin
+from presentation.api.responses import api_response
+from presentation.api.schemas import ApiResponse
+from presentation.api.v1.admin.schemas import HotKeysApiResponse
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get(
+    "/hot-keys",
+    status_code=status.HTTP_200_OK,
+    response_model=HotKeysApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": HotKeysApiResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ApiResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ApiResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
+    },
+)
+async def get_hot_keys(
+    limit: int = Query(default=20, ge=1, le=1000),
+    container=Depends(init_container),
+) -> ORJSONResponse:
+    """Most resolved short URLs of the worker that serves the request."""
+    hot_keys: HotKeys = container.resolve(HotKeys)
+
+    return api_response(
+        {
+            "hot_keys": [
+                {
+                    "short_url": short_url,
+                    "estimated_count": count,
+                    "pinned": hot_keys.is_pinned(short_url),
+                }
+                for short_url, count in hot_keys.top(limit)
+            ],
+        },
+    )
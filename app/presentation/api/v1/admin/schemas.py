@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from presentation.api.schemas import ApiResponse
+
+
+class HotKeySchema(BaseModel):
+    short_url: str
+    # Decayed Count-Min estimate, an upper bound of recent resolves
+    estimated_count: int
+    pinned: bool
+
+
+class HotKeysResponseSchema(BaseModel):
+    hot_keys: list[HotKeySchema]
+
+
+HotKeysApiResponse = ApiResponse[HotKeysResponseSchema]
@@ -0,0 +1,57 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+
+from application.init import init_container
+from application.mediator import Mediator
+from application.queries.stats import GetTopLinksQuery
+from presentation.api.auth import require_admin
+from presentation.api.responses import api_response
+from presentation.api.schemas import ApiResponse
+from presentation.api.v1.stats.schemas import TopLinksApiResponse
+from settings.config import Config
+
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "/top-links",
+    status_code=status.HTTP_200_OK,
+    response_model=TopLinksApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": TopLinksApiResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ApiResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ApiResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
+    },
+    dependencies=[Depends(require_admin)],
+)
+async def get_top_links(
+    limit: int = Query(default=10, ge=1, le=100),
+    container=Depends(init_container),
+) -> ORJSONResponse:
+    """Most clicked short URLs of all time, for administrators only."""
+    config: Config = container.resolve(Config)
+    if not config.link_stats_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Link statistics are disabled",
+        )
+
+    mediator: Mediator = container.resolve(Mediator)
+    top_links = await mediator.handle_query(GetTopLinksQuery(limit=limit))
+
+    return api_response(
+        {
+            "links": [
+                {"short_url": short_url, "clicks": clicks}
+                for short_url, clicks in top_links
+            ],
+        },
+    )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from presentation.api.schemas import ApiResponse
+
+
+class TopLinkSchema(BaseModel):
+    short_url: str
+    clicks: int
+
+
+class TopLinksResponseSchema(BaseModel):
+    links: list[TopLinkSchema]
+
+
+TopLinksApiResponse = ApiResponse[TopLinksResponseSchema]
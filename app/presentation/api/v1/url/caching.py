@@ -0,0 +1,46 @@
+import hashlib
+
+from settings.config import Config
+
+
+def get_etag(long_url: str, variant: str) -> str:
+    """Strong ETag of a resolve response.
+
+    The pair never changes once created, so the tag only depends on the
+    stored target and the representation (JSON body or redirect), and is
+    the same on every worker and every CDN node.
+
+    """
+    digest = hashlib.blake2b(long_url.encode(), digest_size=12).hexdigest()
+    return f'"{variant}-{digest}"'
+
+
+def get_cache_control(config: Config) -> str:
+    max_age = config.resolve_cache_max_age
+    shared_max_age = config.resolve_cache_shared_max_age
+
+    if max_age <= 0 and shared_max_age <= 0:
+        return "no-cache"
+
+    directives = ["public", f"max-age={max(max_age, 0)}"]
+    if shared_max_age > 0:
+        directives.append(f"s-maxage={shared_max_age}")
+    # Links can not be edited or deleted, a fresh copy never needs revalidation
+    if max_age > 0:
+        directives.append("immutable")
+
+    return ", ".join(directives)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` uses the weak comparison (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
@@ -1,66 +1,318 @@
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+    timezone,
+)
+
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
     status,
 )
+from fastapi.responses import (
+    ORJSONResponse,
+    RedirectResponse,
+)
+
+from punq import Container
 
 from application.commands.url import CreateShortURLCommand
 from application.init import init_container
+from application.interfaces.clicks import (
+    BaseClickStats,
+    Granularity,
+)
+from application.interfaces.visitors import BaseVisitorCounter
 from application.mediator import Mediator
-from application.queries.url import GetLongURLQuery
+from application.queries.stats import (
+    GetLinkStatsQuery,
+    GetUniqueVisitorsQuery,
+    MAX_SERIES_RANGE_DAYS,
+)
+from application.queries.url import (
+    CheckAliasAvailabilityQuery,
+    GetLongURLQuery,
+)
+from presentation.api.auth import consume_quota
+from presentation.api.responses import api_response
 from presentation.api.schemas import ApiResponse
+from presentation.api.v1.url.caching import (
+    etag_matches,
+    get_cache_control,
+    get_etag,
+)
 from presentation.api.v1.url.schemas import (
+    AliasAvailabilityApiResponse,
+    CreateShortURLApiResponse,
     CreateShortURLRequestSchema,
-    CreateShortURLResponseSchema,
-    GetLongURLResponseSchema,
+    GetLongURLApiResponse,
+    LinkStatsApiResponse,
+    UniqueVisitorsApiResponse,
 )
+from presentation.api.v1.url.visitors import get_visitor_fingerprint
+from settings.config import Config
 
 
 router = APIRouter(prefix="/urls", tags=["urls"])
 
 
+async def resolve_long_url(
+    request: Request,
+    container: Container,
+    short_url: str,
+) -> str:
+    # A warm query cache answers conditional requests without storage
+    mediator: Mediator = container.resolve(Mediator)
+    long_url = await mediator.handle_query(GetLongURLQuery(short_url=short_url))
+
+    config: Config = container.resolve(Config)
+    if config.link_stats_enabled:
+        click_stats: BaseClickStats = container.resolve(BaseClickStats)
+        click_stats.record(short_url)
+
+    if config.unique_visitors_enabled:
+        visitor_counter: BaseVisitorCounter = container.resolve(BaseVisitorCounter)
+        visitor_counter.record(
+            short_url,
+            get_visitor_fingerprint(request, config.rate_limit_forwarded_hops),
+        )
+
+    return long_url
+
+
+def get_cache_headers(
+    container: Container,
+    long_url: str,
+    variant: str,
+) -> dict[str, str]:
+    config: Config = container.resolve(Config)
+    return {
+        "Cache-Control": get_cache_control(config),
+        "ETag": get_etag(long_url, variant),
+    }
+
+
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
-    response_model=ApiResponse[CreateShortURLResponseSchema],
+    response_model=CreateShortURLApiResponse,
     responses={
-        status.HTTP_201_CREATED: {"model": ApiResponse[CreateShortURLResponseSchema]},
+        status.HTTP_201_CREATED: {"model": CreateShortURLApiResponse},
         status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ApiResponse},
+        status.HTTP_409_CONFLICT: {"model": ApiResponse},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": ApiResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ApiResponse},
     },
+    dependencies=[Depends(consume_quota)],
 )
 async def create_short_url(
     request: CreateShortURLRequestSchema,
     container=Depends(init_container),
-) -> ApiResponse[CreateShortURLResponseSchema]:
+) -> ORJSONResponse:
     mediator: Mediator = container.resolve(Mediator)
-    command = CreateShortURLCommand(long_url=request.long_url)
+    command = CreateShortURLCommand(
+        long_url=request.long_url,
+        alias=request.alias,
+    )
 
     results = await mediator.handle_command(command)
     short_url = results[0]
 
-    return ApiResponse[CreateShortURLResponseSchema](
-        data=CreateShortURLResponseSchema(short_url=short_url),
+    return api_response(
+        {"short_url": short_url},
+        status_code=status.HTTP_201_CREATED,
     )
 
 
 @router.get(
     "/{short_url}",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[GetLongURLResponseSchema],
+    response_model=GetLongURLApiResponse,
     responses={
-        status.HTTP_200_OK: {"model": ApiResponse[GetLongURLResponseSchema]},
+        status.HTTP_200_OK: {"model": GetLongURLApiResponse},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
         status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ApiResponse},
     },
 )
 async def get_long_url(
+    request: Request,
+    short_url: str,
+    if_none_match: str | None = Header(default=None),
+    container=Depends(init_container),
+) -> Response:
+    long_url = await resolve_long_url(request, container, short_url)
+
+    cache_headers = get_cache_headers(container, long_url, "json")
+    if etag_matches(if_none_match, cache_headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=cache_headers,
+        )
+
+    response = api_response({"long_url": long_url})
+    response.headers.update(cache_headers)
+    return response
+
+
+@router.get(
+    "/{short_url}/redirect",
+    response_class=RedirectResponse,
+    responses={
+        status.HTTP_301_MOVED_PERMANENTLY: {"description": "Redirect to the long URL"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached copy is current"},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ApiResponse},
+    },
+)
+async def redirect_to_long_url(
+    request: Request,
+    short_url: str,
+    if_none_match: str | None = Header(default=None),
+    container=Depends(init_container),
+) -> Response:
+    long_url = await resolve_long_url(request, container, short_url)
+
+    cache_headers = get_cache_headers(container, long_url, "redirect")
+    if etag_matches(if_none_match, cache_headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=cache_headers,
+        )
+
+    config: Config = container.resolve(Config)
+    return RedirectResponse(
+        long_url,
+        status_code=config.resolve_redirect_status,
+        headers=cache_headers,
+    )
+
+
+@router.get(
+    "/aliases/{alias}/availability",
+    status_code=status.HTTP_200_OK,
+    response_model=AliasAvailabilityApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": AliasAvailabilityApiResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+    },
+)
+async def check_alias_availability(
+    alias: str,
+    container=Depends(init_container),
+) -> ORJSONResponse:
+    mediator: Mediator = container.resolve(Mediator)
+    query = CheckAliasAvailabilityQuery(alias=alias)
+
+    available = await mediator.handle_query(query)
+
+    return api_response({"alias": alias, "available": available})
+
+
+@router.get(
+    "/{short_url}/visitors",
+    status_code=status.HTTP_200_OK,
+    response_model=UniqueVisitorsApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": UniqueVisitorsApiResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
+    },
+)
+async def get_unique_visitors(
     short_url: str,
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
     container=Depends(init_container),
-) -> ApiResponse[GetLongURLResponseSchema]:
+) -> ORJSONResponse:
+    """Approximate distinct visitors (standard error 0.81%) between two UTC
+    days, inclusive. Defaults to the last 30 days."""
+    config: Config = container.resolve(Config)
+    if not config.unique_visitors_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unique visitor counting is disabled",
+        )
+
+    date_to = date_to or datetime.now(timezone.utc).date()
+    date_from = date_from or date_to - timedelta(days=29)
+
     mediator: Mediator = container.resolve(Mediator)
-    query = GetLongURLQuery(short_url=short_url)
+    unique_visitors = await mediator.handle_query(
+        GetUniqueVisitorsQuery(
+            short_url=short_url,
+            date_from=date_from,
+            date_to=date_to,
+        ),
+    )
+
+    return api_response(
+        {
+            "short_url": short_url,
+            "date_from": date_from,
+            "date_to": date_to,
+            "unique_visitors": unique_visitors,
+        },
+    )
+
+
+@router.get(
+    "/{short_url}/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=LinkStatsApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": LinkStatsApiResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
+    },
+)
+async def get_link_stats(
+    short_url: str,
+    granularity: Granularity = Query(default="day"),
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    container=Depends(init_container),
+) -> ORJSONResponse:
+    """Clicks per UTC minute, hour or day between two UTC days, inclusive.
+    Defaults to the longest range allowed for the granularity, up to 30
+    days."""
+    config: Config = container.resolve(Config)
+    if not config.link_stats_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Link statistics are disabled",
+        )
+
+    date_to = date_to or datetime.now(timezone.utc).date()
+    default_days = min(MAX_SERIES_RANGE_DAYS[granularity], 30)
+    date_from = date_from or date_to - timedelta(days=default_days - 1)
 
-    long_url = await mediator.handle_query(query)
+    mediator: Mediator = container.resolve(Mediator)
+    series = await mediator.handle_query(
+        GetLinkStatsQuery(
+            short_url=short_url,
+            granularity=granularity,
+            date_from=date_from,
+            date_to=date_to,
+        ),
+    )
 
-    return ApiResponse[GetLongURLResponseSchema](
-        data=GetLongURLResponseSchema(long_url=long_url),
+    return api_response(
+        {
+            "short_url": short_url,
+            "granularity": granularity,
+            "date_from": date_from,
+            "date_to": date_to,
+            "total_clicks": sum(count.clicks for count in series),
+            "series": [
+                {"bucket": count.bucket, "clicks": count.clicks} for count in series
+            ],
+        },
     )
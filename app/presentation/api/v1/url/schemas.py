@@ -1,8 +1,17 @@
+from datetime import (
+    date,
+    datetime,
+)
+
 from pydantic import BaseModel
 
+from application.interfaces.clicks import Granularity
+from presentation.api.schemas import ApiResponse
+
 
 class CreateShortURLRequestSchema(BaseModel):
     long_url: str
+    alias: str | None = None
 
 
 class CreateShortURLResponseSchema(BaseModel):
@@ -11,3 +20,37 @@ class CreateShortURLResponseSchema(BaseModel):
 
 class GetLongURLResponseSchema(BaseModel):
     long_url: str
+
+
+class AliasAvailabilityResponseSchema(BaseModel):
+    alias: str
+    available: bool
+
+
+class UniqueVisitorsResponseSchema(BaseModel):
+    short_url: str
+    date_from: date
+    date_to: date
+    unique_visitors: int
+
+
+class ClickCountSchema(BaseModel):
+    # Start of the bucket, UTC
+    bucket: datetime
+    clicks: int
+
+
+class LinkStatsResponseSchema(BaseModel):
+    short_url: str
+    granularity: Granularity
+    date_from: date
+    date_to: date
+    total_clicks: int
+    series: list[ClickCountSchema]
+
+
+CreateShortURLApiResponse = ApiResponse[CreateShortURLResponseSchema]
+GetLongURLApiResponse = ApiResponse[GetLongURLResponseSchema]
+AliasAvailabilityApiResponse = ApiResponse[AliasAvailabilityResponseSchema]
+UniqueVisitorsApiResponse = ApiResponse[UniqueVisitorsResponseSchema]
+LinkStatsApiResponse = ApiResponse[LinkStatsResponseSchema]
@@ -0,0 +1,17 @@
+import hashlib
+
+from fastapi import Request
+
+from presentation.api.middleware.ratelimit import get_client_ip
+
+
+def get_visitor_fingerprint(request: Request, forwarded_hops: int) -> str:
+    """Client IP and user agent, hashed: only the digest reaches Redis, and
+    HyperLogLog keeps not even that."""
+    client_ip = get_client_ip(request.scope, forwarded_hops)
+    user_agent = request.headers.get("user-agent", "")
+
+    return hashlib.blake2b(
+        f"{client_ip}\0{user_agent}".encode(),
+        digest_size=8,
+    ).hexdigest()
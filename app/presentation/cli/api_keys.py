@@ -0,0 +1,107 @@
+"""Issue and revoke API keys and JWTs.
+
+Run from ``app/``::
+
+    python -m presentation.cli.api_keys create --name partner --quota 1000
+    python -m presentation.cli.api_keys revoke 3f2a9c01b7de
+    python -m presentation.cli.api_keys token partner-service --expires 3600
+
+Keys are stored in Postgres, the memory and SQLite backends keep them per
+process only, so use JWTs there.
+
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import timedelta
+
+from authx import (
+    AuthX,
+    AuthXConfig,
+)
+from redis.asyncio import Redis
+
+from application.init import init_container
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    generate_api_key,
+)
+from infrastructure.database.gateways.postgres import Database
+from settings.config import Config
+
+
+async def create_key(args: argparse.Namespace) -> None:
+    container = init_container()
+    token, api_key = generate_api_key(name=args.name, quota=args.quota)
+
+    await container.resolve(BaseAPIKeyRepository).add(api_key)
+
+    # The token is not stored anywhere, it can not be shown again
+    print(f"prefix: {api_key.prefix}")
+    print(f"token:  {token}")
+
+
+async def revoke_key(args: argparse.Namespace) -> None:
+    container = init_container()
+
+    if not await container.resolve(BaseAPIKeyRepository).revoke(args.prefix):
+        sys.exit(f"No active key with prefix {args.prefix}")
+
+    authenticator: Authenticator = container.resolve(Authenticator)
+    await authenticator.revoke(f"key:{args.prefix}")
+    print(f"Revoked {args.prefix}")
+
+
+async def issue_token(args: argparse.Namespace) -> None:
+    config: Config = init_container().resolve(Config)
+    if not config.auth_jwt_secret:
+        sys.exit("AUTH_JWT_SECRET is not set")
+
+    auth = AuthX(config=AuthXConfig(JWT_SECRET_KEY=config.auth_jwt_secret))
+    data = {"quota": args.quota} if args.quota is not None else None
+    print(
+        auth.create_access_token(
+            uid=args.subject,
+            expiry=timedelta(seconds=args.expires),
+            data=data,
+        ),
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    try:
+        await args.command(args)
+    finally:
+        container = init_container()
+        if container.resolve(Config).url_repository_backend == "postgres":
+            await container.resolve(Database).dispose()
+            await container.resolve(Redis).aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(required=True)
+
+    create = commands.add_parser("create", help="Create an API key")
+    create.add_argument("--name", required=True)
+    create.add_argument("--quota", type=int, help="Short URLs a day")
+    create.set_defaults(command=create_key)
+
+    revoke = commands.add_parser("revoke", help="Revoke an API key")
+    revoke.add_argument("prefix")
+    revoke.set_defaults(command=revoke_key)
+
+    token = commands.add_parser("token", help="Issue a JWT")
+    token.add_argument("subject")
+    token.add_argument("--expires", type=int, default=3600, help="Seconds")
+    token.add_argument("--quota", type=int, help="Short URLs a day")
+    token.set_defaults(command=issue_token)
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Export the url table to a lookup file for the "lookup" backend.
+
+Run from ``app/``::
+
+    python -m presentation.cli.export_lookup
+    python -m presentation.cli.export_lookup --output /srv/edge/urls.lookup
+
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from application.init import init_container
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.lookup.exporter import LookupFileExporter
+from settings.config import Config
+
+
+async def run(args: argparse.Namespace) -> None:
+    container = init_container()
+    config: Config = container.resolve(Config)
+    database: Database = container.resolve(Database)
+    exporter = LookupFileExporter(database=database, batch_size=args.batch_size)
+    output = args.output or config.lookup_file_path
+
+    started_at = time.perf_counter()
+    try:
+        count = await exporter.export(output)
+    finally:
+        await database.dispose()
+
+    print(
+        f"Exported {count} pairs to {output} "
+        f"({output.stat().st_size} bytes, {time.perf_counter() - started_at:.1f} s)",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Defaults to LOOKUP_FILE_PATH")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Run the scheduled jobs in a process of their own.
+
+Run from ``app/``::
+
+    python -m presentation.cli.worker
+    python -m presentation.cli.worker --metrics-port 9100
+
+Set ``SCHEDULER_ENABLED=false`` for the API when a worker runs the jobs.
+Several workers can run side by side, each run of a job is claimed by one
+of them.
+
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from application.init import init_container
+from infrastructure.scheduler.scheduler import Scheduler
+from presentation.api.lifespan import close_resources
+
+
+logger = logging.getLogger(__name__)
+
+
+async def run(args: argparse.Namespace) -> None:
+    container = init_container()
+    scheduler: Scheduler = container.resolve(Scheduler)
+    if not scheduler.jobs:
+        logger.warning("No jobs are enabled, exiting")
+        return
+
+    if args.metrics_port:
+        start_http_server(args.metrics_port)
+
+    # SIGTERM (docker stop) cancels the running jobs like Ctrl+C does
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, task.cancel)
+
+    logger.info("Running jobs: %s", ", ".join(job.name for job in scheduler.jobs))
+    try:
+        await scheduler.run()
+    except asyncio.CancelledError:
+        logger.info("Stopping")
+    finally:
+        await close_resources(container)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=0,
+        help="Serve Prometheus metrics on this port, disabled by default",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
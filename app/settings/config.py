@@ -1,6 +1,10 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic import (
     computed_field,
     Field,
+    model_validator,
 )
 from pydantic_settings import (
     BaseSettings,
@@ -9,6 +13,60 @@ from pydantic_settings import (
 
 
 class Config(BaseSettings):
+    debug: bool = Field(
+        default=False,
+        alias="DEBUG",
+    )
+
+    server_host: str = Field(
+        default="0.0.0.0",
+        alias="SERVER_HOST",
+    )
+
+    server_port: int = Field(
+        default=8000,
+        alias="SERVER_PORT",
+    )
+
+    # 0 means one worker per CPU core, or a single one with a store that
+    # lives in the process (memory, SQLite ":memory:")
+    server_workers: int = Field(
+        default=0,
+        alias="SERVER_WORKERS",
+    )
+
+    server_loop: str = Field(
+        default="uvloop",
+        alias="SERVER_LOOP",
+    )
+
+    server_http: str = Field(
+        default="httptools",
+        alias="SERVER_HTTP",
+    )
+
+    server_graceful_shutdown_timeout: int = Field(
+        default=30,
+        alias="SERVER_GRACEFUL_SHUTDOWN_TIMEOUT",
+    )
+
+    server_access_log: bool = Field(
+        default=False,
+        alias="SERVER_ACCESS_LOG",
+    )
+
+    server_reload: bool = Field(
+        default=False,
+        alias="SERVER_RELOAD",
+    )
+
+    # Shared by all workers for metric aggregation; a temporary directory is
+    # created when unset
+    prometheus_multiproc_dir: str | None = Field(
+        default=None,
+        alias="PROMETHEUS_MULTIPROC_DIR",
+    )
+
     postgres_db: str = Field(
         default="url_shortener",
         alias="POSTGRES_DB",
@@ -34,6 +92,34 @@ class Config(BaseSettings):
         alias="POSTGRES_HOST",
     )
 
+    postgres_pool_size: int = Field(
+        default=10,
+        alias="POSTGRES_POOL_SIZE",
+    )
+
+    postgres_max_overflow: int = Field(
+        default=10,
+        alias="POSTGRES_MAX_OVERFLOW",
+    )
+
+    # Read-only engine host (a streaming replica), the primary when unset
+    postgres_read_only_host: str | None = Field(
+        default=None,
+        alias="POSTGRES_READ_ONLY_HOST",
+    )
+
+    # Consecutive connection failures before reads move to the primary
+    postgres_read_only_breaker_failure_threshold: int = Field(
+        default=5,
+        alias="POSTGRES_READ_ONLY_BREAKER_FAILURE_THRESHOLD",
+    )
+
+    # Seconds before the replica is probed again
+    postgres_read_only_breaker_reset_timeout: float = Field(
+        default=10.0,
+        alias="POSTGRES_READ_ONLY_BREAKER_RESET_TIMEOUT",
+    )
+
     redis_port: int = Field(
         default=6379,
         alias="REDIS_PORT",
@@ -44,6 +130,383 @@ class Config(BaseSettings):
         alias="REDIS_HOST",
     )
 
+    redis_max_connections: int = Field(
+        default=50,
+        alias="REDIS_MAX_CONNECTIONS",
+    )
+
+    # Consecutive failed or slow cache calls before Redis is bypassed
+    redis_breaker_failure_threshold: int = Field(
+        default=5,
+        alias="REDIS_BREAKER_FAILURE_THRESHOLD",
+    )
+
+    # Seconds before a bypassed Redis is probed again
+    redis_breaker_reset_timeout: float = Field(
+        default=5.0,
+        alias="REDIS_BREAKER_RESET_TIMEOUT",
+    )
+
+    # A cache call taking longer counts as failed
+    redis_breaker_call_timeout: float = Field(
+        default=0.25,
+        alias="REDIS_BREAKER_CALL_TIMEOUT",
+    )
+
+    # Concurrent Postgres lookups per worker while Redis is bypassed
+    redis_fallback_concurrency: int = Field(
+        default=20,
+        alias="REDIS_FALLBACK_CONCURRENCY",
+    )
+
+    # "postgres" (Postgres + Redis cache), "memory" or "sqlite" (single node,
+    # no external storage), "lookup" (read-only exported lookup file)
+    url_repository_backend: Literal["postgres", "memory", "sqlite", "lookup"] = Field(
+        default="postgres",
+        alias="URL_REPOSITORY_BACKEND",
+    )
+
+    # The memory backend loads this file on startup and rewrites it on
+    # shutdown
+    memory_snapshot_path: Path | None = Field(
+        default=None,
+        alias="MEMORY_SNAPSHOT_PATH",
+    )
+
+    sqlite_path: Path = Field(
+        default=Path("url_shortener.db"),
+        alias="SQLITE_PATH",
+    )
+
+    sqlite_mmap_size: int = Field(
+        default=256 * 1024 * 1024,
+        alias="SQLITE_MMAP_SIZE",
+    )
+
+    # Edge replica: creation is rejected, pairs come from the change stream
+    sqlite_read_only: bool = Field(
+        default=False,
+        alias="SQLITE_READ_ONLY",
+    )
+
+    # Written by the lookup file export, served by the "lookup" backend
+    lookup_file_path: Path = Field(
+        default=Path("urls.lookup"),
+        alias="LOOKUP_FILE_PATH",
+    )
+
+    # Postgres backend only: acknowledge creation once the pair is queued in
+    # Redis and insert it into Postgres in background batches
+    write_behind_enabled: bool = Field(
+        default=False,
+        alias="WRITE_BEHIND_ENABLED",
+    )
+
+    write_behind_stream: str = Field(
+        default="url_writes",
+        alias="WRITE_BEHIND_STREAM",
+    )
+
+    write_behind_batch_size: int = Field(
+        default=500,
+        alias="WRITE_BEHIND_BATCH_SIZE",
+    )
+
+    # Write url_outbox rows and publish them to the change stream (every
+    # node that creates links on the postgres backend)
+    changefeed_relay_enabled: bool = Field(
+        default=False,
+        alias="CHANGEFEED_RELAY_ENABLED",
+    )
+
+    # Apply the change stream to the local repository (memory/sqlite replicas)
+    changefeed_consumer_enabled: bool = Field(
+        default=False,
+        alias="CHANGEFEED_CONSUMER_ENABLED",
+    )
+
+    changefeed_stream: str = Field(
+        default="url_changes",
+        alias="CHANGEFEED_STREAM",
+    )
+
+    changefeed_batch_size: int = Field(
+        default=500,
+        alias="CHANGEFEED_BATCH_SIZE",
+    )
+
+    changefeed_stream_max_length: int = Field(
+        default=1_000_000,
+        alias="CHANGEFEED_STREAM_MAX_LENGTH",
+    )
+
+    changefeed_poll_interval: float = Field(
+        default=0.5,
+        alias="CHANGEFEED_POLL_INTERVAL",
+    )
+
+    warmup_enabled: bool = Field(
+        default=True,
+        alias="WARMUP_ENABLED",
+    )
+
+    # Number of most recently created links loaded into the cache on startup
+    warmup_preload_codes: int = Field(
+        default=0,
+        alias="WARMUP_PRELOAD_CODES",
+    )
+
+    # Run independent handlers of one command concurrently
+    mediator_concurrent_commands: bool = Field(
+        default=False,
+        alias="MEDIATOR_CONCURRENT_COMMANDS",
+    )
+
+    query_cache_enabled: bool = Field(
+        default=True,
+        alias="QUERY_CACHE_ENABLED",
+    )
+
+    # Entries kept by the in-process query cache before LRU eviction
+    query_cache_max_size: int = Field(
+        default=10_000,
+        alias="QUERY_CACHE_MAX_SIZE",
+    )
+
+    # Count distinct visitors per code and day in Redis HyperLogLogs
+    unique_visitors_enabled: bool = Field(
+        default=False,
+        alias="UNIQUE_VISITORS_ENABLED",
+    )
+
+    # Seconds between PFADD batches
+    unique_visitors_flush_interval: float = Field(
+        default=1.0,
+        alias="UNIQUE_VISITORS_FLUSH_INTERVAL",
+    )
+
+    unique_visitors_retention_days: int = Field(
+        default=400,
+        alias="UNIQUE_VISITORS_RETENTION_DAYS",
+    )
+
+    # Fingerprints buffered per worker between flushes
+    unique_visitors_max_buffered: int = Field(
+        default=100_000,
+        alias="UNIQUE_VISITORS_MAX_BUFFERED",
+    )
+
+    # Count resolves per code in Postgres minute/hour/day rollups
+    link_stats_enabled: bool = Field(
+        default=False,
+        alias="LINK_STATS_ENABLED",
+    )
+
+    # Seconds between rollup upserts
+    link_stats_flush_interval: float = Field(
+        default=1.0,
+        alias="LINK_STATS_FLUSH_INTERVAL",
+    )
+
+    # Code and minute counters buffered per worker between flushes
+    link_stats_max_buffered: int = Field(
+        default=100_000,
+        alias="LINK_STATS_MAX_BUFFERED",
+    )
+
+    # Minute rows older than this are compacted into hours
+    link_stats_minute_retention_hours: int = Field(
+        default=48,
+        alias="LINK_STATS_MINUTE_RETENTION_HOURS",
+    )
+
+    # Hour rows older than this are compacted into days
+    link_stats_hour_retention_days: int = Field(
+        default=35,
+        alias="LINK_STATS_HOUR_RETENTION_DAYS",
+    )
+
+    link_stats_compaction_interval: float = Field(
+        default=300.0,
+        alias="LINK_STATS_COMPACTION_INTERVAL",
+    )
+
+    # Run the scheduled jobs in the API workers; disable when a standalone
+    # worker (presentation.cli.worker) runs them
+    scheduler_enabled: bool = Field(
+        default=True,
+        alias="SCHEDULER_ENABLED",
+    )
+
+    # Upper bound of the random delay of each worker before a job run
+    scheduler_jitter: float = Field(
+        default=5.0,
+        alias="SCHEDULER_JITTER",
+    )
+
+    # Reload the WARMUP_PRELOAD_CODES newest links into the cache on this
+    # cron schedule (UTC), e.g. "*/15 * * * *"
+    cache_refresh_cron: str | None = Field(
+        default=None,
+        alias="CACHE_REFRESH_CRON",
+    )
+
+    # Track the most resolved codes per worker and pin them in memory
+    hot_keys_enabled: bool = Field(
+        default=True,
+        alias="HOT_KEYS_ENABLED",
+    )
+
+    # Codes tracked (and at most pinned) per worker
+    hot_keys_size: int = Field(
+        default=100,
+        alias="HOT_KEYS_SIZE",
+    )
+
+    # Resolves per refresh interval (decayed) before a code is pinned
+    hot_keys_min_count: int = Field(
+        default=10,
+        alias="HOT_KEYS_MIN_COUNT",
+    )
+
+    hot_keys_refresh_interval: float = Field(
+        default=10.0,
+        alias="HOT_KEYS_REFRESH_INTERVAL",
+    )
+
+    # Browser cache lifetime of resolve responses, 0 makes clients revalidate
+    resolve_cache_max_age: int = Field(
+        default=3600,
+        alias="RESOLVE_CACHE_MAX_AGE",
+    )
+
+    # CDN / shared cache lifetime (s-maxage), links never change once created
+    resolve_cache_shared_max_age: int = Field(
+        default=86_400,
+        alias="RESOLVE_CACHE_SHARED_MAX_AGE",
+    )
+
+    resolve_redirect_status: Literal[301, 302, 307, 308] = Field(
+        default=301,
+        alias="RESOLVE_REDIRECT_STATUS",
+    )
+
+    rate_limit_enabled: bool = Field(
+        default=False,
+        alias="RATE_LIMIT_ENABLED",
+    )
+
+    # Requests per window per client (verified subject or IP) for
+    # POST /api/v1/urls
+    rate_limit_create_requests: int = Field(
+        default=30,
+        alias="RATE_LIMIT_CREATE_REQUESTS",
+    )
+
+    rate_limit_create_window: float = Field(
+        default=60.0,
+        alias="RATE_LIMIT_CREATE_WINDOW",
+    )
+
+    # Requests per window per client for GET /api/v1/urls/...
+    rate_limit_resolve_requests: int = Field(
+        default=600,
+        alias="RATE_LIMIT_RESOLVE_REQUESTS",
+    )
+
+    rate_limit_resolve_window: float = Field(
+        default=60.0,
+        alias="RATE_LIMIT_RESOLVE_WINDOW",
+    )
+
+    # Trusted proxies in front of the service: the client IP is taken from
+    # X-Forwarded-For that many entries from the right, 0 ignores the header
+    rate_limit_forwarded_hops: int = Field(
+        default=0,
+        ge=0,
+        alias="RATE_LIMIT_FORWARDED_HOPS",
+    )
+
+    # Require an API key or a JWT to create short URLs
+    auth_enabled: bool = Field(
+        default=False,
+        alias="AUTH_ENABLED",
+    )
+
+    # HS256 secret for bearer JWTs, JWTs are rejected when empty
+    auth_jwt_secret: str | None = Field(
+        default=None,
+        alias="AUTH_JWT_SECRET",
+    )
+
+    # Seconds a verified key or token is trusted without checking it again
+    auth_cache_ttl: float = Field(
+        default=300.0,
+        alias="AUTH_CACHE_TTL",
+    )
+
+    # Seconds a failed verification is remembered, 0 disables
+    auth_negative_cache_ttl: float = Field(
+        default=10.0,
+        alias="AUTH_NEGATIVE_CACHE_TTL",
+    )
+
+    auth_cache_max_size: int = Field(
+        default=10_000,
+        alias="AUTH_CACHE_MAX_SIZE",
+    )
+
+    # Short URLs a day per key or JWT subject without a quota of its own
+    auth_default_quota: int | None = Field(
+        default=None,
+        alias="AUTH_DEFAULT_QUOTA",
+    )
+
+    auth_revocation_channel: str = Field(
+        default="auth:revocations",
+        alias="AUTH_REVOCATION_CHANNEL",
+    )
+
+    # Principals allowed to call /admin: "key:<prefix>" of an API key or
+    # "jwt:<sub>" of a token
+    auth_admin_subjects: list[str] = Field(
+        default_factory=list,
+        alias="AUTH_ADMIN_SUBJECTS",
+    )
+
+    apm_enabled: bool = Field(
+        default=True,
+        alias="ELASTIC_APM_ENABLED",
+    )
+
+    # Path prefixes served without APM instrumentation
+    apm_excluded_paths: list[str] = Field(
+        default_factory=lambda: ["/healthcheck", "/metrics"],
+        alias="APM_EXCLUDED_PATHS",
+    )
+
+    readiness_probe_timeout: float = Field(
+        default=0.5,
+        alias="READINESS_PROBE_TIMEOUT",
+    )
+
+    readiness_cache_ttl: float = Field(
+        default=2.0,
+        alias="READINESS_CACHE_TTL",
+    )
+
+    # Dependencies that do not fail the readiness probe, e.g.
+    # ["redis", "postgres_read_only"] to keep serving through the breakers
+    readiness_optional_dependencies: list[str] = Field(
+        default_factory=list,
+        alias="READINESS_OPTIONAL_DEPENDENCIES",
+    )
+
+    alias_blocklist: list[str] = Field(
+        default_factory=list,
+        alias="ALIAS_BLOCKLIST",
+    )
+
     @computed_field
     @property
     def postgres_connection_uri(self) -> str:
@@ -51,6 +514,42 @@ class Config(BaseSettings):
         engine."""
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    @computed_field
+    @property
+    def postgres_read_only_connection_uri(self) -> str:
+        host = self.postgres_read_only_host or self.postgres_host
+        return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{host}:{self.postgres_port}/{self.postgres_db}"
+
+    @property
+    def process_local_url_store(self) -> bool:
+        """Every worker process gets its own copy of the pairs."""
+        return self.url_repository_backend == "memory" or (
+            self.url_repository_backend == "sqlite"
+            and str(self.sqlite_path) == ":memory:"
+        )
+
+    @model_validator(mode="after")
+    def check_server_workers(self) -> "Config":
+        if self.server_workers > 1 and self.process_local_url_store:
+            raise ValueError(
+                "SERVER_WORKERS must be 1 with the memory backend or an "
+                "in-memory SQLite database, a link created on one worker "
+                "would be missing on the others",
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_replica_backend(self) -> "Config":
+        if self.changefeed_consumer_enabled and self.url_repository_backend not in (
+            "memory",
+            "sqlite",
+        ):
+            raise ValueError(
+                "CHANGEFEED_CONSUMER_ENABLED requires the memory or sqlite "
+                "URL repository backend",
+            )
+        return self
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
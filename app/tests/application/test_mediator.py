@@ -0,0 +1,196 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import pytest
+
+from application.behaviors.base import BaseBehavior
+from application.behaviors.retry import (
+    retries,
+    RetryBehavior,
+)
+from application.behaviors.timing import TimingBehavior
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.exceptions.mediator import (
+    CommandHandlersNotRegisteredException,
+    QueryHandlerNotRegisteredException,
+)
+from application.interfaces.timing import BaseHandlerTimer
+from application.mediator import Mediator
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+
+
+@dataclass(frozen=True)
+class PingCommand(BaseCommand):
+    value: str
+
+
+@dataclass(frozen=True)
+class PingQuery(BaseQuery):
+    value: str
+
+
+@retries(ConnectionError, attempts=3, delay=0)
+@dataclass(frozen=True)
+class FlakyQuery(BaseQuery):
+    failures: int
+
+
+@dataclass(frozen=True)
+class SlowPingCommandHandler(BaseCommandHandler[PingCommand, str]):
+    delay: float
+    events: list = field(default_factory=list)
+
+    async def handle(self, command: PingCommand) -> str:
+        self.events.append(f"start:{self.delay}")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"end:{self.delay}")
+        return f"{command.value}:{self.delay}"
+
+
+@dataclass(frozen=True)
+class PingQueryHandler(BaseQueryHandler[PingQuery, str]):
+    async def handle(self, query: PingQuery) -> str:
+        return query.value
+
+
+@dataclass(frozen=True)
+class FlakyQueryHandler(BaseQueryHandler[FlakyQuery, int]):
+    calls: list = field(default_factory=list)
+
+    async def handle(self, query: FlakyQuery) -> int:
+        self.calls.append(query)
+        if len(self.calls) <= query.failures:
+            raise ConnectionError
+        return len(self.calls)
+
+
+@dataclass
+class RecordingTimer(BaseHandlerTimer):
+    observations: list = field(default_factory=list)
+
+    def observe(self, kind, message, handler, outcome, duration) -> None:
+        self.observations.append((kind, message, handler, outcome))
+
+
+@dataclass(frozen=True)
+class RecordingBehavior(BaseBehavior):
+    name: str
+    events: list
+
+    async def handle(self, message, handler, call_next):
+        self.events.append(f"{self.name}:before")
+        result = await call_next(message)
+        self.events.append(f"{self.name}:after")
+        return result
+
+
+@pytest.mark.asyncio
+async def test_behaviors_wrap_handler_in_registration_order():
+    events = []
+    mediator = Mediator(
+        behaviors=[
+            RecordingBehavior(name="outer", events=events),
+            RecordingBehavior(name="inner", events=events),
+        ],
+    )
+    mediator.register_query(PingQuery, PingQueryHandler())
+
+    result = await mediator.handle_query(PingQuery(value="pong"))
+
+    assert result == "pong"
+    assert events == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+
+@pytest.mark.asyncio
+async def test_add_behavior_applies_to_registered_handlers():
+    events = []
+    mediator = Mediator()
+    mediator.register_query(PingQuery, PingQueryHandler())
+
+    mediator.add_behavior(RecordingBehavior(name="late", events=events))
+    await mediator.handle_query(PingQuery(value="pong"))
+
+    assert events == ["late:before", "late:after"]
+
+
+@pytest.mark.asyncio
+async def test_command_handlers_run_sequentially_by_default():
+    events = []
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SlowPingCommandHandler(delay=0.02, events=events),
+            SlowPingCommandHandler(delay=0.01, events=events),
+        ],
+    )
+
+    results = await mediator.handle_command(PingCommand(value="ping"))
+
+    assert results == ["ping:0.02", "ping:0.01"]
+    assert events == ["start:0.02", "end:0.02", "start:0.01", "end:0.01"]
+
+
+@pytest.mark.asyncio
+async def test_command_handlers_run_concurrently_when_enabled():
+    events = []
+    mediator = Mediator(concurrent_commands=True)
+    mediator.register_command(
+        PingCommand,
+        [
+            SlowPingCommandHandler(delay=0.02, events=events),
+            SlowPingCommandHandler(delay=0.01, events=events),
+        ],
+    )
+
+    results = await mediator.handle_command(PingCommand(value="ping"))
+
+    # Results keep the registration order even though handlers interleave
+    assert results == ["ping:0.02", "ping:0.01"]
+    assert events == ["start:0.02", "start:0.01", "end:0.01", "end:0.02"]
+
+
+@pytest.mark.asyncio
+async def test_unregistered_messages_raise():
+    mediator = Mediator()
+
+    with pytest.raises(CommandHandlersNotRegisteredException):
+        await mediator.handle_command(PingCommand(value="ping"))
+
+    with pytest.raises(QueryHandlerNotRegisteredException):
+        await mediator.handle_query(PingQuery(value="ping"))
+
+
+@pytest.mark.asyncio
+async def test_retried_query_times_every_attempt():
+    timer = RecordingTimer()
+    handler = FlakyQueryHandler()
+    mediator = Mediator(
+        behaviors=[RetryBehavior(), TimingBehavior(timer=timer)],
+    )
+    mediator.register_query(FlakyQuery, handler)
+
+    assert await mediator.handle_query(FlakyQuery(failures=2)) == 3
+    assert [outcome for *_, outcome in timer.observations] == ["error", "error", "ok"]
+    assert timer.observations[-1][:3] == ("query", "FlakyQuery", "FlakyQueryHandler")
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_after_the_last_attempt():
+    handler = FlakyQueryHandler()
+    mediator = Mediator(behaviors=[RetryBehavior()])
+    mediator.register_query(FlakyQuery, handler)
+
+    with pytest.raises(ConnectionError):
+        await mediator.handle_query(FlakyQuery(failures=3))
+
+    assert len(handler.calls) == 3
@@ -0,0 +1,174 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import pytest
+from faker import Faker
+
+from application.behaviors.caching import (
+    cached_query,
+    invalidates_cache,
+    QueryCacheBehavior,
+)
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.commands.url import CreateShortURLCommand
+from application.mediator import Mediator
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from application.queries.url import (
+    CheckAliasAvailabilityQuery,
+    GetLongURLQuery,
+)
+from infrastructure.cache.memory import InMemoryQueryCache
+
+
+@cached_query(key=lambda query: query.name, ttl=60)
+@dataclass(frozen=True)
+class GreetQuery(BaseQuery):
+    name: str
+
+
+@invalidates_cache(GreetQuery, key=lambda command, result: command.name)
+@dataclass(frozen=True)
+class RenameCommand(BaseCommand):
+    name: str
+
+
+@dataclass(frozen=True)
+class GreetQueryHandler(BaseQueryHandler[GreetQuery, str]):
+    calls: list = field(default_factory=list)
+    delay: float = 0
+
+    async def handle(self, query: GreetQuery) -> str:
+        self.calls.append(query.name)
+        await asyncio.sleep(self.delay)
+
+        if query.name == "error":
+            raise ValueError(query.name)
+
+        return f"hello {query.name} #{len(self.calls)}"
+
+
+@dataclass(frozen=True)
+class RenameCommandHandler(BaseCommandHandler[RenameCommand, None]):
+    async def handle(self, command: RenameCommand) -> None: ...
+
+
+def build_mediator(handler: GreetQueryHandler) -> Mediator:
+    mediator = Mediator(
+        behaviors=[QueryCacheBehavior(backends={"memory": InMemoryQueryCache()})],
+    )
+    mediator.register_query(GreetQuery, handler)
+    mediator.register_command(RenameCommand, [RenameCommandHandler()])
+    return mediator
+
+
+@pytest.mark.asyncio
+async def test_cached_query_reaches_handler_once():
+    handler = GreetQueryHandler()
+    mediator = build_mediator(handler)
+
+    first = await mediator.handle_query(GreetQuery(name="bob"))
+    second = await mediator.handle_query(GreetQuery(name="bob"))
+
+    assert first == second == "hello bob #1"
+    assert handler.calls == ["bob"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    handler = GreetQueryHandler(delay=0.01)
+    mediator = build_mediator(handler)
+
+    results = await asyncio.gather(
+        *(mediator.handle_query(GreetQuery(name="bob")) for _ in range(10)),
+    )
+
+    assert set(results) == {"hello bob #1"}
+    assert handler.calls == ["bob"]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_but_not_cached():
+    handler = GreetQueryHandler(delay=0.01)
+    mediator = build_mediator(handler)
+
+    results = await asyncio.gather(
+        mediator.handle_query(GreetQuery(name="error")),
+        mediator.handle_query(GreetQuery(name="error")),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert handler.calls == ["error"]
+
+    with pytest.raises(ValueError):
+        await mediator.handle_query(GreetQuery(name="error"))
+    assert handler.calls == ["error", "error"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_strand_waiters():
+    handler = GreetQueryHandler(delay=0.05)
+    mediator = build_mediator(handler)
+
+    leader = asyncio.create_task(mediator.handle_query(GreetQuery(name="bob")))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(mediator.handle_query(GreetQuery(name="bob")))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    # The waiter takes over instead of hanging on the abandoned call
+    assert await asyncio.wait_for(follower, timeout=1) == "hello bob #2"
+    assert leader.cancelled()
+    assert handler.calls == ["bob", "bob"]
+
+
+@pytest.mark.asyncio
+async def test_command_invalidates_cached_query():
+    handler = GreetQueryHandler()
+    mediator = build_mediator(handler)
+
+    await mediator.handle_query(GreetQuery(name="bob"))
+    await mediator.handle_command(RenameCommand(name="bob"))
+    result = await mediator.handle_query(GreetQuery(name="bob"))
+
+    assert result == "hello bob #2"
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_and_evicts():
+    cache = InMemoryQueryCache(max_size=2)
+
+    await cache.set("expired", "value", ttl=0)
+    await cache.set("first", "value", ttl=60)
+    await cache.set("second", "value", ttl=60)
+    await cache.set("third", "value", ttl=60)
+
+    assert await cache.get("expired") is None
+    assert await cache.get("first") is None
+    assert await cache.get("second") == "value"
+    assert await cache.get("third") == "value"
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_invalidates_alias_availability(
+    mediator: Mediator,
+    faker: Faker,
+):
+    alias = "my-cached-alias"
+
+    assert await mediator.handle_query(CheckAliasAvailabilityQuery(alias=alias))
+
+    await mediator.handle_command(
+        CreateShortURLCommand(long_url=faker.url(), alias=alias),
+    )
+
+    assert not await mediator.handle_query(CheckAliasAvailabilityQuery(alias=alias))
+    assert await mediator.handle_query(GetLongURLQuery(short_url=alias))
@@ -3,11 +3,17 @@ from faker import Faker
 
 from application.commands.url import CreateShortURLCommand
 from application.mediator import Mediator
-from application.queries.url import GetLongURLQuery
+from application.queries.url import (
+    CheckAliasAvailabilityQuery,
+    GetLongURLQuery,
+)
 from domain.exceptions.url import (
+    BlockedAliasError,
     EmptyURLError,
+    InvalidAliasError,
     InvalidURLError,
     LongURLNotFoundException,
+    ShortURLAlreadyExistsException,
     URLTooLongError,
 )
 from domain.interfaces.repositories.url import BaseURLRepository
@@ -139,3 +145,111 @@ async def test_create_short_url_command_invalid_url_too_long(
 
     with pytest.raises(URLTooLongError):
         await mediator.handle_command(CreateShortURLCommand(long_url=long_url))
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_command_with_alias(
+    mediator: Mediator,
+    faker: Faker,
+):
+    long_url = faker.url()
+
+    results = await mediator.handle_command(
+        CreateShortURLCommand(long_url=long_url, alias="my-promo"),
+    )
+
+    assert results[0] == "my-promo"
+    assert (
+        await mediator.handle_query(GetLongURLQuery(short_url="my-promo")) == long_url
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_command_with_alias_is_idempotent(
+    mediator: Mediator,
+    faker: Faker,
+):
+    long_url = faker.url()
+    command = CreateShortURLCommand(long_url=long_url, alias="my-promo")
+
+    results1 = await mediator.handle_command(command)
+    results2 = await mediator.handle_command(command)
+
+    assert results1[0] == results2[0] == "my-promo"
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_command_with_taken_alias(
+    mediator: Mediator,
+    faker: Faker,
+):
+    await mediator.handle_command(
+        CreateShortURLCommand(long_url=faker.url(), alias="my-promo"),
+    )
+
+    with pytest.raises(ShortURLAlreadyExistsException):
+        await mediator.handle_command(
+            CreateShortURLCommand(
+                long_url="https://other.example.com",
+                alias="my-promo",
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_command_alias_for_existing_long_url(
+    mediator: Mediator,
+    faker: Faker,
+):
+    long_url = faker.url()
+
+    command = CreateShortURLCommand(long_url=long_url)
+
+    generated = (await mediator.handle_command(command))[0]
+    aliased = (
+        await mediator.handle_command(
+            CreateShortURLCommand(long_url=long_url, alias="my-promo"),
+        )
+    )[0]
+    deduplicated = (await mediator.handle_command(command))[0]
+
+    assert aliased == "my-promo"
+    assert generated != aliased
+    assert deduplicated in (generated, aliased)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "alias,exception",
+    [
+        ("api", BlockedAliasError),
+        ("x", InvalidAliasError),
+        ("bad alias", InvalidAliasError),
+    ],
+)
+async def test_create_short_url_command_rejected_alias(
+    mediator: Mediator,
+    faker: Faker,
+    alias: str,
+    exception: type[Exception],
+):
+    with pytest.raises(exception):
+        await mediator.handle_command(
+            CreateShortURLCommand(long_url=faker.url(), alias=alias),
+        )
+
+
+@pytest.mark.asyncio
+async def test_check_alias_availability_query(
+    mediator: Mediator,
+    faker: Faker,
+):
+    assert await mediator.handle_query(CheckAliasAvailabilityQuery(alias="my-promo"))
+
+    await mediator.handle_command(
+        CreateShortURLCommand(long_url=faker.url(), alias="my-promo"),
+    )
+
+    assert not await mediator.handle_query(
+        CheckAliasAvailabilityQuery(alias="my-promo"),
+    )
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from domain.entities.url import URLEntity
+from domain.services.hot_keys import (
+    CountMinSketch,
+    HeavyHitters,
+    HotKeys,
+)
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.repositories.url import InMemoryURLRepository
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = CountMinSketch(width=64, depth=4)
+    counts = {f"key-{number}": number % 7 + 1 for number in range(200)}
+
+    for key, count in counts.items():
+        for _ in range(count):
+            sketch.add(key)
+
+    for key, count in counts.items():
+        assert sketch.add(key) >= count + 1
+
+
+def test_heavy_hitters_find_skewed_keys():
+    rng = random.Random(7)
+    heavy_hitters = HeavyHitters(size=5)
+    hot = [f"hot-{number}" for number in range(5)]
+
+    for _ in range(20_000):
+        if rng.random() < 0.5:
+            heavy_hitters.add(rng.choice(hot))
+        else:
+            heavy_hitters.add(f"cold-{rng.randrange(10_000)}")
+
+    assert {key for key, _ in heavy_hitters.top()} == set(hot)
+
+
+def test_heavy_hitters_decay():
+    heavy_hitters = HeavyHitters(size=2)
+    for _ in range(4):
+        heavy_hitters.add("a")
+    heavy_hitters.add("b")
+
+    heavy_hitters.decay()
+
+    assert heavy_hitters.top() == [("a", 2)]
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_pin_known_codes():
+    repository = InMemoryURLRepository()
+    await repository.add(
+        URLEntity(
+            short_url="hot",
+            long_url=LongURLValueObject(value="https://example.com/hot"),
+        ),
+    )
+    hot_keys = HotKeys(url_repository=repository, size=10, min_count=3)
+
+    for _ in range(5):
+        hot_keys.record("hot")
+        hot_keys.record("unknown")
+    hot_keys.record("cold")
+    await hot_keys.refresh()
+
+    assert hot_keys.get_pinned("hot") == "https://example.com/hot"
+    assert not hot_keys.is_pinned("unknown")
+    assert not hot_keys.is_pinned("cold")
+
+    # Once traffic stops, decay unpins the code after a few refreshes
+    for _ in range(3):
+        await hot_keys.refresh()
+    assert not hot_keys.is_pinned("hot")
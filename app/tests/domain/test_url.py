@@ -6,12 +6,19 @@ import pytest
 from domain.entities.url import URLEntity
 from domain.exceptions.url import (
     EmptyURLError,
+    InvalidAliasError,
     InvalidURLError,
     URLTooLongError,
 )
+from domain.services.blocklist import (
+    AliasBlocklist,
+    Trie,
+)
 from domain.value_objects.url import (
     LongURLValueObject,
+    MAX_ALIAS_LENGTH,
     MAX_URL_LENGTH,
+    ShortURLAliasValueObject,
 )
 
 
@@ -218,3 +225,78 @@ def test_long_url_value_object_valid_domains():
     for url in valid_urls:
         value_object = LongURLValueObject(value=url)
         assert value_object.value == url
+
+
+# Tests for custom aliases
+@pytest.mark.parametrize(
+    "alias",
+    ["abc", "my-link", "Promo_2025", "a" * MAX_ALIAS_LENGTH],
+)
+def test_short_url_alias_value_object_valid(alias):
+    assert ShortURLAliasValueObject(value=alias).as_generic_type() == alias
+
+
+@pytest.mark.parametrize(
+    "alias",
+    [
+        "ab",
+        "a" * (MAX_ALIAS_LENGTH + 1),
+        "with space",
+        "slash/alias",
+        "emoji🙂",
+        "abc\n",
+    ],
+)
+def test_short_url_alias_value_object_invalid(alias):
+    with pytest.raises(InvalidAliasError):
+        ShortURLAliasValueObject(value=alias)
+
+
+def test_trie_membership_and_substring_search():
+    trie = Trie()
+    for word in ("car", "cart", "dog"):
+        trie.add(word)
+    trie.add("car")
+
+    assert len(trie) == 3
+    assert "car" in trie
+    assert "ca" not in trie
+    assert trie.find_in("hotdogs") == "dog"
+    assert trie.find_in("cat") is None
+
+
+@pytest.mark.parametrize(
+    "alias,blocked",
+    [
+        ("api", True),
+        ("API", True),
+        ("rapid", False),
+        ("healthcheck", True),
+        ("my-promo", False),
+        ("holyshit", True),
+        ("sh1t-happens", True),
+        ("s_h_i_t", True),
+    ],
+)
+def test_alias_blocklist(alias, blocked):
+    assert AliasBlocklist.from_words().is_blocked(alias) is blocked
+
+
+def test_url_entity_is_slotted_and_reads_the_clock_once():
+    entity = URLEntity(
+        short_url="abc123",
+        long_url=LongURLValueObject(value="https://example.com"),
+    )
+
+    assert not hasattr(entity, "__dict__")
+    assert entity.updated_at is entity.created_at
+
+
+def test_trusted_value_object_skips_validation():
+    # Stored data has been validated on the way in, loading it must not pay
+    # for validation again
+    value_object = LongURLValueObject.from_trusted("not validated")
+
+    assert value_object.as_generic_type() == "not validated"
+    assert value_object == LongURLValueObject.from_trusted("not validated")
+    assert not hasattr(value_object, "__dict__")
@@ -5,16 +5,37 @@ from punq import (
 
 from application.init import _init_container
 from domain.interfaces.repositories.url import BaseURLRepository
-from infrastructure.database.repositories.url.memory import DummyInMemoryURLRepository
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    InMemoryAPIKeyRepository,
+)
+from infrastructure.auth.quota import QuotaTracker
+from infrastructure.database.repositories.url.memory import InMemoryURLRepository
+from settings.config import Config
 
 
 def init_dummy_container() -> Container:
     container = _init_container()
 
+    # Postgres and Redis are not available to the tests, nothing to warm up
+    container.register(
+        Config,
+        instance=Config(WARMUP_ENABLED=False),
+        scope=Scope.singleton,
+    )
+
     container.register(
         BaseURLRepository,
-        DummyInMemoryURLRepository,
+        instance=InMemoryURLRepository(),
         scope=Scope.singleton,
     )
 
+    container.register(
+        BaseAPIKeyRepository,
+        instance=InMemoryAPIKeyRepository(),
+        scope=Scope.singleton,
+    )
+
+    container.register(QuotaTracker, instance=QuotaTracker(), scope=Scope.singleton)
+
     return container
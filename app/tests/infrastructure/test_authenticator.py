@@ -0,0 +1,175 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+import pytest_asyncio
+from authx import (
+    AuthX,
+    AuthXConfig,
+)
+
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.auth.keys import (
+    APIKey,
+    generate_api_key,
+    InMemoryAPIKeyRepository,
+    parse_api_key,
+)
+from infrastructure.auth.quota import QuotaTracker
+
+
+JWT_SECRET = "test-secret-that-is-long-enough-for-hs256"
+
+
+@dataclass
+class CountingAPIKeyRepository(InMemoryAPIKeyRepository):
+    lookups: int = 0
+    delay: float = 0
+
+    async def get_by_prefix(self, prefix: str) -> APIKey | None:
+        self.lookups += 1
+        await asyncio.sleep(self.delay)
+        return await super().get_by_prefix(prefix)
+
+
+@pytest_asyncio.fixture
+async def issued_key() -> tuple[str, CountingAPIKeyRepository]:
+    repository = CountingAPIKeyRepository()
+    token, api_key = generate_api_key(name="partner", quota=5)
+    await repository.add(api_key)
+    return token, repository
+
+
+def test_parse_api_key():
+    assert parse_api_key("usk_abc_se_cret") == ("abc", "se_cret")
+    assert parse_api_key("eyJhbGciOiJIUzI1NiJ9.e30.sig") is None
+    assert parse_api_key("usk__secret") is None
+
+
+@pytest.mark.asyncio
+async def test_api_key_is_verified_once(issued_key):
+    token, repository = issued_key
+    authenticator = Authenticator(keys=repository)
+
+    principals = await asyncio.gather(
+        *(authenticator.authenticate(token) for _ in range(5)),
+    )
+    principal = await authenticator.authenticate(token)
+
+    assert principal.kind == "api_key"
+    assert principal.quota == 5
+    assert all(cached == principal for cached in principals)
+    # Concurrent cold requests share one verification, warm ones hit the cache
+    assert repository.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_verification_does_not_strand_waiters(issued_key):
+    token, repository = issued_key
+    repository.delay = 0.05
+    authenticator = Authenticator(keys=repository)
+
+    leader = asyncio.create_task(authenticator.authenticate(token))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(authenticator.authenticate(token))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    principal = await asyncio.wait_for(follower, timeout=1)
+
+    assert principal.kind == "api_key"
+    assert leader.cancelled()
+    assert repository.lookups == 2
+
+
+@pytest.mark.asyncio
+async def test_wrong_secret_is_rejected_and_cached_briefly(issued_key):
+    token, repository = issued_key
+    authenticator = Authenticator(keys=repository, negative_cache_ttl=60)
+    prefix, _ = parse_api_key(token)
+
+    assert await authenticator.authenticate(f"usk_{prefix}_wrong") is None
+    assert await authenticator.authenticate(f"usk_{prefix}_wrong") is None
+    assert await authenticator.authenticate("usk_unknown_secret") is None
+    assert repository.lookups == 2
+
+    # The right secret of the same key is still verified
+    assert await authenticator.authenticate(token) is not None
+
+    authenticator = Authenticator(keys=repository, negative_cache_ttl=0)
+    assert await authenticator.authenticate(f"usk_{prefix}_wrong") is None
+    assert await authenticator.authenticate(f"usk_{prefix}_wrong") is None
+    assert repository.lookups == 5
+
+
+@pytest.mark.asyncio
+async def test_revocation_drops_cached_principal(issued_key):
+    token, repository = issued_key
+    authenticator = Authenticator(keys=repository)
+    principal = await authenticator.authenticate(token)
+
+    prefix, _ = parse_api_key(token)
+    await repository.revoke(prefix)
+    assert await authenticator.authenticate(token) == principal
+
+    await authenticator.revoke(principal.subject)
+
+    assert await authenticator.authenticate(token) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_expires(issued_key):
+    token, repository = issued_key
+    authenticator = Authenticator(keys=repository, cache_ttl=0.05)
+
+    await authenticator.authenticate(token)
+    await asyncio.sleep(0.1)
+    await authenticator.authenticate(token)
+
+    assert repository.lookups == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(issued_key):
+    token, repository = issued_key
+    other_token, other_key = generate_api_key(name="other")
+    await repository.add(other_key)
+    authenticator = Authenticator(keys=repository, max_size=1)
+
+    await authenticator.authenticate(token)
+    await authenticator.authenticate(other_token)
+    await authenticator.authenticate(token)
+
+    assert repository.lookups == 3
+
+
+@pytest.mark.asyncio
+async def test_jwt(issued_key):
+    _, repository = issued_key
+    auth = AuthX(config=AuthXConfig(JWT_SECRET_KEY=JWT_SECRET))
+    authenticator = Authenticator(keys=repository, jwt=auth, default_quota=100)
+
+    principal = await authenticator.authenticate(
+        auth.create_access_token(uid="service"),
+    )
+    limited = await authenticator.authenticate(
+        auth.create_access_token(uid="limited", data={"quota": 3}),
+    )
+    forged = AuthX(config=AuthXConfig(JWT_SECRET_KEY="x" * 32)).create_access_token(
+        uid="service",
+    )
+
+    assert principal.subject == "jwt:service"
+    assert principal.quota == 100
+    assert limited.quota == 3
+    assert await authenticator.authenticate(forged) is None
+
+
+@pytest.mark.asyncio
+async def test_quota_tracker_without_redis():
+    quota_tracker = QuotaTracker()
+
+    results = [await quota_tracker.consume("key:a", limit=2) for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert await quota_tracker.consume("key:b", limit=2)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from redis.asyncio import Redis
+
+from domain.exceptions.url import URLStorageUnavailableException
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.repositories.url import (
+    composed,
+    SQLAlchemyRedisURLRepository,
+)
+from infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    OPEN,
+)
+
+
+@pytest.fixture
+def database_reads() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def repository(monkeypatch, database_reads: list[str]) -> SQLAlchemyRedisURLRepository:
+    repository = SQLAlchemyRedisURLRepository(
+        database=Database(
+            url="postgresql+asyncpg://localhost/test",
+            ro_url="postgresql+asyncpg://localhost/test",
+        ),
+        # Nothing listens on port 1; the client retries, the breaker gives up
+        cache=Redis(host="127.0.0.1", port=1),
+        cache_breaker=CircuitBreaker(
+            name="test",
+            failure_threshold=2,
+            reset_timeout=60,
+            call_timeout=0.05,
+        ),
+        fallback_concurrency=1,
+    )
+
+    async def select_long_url(short_url: str) -> str:
+        database_reads.append(short_url)
+        await asyncio.sleep(0.01)
+        return "https://example.com"
+
+    monkeypatch.setattr(repository, "_select_long_url", select_long_url)
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_lookups_bypass_a_failing_cache(
+    repository: SQLAlchemyRedisURLRepository,
+    database_reads: list[str],
+):
+    for short_url in ("a", "b", "c"):
+        assert await repository.get_by_short_url(short_url) == "https://example.com"
+
+    assert repository.cache_breaker.state == OPEN
+    assert database_reads == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_bypassed_lookups_are_bounded(
+    repository: SQLAlchemyRedisURLRepository,
+    monkeypatch,
+):
+    monkeypatch.setattr(composed, "FALLBACK_WAIT_TIMEOUT", 0.001)
+    for _ in range(2):
+        repository.cache_breaker.record_failure()
+
+    results = await asyncio.gather(
+        repository.get_by_short_url("a"),
+        repository.get_by_short_url("b"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "https://example.com"
+    assert isinstance(results[1], URLStorageUnavailableException)
@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+import pytest
+from faker import Faker
+from pydantic import ValidationError
+
+from domain.entities.url import URLEntity
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.changefeed.consumer import (
+    ChangeFeedConsumer,
+    STREAM_START,
+    try_lock,
+)
+from infrastructure.changefeed.events import (
+    URL_CREATED,
+    URLChangeEvent,
+)
+from infrastructure.database.repositories.url import InMemoryURLRepository
+from settings.config import Config
+
+
+def make_entry(stream_id: str, short_url: str, long_url: str):
+    url_pair = URLEntity(
+        short_url=short_url,
+        long_url=LongURLValueObject(value=long_url),
+    )
+    event = URLChangeEvent.from_entity(url_pair, URL_CREATED)
+    return stream_id, event.to_stream_fields()
+
+
+def test_event_round_trips_through_stream_fields(faker: Faker):
+    url_pair = URLEntity(short_url="abc123", long_url=LongURLValueObject(faker.url()))
+
+    fields = URLChangeEvent.from_entity(url_pair, URL_CREATED).to_stream_fields()
+    entity = URLChangeEvent.from_stream_fields(fields).to_entity()
+
+    assert entity == url_pair
+    assert entity.id == url_pair.id
+    assert entity.created_at == url_pair.created_at
+    assert entity.long_url == url_pair.long_url
+
+
+@pytest.mark.asyncio
+async def test_consumer_applies_entries_with_the_offset(faker: Faker):
+    repository = InMemoryURLRepository()
+    consumer = ChangeFeedConsumer(
+        redis=None,
+        stream="url_changes",
+        repository=repository,
+    )
+    long_url = faker.url()
+    entries = [
+        make_entry("1-0", "first", long_url),
+        make_entry("2-0", "second", faker.url()),
+    ]
+
+    offset = await consumer.apply_entries(entries, STREAM_START)
+    # A replayed batch after a restart is skipped by the repository
+    offset = await consumer.apply_entries(entries, offset)
+
+    assert offset == "2-0"
+    assert await repository.get_change_offset() == "2-0"
+    assert len(repository) == 2
+    assert await repository.get_by_short_url("first") == long_url
+
+
+@pytest.mark.asyncio
+async def test_restarted_memory_replica_reads_from_the_beginning(
+    tmp_path: Path,
+    faker: Faker,
+):
+    snapshot_path = tmp_path / "urls.snapshot"
+    repository = InMemoryURLRepository(snapshot_path=snapshot_path)
+    await repository.apply_changes([], "2-0")
+    await repository.close()
+
+    assert (
+        await InMemoryURLRepository(snapshot_path=snapshot_path).get_change_offset()
+        is None
+    )
+
+
+def test_only_one_process_owns_the_consumer_lock(tmp_path: Path):
+    path = tmp_path / "urls.db.changefeed.lock"
+
+    owner = try_lock(path)
+    assert owner is not None
+    assert try_lock(path) is None
+
+    os.close(owner)
+    standby = try_lock(path)
+    assert standby is not None
+    os.close(standby)
+
+
+def test_consumer_requires_a_replica_backend():
+    with pytest.raises(ValidationError):
+        Config(CHANGEFEED_CONSUMER_ENABLED=True)
+
+    assert Config(
+        CHANGEFEED_CONSUMER_ENABLED=True,
+        URL_REPOSITORY_BACKEND="sqlite",
+    ).changefeed_consumer_enabled
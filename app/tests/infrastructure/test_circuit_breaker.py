@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+)
+
+
+async def fail():
+    raise ConnectionError("Connection refused")
+
+
+async def succeed():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(name="test", failure_threshold=2, reset_timeout=60)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+
+
+@pytest.mark.asyncio
+async def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(name="test", failure_threshold=2)
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+    assert await breaker.call(succeed) == "ok"
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(name="test", failure_threshold=1, reset_timeout=0.01)
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    await asyncio.sleep(0.02)
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Everyone else keeps failing fast while the probe is out
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_opens_again():
+    breaker = CircuitBreaker(name="test", failure_threshold=3, reset_timeout=0.01)
+    for _ in range(3):
+        breaker.record_failure()
+
+    await asyncio.sleep(0.02)
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_counts_as_failure():
+    breaker = CircuitBreaker(name="test", failure_threshold=1, call_timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        await breaker.call(lambda: asyncio.sleep(1))
+
+    assert breaker.state == OPEN
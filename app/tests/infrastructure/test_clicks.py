@@ -0,0 +1,176 @@
+import time
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.analytics import clicks
+from infrastructure.analytics.clicks import (
+    compact_clicks,
+    SQLAlchemyClickStats,
+)
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.clicks import URLClickMinuteModel
+
+
+@dataclass
+class RecordingResult:
+    rows: list
+
+    def all(self) -> list:
+        return self.rows
+
+
+@dataclass
+class RecordingSession:
+    """Compiles the statements instead of sending them to Postgres."""
+
+    rows: list = field(default_factory=list)
+    statements: list = field(default_factory=list)
+    commits: int = 0
+
+    async def execute(self, stmt) -> RecordingResult:
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+        return RecordingResult(self.rows)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def session() -> RecordingSession:
+    return RecordingSession()
+
+
+@pytest.fixture
+def click_stats(session: RecordingSession) -> SQLAlchemyClickStats:
+    database = Database(
+        url="postgresql+asyncpg://localhost/test",
+        ro_url="postgresql+asyncpg://localhost/test",
+    )
+
+    @asynccontextmanager
+    async def get_session():
+        yield session
+
+    database.get_session = get_session
+    database.get_read_only_session = get_session
+    return SQLAlchemyClickStats(database=database)
+
+
+def test_record_counts_per_code_and_minute(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 120.5)
+    # Recording never talks to the database, the engines are not connected
+    database = Database(
+        url="postgresql+asyncpg://localhost/test",
+        ro_url="postgresql+asyncpg://localhost/test",
+    )
+    click_stats = SQLAlchemyClickStats(database=database, max_buffered=2)
+
+    for short_url in ("abc", "abc", "def", "ghi"):
+        click_stats.record(short_url)
+
+    assert click_stats._buffer == {("abc", 2): 2, ("def", 2): 1}
+
+
+def test_compaction_moves_rows_in_one_statement():
+    stmt = compact_clicks(URLClickMinuteModel, "hour", datetime(2026, 1, 1))
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    # Postgres only accepts a DELETE ... RETURNING CTE at the top level
+    assert sql.startswith("WITH moved AS \n(DELETE FROM url_click_minute")
+    assert "INSERT INTO url_click_hour" in sql
+    assert "date_trunc('hour', moved.bucket)" in sql
+    assert "ON CONFLICT (short_url, bucket) DO UPDATE" in sql
+
+
+@pytest.mark.asyncio
+async def test_flush_upserts_minutes_and_totals(
+    monkeypatch,
+    click_stats: SQLAlchemyClickStats,
+    session: RecordingSession,
+):
+    monkeypatch.setattr(time, "time", lambda: 120.5)
+    for short_url in ("abc", "abc", "def"):
+        click_stats.record(short_url)
+
+    await click_stats.flush()
+
+    minutes, totals = session.statements
+    assert str(minutes).startswith("INSERT INTO url_click_minute")
+    assert minutes.params["clicks_m0"] == 2
+    assert minutes.params["bucket_m0"] == datetime(1970, 1, 1, 0, 2)
+    assert str(totals).startswith("INSERT INTO url_click_total")
+    assert session.commits == 1
+    assert click_stats._buffer == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_splits_large_buffers(
+    monkeypatch,
+    click_stats: SQLAlchemyClickStats,
+    session: RecordingSession,
+):
+    monkeypatch.setattr(clicks, "FLUSH_CHUNK_SIZE", 3)
+    click_stats._buffer = {(f"code{number}", 1): 1 for number in range(7)}
+
+    await click_stats.flush()
+
+    # 7 minute rows and 7 totals, at most 3 rows a statement, one commit
+    assert [len(stmt.params) // 3 for stmt in session.statements[:3]] == [3, 3, 1]
+    assert [len(stmt.params) // 2 for stmt in session.statements[3:]] == [3, 3, 1]
+    assert session.commits == 1
+
+
+def test_default_flush_chunk_fits_asyncpg():
+    assert clicks.FLUSH_CHUNK_SIZE * 3 <= 32767
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counts(
+    monkeypatch,
+    click_stats: SQLAlchemyClickStats,
+    session: RecordingSession,
+):
+    async def execute(stmt):
+        raise ConnectionError
+
+    monkeypatch.setattr(session, "execute", execute)
+    click_stats._buffer = {("abc", 1): 2}
+
+    with pytest.raises(ConnectionError):
+        await click_stats.flush()
+
+    # Retried with the next flush
+    assert click_stats._buffer == {("abc", 1): 2}
+
+
+@pytest.mark.asyncio
+async def test_series_reads_finer_rollups(
+    click_stats: SQLAlchemyClickStats,
+    session: RecordingSession,
+):
+    bucket = datetime(2026, 1, 1, 10)
+    session.rows = [(bucket, 7)]
+
+    series = await click_stats.get_series(
+        "abc",
+        "hour",
+        datetime(2026, 1, 1),
+        datetime(2026, 1, 2),
+    )
+
+    assert [(count.bucket, count.clicks) for count in series] == [(bucket, 7)]
+    (stmt,) = session.statements
+    sql = str(stmt)
+    # Minutes that are not compacted yet count towards their hour
+    assert "FROM url_click_minute" in sql
+    assert "FROM url_click_hour" in sql
+    assert "url_click_day" not in sql
+    assert "date_trunc('hour', url_click_minute.bucket)" in sql
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+from faker import Faker
+
+from domain.entities.url import URLEntity
+from domain.exceptions.url import ReadOnlyURLStorageException
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.repositories.url import LookupFileURLRepository
+from infrastructure.lookup.format import (
+    LookupFileError,
+    LookupFileWriter,
+)
+
+
+def write_lookup_file(path: Path, pairs: dict[str, str]) -> int:
+    with LookupFileWriter(path=path) as writer:
+        for short_url in sorted(pairs, key=str.encode):
+            writer.add(short_url, pairs[short_url])
+        return writer.finish()
+
+
+@pytest.mark.asyncio
+async def test_resolves_every_exported_pair(tmp_path: Path, faker: Faker):
+    pairs = {
+        faker.unique.pystr(min_chars=4, max_chars=10): faker.url() for _ in range(500)
+    }
+    pairs["кириллица"] = "https://example.com/unicode"
+    path = tmp_path / "urls.lookup"
+
+    assert write_lookup_file(path, pairs) == len(pairs)
+
+    repository = LookupFileURLRepository(path=path)
+    try:
+        assert len(repository) == len(pairs)
+        for short_url, long_url in pairs.items():
+            assert await repository.get_by_short_url(short_url) == long_url
+
+        assert await repository.get_by_short_url("missing-code") is None
+        assert await repository.get_by_short_url("") is None
+        assert await repository.exists(next(iter(pairs)))
+        assert await repository.get_by_long_url(pairs["кириллица"]) is None
+    finally:
+        await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_export(tmp_path: Path):
+    path = tmp_path / "urls.lookup"
+    write_lookup_file(path, {})
+
+    repository = LookupFileURLRepository(path=path)
+
+    assert len(repository) == 0
+    assert await repository.get_by_short_url("abc") is None
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_creation_is_rejected(tmp_path: Path):
+    path = tmp_path / "urls.lookup"
+    write_lookup_file(path, {"abc": "https://example.com"})
+    repository = LookupFileURLRepository(path=path)
+
+    with pytest.raises(ReadOnlyURLStorageException):
+        await repository.add(
+            URLEntity(
+                short_url="new",
+                long_url=LongURLValueObject(value="https://example.com/new"),
+            ),
+        )
+    await repository.close()
+
+
+def test_writer_requires_sorted_unique_codes(tmp_path: Path):
+    with LookupFileWriter(path=tmp_path / "urls.lookup") as writer:
+        writer.add("b", "https://example.com/b")
+
+        with pytest.raises(LookupFileError):
+            writer.add("a", "https://example.com/a")
+        with pytest.raises(LookupFileError):
+            writer.add("b", "https://example.com/b")
+
+
+def test_invalid_file_is_rejected(tmp_path: Path):
+    path = tmp_path / "urls.lookup"
+    write_lookup_file(path, {"abc": "https://example.com"})
+    path.write_bytes(path.read_bytes()[:40])
+
+    with pytest.raises(LookupFileError):
+        LookupFileURLRepository(path=path)
+
+    path.write_bytes(b"not a lookup file at all, but long enough")
+    with pytest.raises(LookupFileError):
+        LookupFileURLRepository(path=path)
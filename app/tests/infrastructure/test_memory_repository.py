@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+from faker import Faker
+
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import ShortURLAlreadyExistsException
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.repositories.url import InMemoryURLRepository
+
+
+def make_url_pair(short_url: str, long_url: str) -> URLEntity:
+    return URLEntity(short_url=short_url, long_url=LongURLValueObject(value=long_url))
+
+
+@pytest.mark.asyncio
+async def test_lookups_by_short_and_long_url(faker: Faker):
+    repository = InMemoryURLRepository()
+    long_url = faker.url()
+    url_pair = make_url_pair("abc123", long_url)
+
+    await repository.add(url_pair)
+
+    assert await repository.exists("abc123")
+    assert await repository.get_by_short_url("abc123") == long_url
+    assert await repository.get_by_long_url(long_url) == url_pair
+    assert await repository.get_by_short_url("missing") is None
+    assert await repository.get_by_long_url(faker.url()) is None
+
+
+@pytest.mark.asyncio
+async def test_long_url_lookup_returns_first_pair(faker: Faker):
+    repository = InMemoryURLRepository()
+    long_url = faker.url()
+
+    await repository.add(make_url_pair("first", long_url))
+    await repository.add(make_url_pair("second", long_url))
+
+    entity = await repository.get_by_long_url(long_url)
+
+    assert entity.short_url == "first"
+    assert len(repository) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_rejects_taken_short_url(faker: Faker):
+    repository = InMemoryURLRepository()
+    await repository.add(make_url_pair("abc123", faker.url()))
+
+    with pytest.raises(ShortURLAlreadyExistsException):
+        await repository.add(make_url_pair("abc123", faker.url()))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_survives_restart(tmp_path: Path, faker: Faker):
+    snapshot_path = tmp_path / "urls.jsonl"
+    repository = InMemoryURLRepository(snapshot_path=snapshot_path)
+    url_pair = make_url_pair("abc123", faker.url())
+    await repository.add(url_pair)
+
+    await repository.close()
+    restored = InMemoryURLRepository(snapshot_path=snapshot_path)
+
+    entity = await restored.get_by_long_url(url_pair.long_url.as_generic_type())
+    assert entity.id == url_pair.id
+    assert entity.created_at == url_pair.created_at
+    assert await restored.exists("abc123")
+    assert not snapshot_path.with_name("urls.jsonl.tmp").exists()
+
+
+@pytest.mark.asyncio
+async def test_pair_lookup_by_long_url(faker: Faker):
+    repository = InMemoryURLRepository()
+    long_url = faker.url()
+    await repository.add(make_url_pair("first", long_url))
+    await repository.add(make_url_pair("second", long_url))
+
+    assert await repository.get_pair_by_long_url(long_url) == URLPair(
+        short_url="first",
+        long_url=long_url,
+    )
+    assert await repository.get_pair_by_long_url(faker.url()) is None
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import (
+    datetime,
+    timezone,
+)
+
+import pytest
+
+from infrastructure.scheduler.locks import LocalJobLock
+from infrastructure.scheduler.scheduler import (
+    Job,
+    Scheduler,
+)
+from infrastructure.scheduler.schedules import (
+    CronSchedule,
+    IntervalSchedule,
+    InvalidScheduleError,
+)
+
+
+def timestamp(value: str) -> float:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("*/15 * * * *", "2026-01-01T10:07:30", "2026-01-01T10:15:00"),
+        ("*/15 * * * *", "2026-01-01T10:15:00", "2026-01-01T10:30:00"),
+        ("0 3 * * *", "2026-01-01T10:07:30", "2026-01-02T03:00:00"),
+        ("0 0 29 2 *", "2026-03-01T00:00:00", "2028-02-29T00:00:00"),
+        # Day of month or day of week: Monday the 5th comes first
+        ("30 2 15 * 1", "2026-01-01T00:00:00", "2026-01-05T02:30:00"),
+        ("0 12 * * 0", "2026-01-01T00:00:00", "2026-01-04T12:00:00"),
+        ("0 12 * * 7", "2026-01-01T00:00:00", "2026-01-04T12:00:00"),
+    ],
+)
+def test_cron_next_run(expression: str, after: str, expected: str):
+    assert CronSchedule(expression).next_run(timestamp(after)) == timestamp(expected)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "*/0 * * * *", "a * * * *", "5-1 * * * *"],
+)
+def test_invalid_cron_expression(expression: str):
+    with pytest.raises(InvalidScheduleError):
+        CronSchedule(expression)
+
+
+def test_interval_runs_are_aligned():
+    schedule = IntervalSchedule(10)
+
+    assert schedule.next_run(105.5) == 110
+    assert schedule.next_run(110) == 120
+
+
+@pytest.mark.asyncio
+async def test_exclusive_run_is_claimed_once():
+    lock = LocalJobLock()
+    job = Job(
+        name="job",
+        func=lambda: asyncio.sleep(0),
+        schedule=IntervalSchedule(10),
+        timeout=1,
+    )
+    first, second = Scheduler(lock=lock), Scheduler(lock=lock)
+
+    assert await first.claim(job, 100.0)
+    assert not await second.claim(job, 100.0)
+    assert await second.claim(job, 110.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_survives_failures_and_timeouts():
+    runs = []
+
+    async def fail():
+        runs.append("fail")
+        raise RuntimeError
+
+    async def hang():
+        runs.append("hang")
+        await asyncio.sleep(10)
+
+    scheduler = Scheduler(lock=LocalJobLock())
+    for name, func in (("fail", fail), ("hang", hang)):
+        await scheduler.execute(
+            Job(name=name, func=func, schedule=IntervalSchedule(10), timeout=0.01),
+        )
+
+    assert runs == ["fail", "hang"]
+
+
+def test_job_names_are_unique():
+    scheduler = Scheduler(lock=LocalJobLock())
+    job = Job(
+        name="job",
+        func=lambda: asyncio.sleep(0),
+        schedule=IntervalSchedule(10),
+        timeout=1,
+    )
+    scheduler.add_job(job)
+
+    with pytest.raises(ValueError):
+        scheduler.add_job(job)
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+from faker import Faker
+
+from domain.entities.url import (
+    URLEntity,
+    URLPair,
+)
+from domain.exceptions.url import (
+    ReadOnlyURLStorageException,
+    ShortURLAlreadyExistsException,
+)
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.repositories.url import SQLiteURLRepository
+
+
+def make_url_pair(short_url: str, long_url: str) -> URLEntity:
+    return URLEntity(short_url=short_url, long_url=LongURLValueObject(value=long_url))
+
+
+@pytest.mark.asyncio
+async def test_lookups_and_dedup(tmp_path: Path, faker: Faker):
+    repository = SQLiteURLRepository(path=tmp_path / "urls.db")
+    long_url = faker.url()
+    first = make_url_pair("first", long_url)
+
+    await repository.add(first)
+    await repository.add(make_url_pair("second", long_url))
+
+    assert await repository.exists("first")
+    assert not await repository.exists("missing")
+    assert await repository.get_by_short_url("second") == long_url
+    assert await repository.get_by_short_url("missing") is None
+
+    entity = await repository.get_by_long_url(long_url)
+    assert entity == first
+    assert entity.id == first.id
+    assert entity.created_at == first.created_at
+
+
+@pytest.mark.asyncio
+async def test_add_rejects_taken_short_url(tmp_path: Path, faker: Faker):
+    repository = SQLiteURLRepository(path=tmp_path / "urls.db")
+    await repository.add(make_url_pair("abc123", faker.url()))
+
+    with pytest.raises(ShortURLAlreadyExistsException):
+        await repository.add(make_url_pair("abc123", faker.url()))
+
+
+@pytest.mark.asyncio
+async def test_data_survives_reopen(tmp_path: Path, faker: Faker):
+    path = tmp_path / "urls.db"
+    repository = SQLiteURLRepository(path=path)
+    long_url = faker.url()
+    await repository.add(make_url_pair("abc123", long_url))
+    await repository.close()
+
+    reopened = SQLiteURLRepository(path=path)
+
+    assert await reopened.get_by_short_url("abc123") == long_url
+
+
+@pytest.mark.asyncio
+async def test_read_only_replica_accepts_only_applied_changes(
+    tmp_path: Path,
+    faker: Faker,
+):
+    replica = SQLiteURLRepository(path=tmp_path / "replica.db", read_only=True)
+    url_pair = make_url_pair("abc123", faker.url())
+
+    with pytest.raises(ReadOnlyURLStorageException):
+        await replica.add(url_pair)
+
+    # Replaying the same change is a no-op
+    await replica.apply_changes([url_pair], "1-0")
+    await replica.apply_changes([url_pair], "1-0")
+
+    assert await replica.get_by_short_url("abc123") == url_pair.long_url.value
+
+
+@pytest.mark.asyncio
+async def test_change_offset_is_stored_with_the_pairs(tmp_path: Path, faker: Faker):
+    path = tmp_path / "replica.db"
+    replica = SQLiteURLRepository(path=path, read_only=True)
+
+    assert await replica.get_change_offset() is None
+
+    await replica.apply_changes([make_url_pair("abc123", faker.url())], "1-0")
+    await replica.apply_changes([], "2-0")
+    await replica.close()
+
+    assert await SQLiteURLRepository(path=path).get_change_offset() == "2-0"
+
+
+@pytest.mark.asyncio
+async def test_pair_lookup_by_long_url(tmp_path: Path, faker: Faker):
+    repository = SQLiteURLRepository(path=tmp_path / "urls.db")
+    long_url = faker.url()
+    await repository.add(make_url_pair("first", long_url))
+    await repository.add(make_url_pair("second", long_url))
+
+    assert await repository.get_pair_by_long_url(long_url) == URLPair(
+        short_url="first",
+        long_url=long_url,
+    )
+    assert await repository.get_pair_by_long_url(faker.url()) is None
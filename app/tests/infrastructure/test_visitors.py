@@ -0,0 +1,23 @@
+from datetime import date
+
+from redis.asyncio import Redis
+
+from infrastructure.analytics.visitors import (
+    get_visitors_key,
+    RedisVisitorCounter,
+)
+
+
+def test_days_of_a_code_share_a_hash_slot():
+    assert get_visitors_key("abc", date(2026, 1, 2)) == "visitors:{abc}:20260102"
+
+
+def test_record_buffers_distinct_fingerprints():
+    # Recording never talks to Redis, the client is not connected
+    visitor_counter = RedisVisitorCounter(redis=Redis(), max_buffered=3)
+
+    for fingerprint in ("a", "a", "b", "c", "d"):
+        visitor_counter.record("abc", fingerprint)
+
+    (fingerprints,) = visitor_counter._buffer.values()
+    assert fingerprints == {"a", "b", "c"}
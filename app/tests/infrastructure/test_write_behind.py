@@ -0,0 +1,476 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import pytest
+from faker import Faker
+from sqlalchemy.dialects import postgresql
+
+from domain.entities.url import URLEntity
+from domain.exceptions.url import ShortURLAlreadyExistsException
+from domain.value_objects.url import LongURLValueObject
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.repositories.url.write_behind import (
+    get_long_url_key,
+    RESERVE_AND_QUEUE,
+    WriteBehindURLRepository,
+)
+from infrastructure.writebehind.entries import (
+    convert_fields_to_url_entity,
+    convert_url_entity_to_fields,
+)
+from infrastructure.writebehind.flusher import (
+    NEW,
+    PENDING,
+    WriteBehindFlusher,
+)
+
+
+@dataclass
+class FakePipeline:
+    redis: "FakeStreamRedis"
+    calls: list = field(default_factory=list)
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None: ...
+
+    def __getattr__(self, name: str):
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self) -> list:
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+@dataclass
+class FakeStreamRedis:
+    """The keys and the consumer group of one stream, in memory. The
+    reserve script is emulated, its contract is what is tested here."""
+
+    stream: str = "url_writes"
+    values: dict[str, str] = field(default_factory=dict)
+    entries: dict[str, dict[str, str]] = field(default_factory=dict)
+    # Entries added to any other stream
+    other_streams: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    # Stream ID -> (consumer, delivery time in ms)
+    pending: dict[str, tuple[str, float]] = field(default_factory=dict)
+    last_delivered: int = 0
+    last_id: int = 0
+
+    def register_script(self, script: str):
+        assert script == RESERVE_AND_QUEUE
+
+        async def reserve_and_queue(keys: list[str], args: list[str]) -> int:
+            if keys[0] in self.values:
+                return 0
+            self.values[keys[0]] = args[0]
+            self.values.setdefault(keys[2], keys[0])
+            await self.xadd(keys[1], dict(zip(args[1::2], args[2::2])))
+            return 1
+
+        return reserve_and_queue
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(redis=self)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str) -> bool:
+        self.values[key] = value
+        return True
+
+    async def exists(self, *keys: str) -> int:
+        return sum(key in self.values for key in keys)
+
+    async def xadd(self, stream: str, fields: dict[str, str]) -> str:
+        if stream != self.stream:
+            self.other_streams.setdefault(stream, []).append(fields)
+            return "0-1"
+
+        self.last_id += 1
+        stream_id = f"{self.last_id}-0"
+        self.entries[stream_id] = fields
+        return stream_id
+
+    async def xgroup_create(self, *args, **kwargs) -> None: ...
+
+    async def xreadgroup(self, group, consumer, streams, count, block):
+        ((stream, start),) = streams.items()
+        if start == NEW:
+            ids = [
+                stream_id
+                for stream_id in self.entries
+                if int(stream_id.split("-")[0]) > self.last_delivered
+            ][:count]
+            for stream_id in ids:
+                self.pending[stream_id] = (consumer, time.monotonic() * 1000)
+                self.last_delivered = int(stream_id.split("-")[0])
+        else:
+            ids = [
+                stream_id
+                for stream_id, (owner, _) in self.pending.items()
+                if owner == consumer
+            ][:count]
+
+        if not ids:
+            return []
+        return [[stream, [(stream_id, self.entries[stream_id]) for stream_id in ids]]]
+
+    async def xautoclaim(self, stream, group, consumer, min_idle_time, count):
+        now = time.monotonic() * 1000
+        ids = [
+            stream_id
+            for stream_id, (_, delivered_at) in self.pending.items()
+            if now - delivered_at >= min_idle_time
+        ][:count]
+        for stream_id in ids:
+            self.pending[stream_id] = (consumer, now)
+        return ["0-0", [(stream_id, self.entries[stream_id]) for stream_id in ids], []]
+
+    async def xack(self, stream: str, group: str, *ids: str) -> int:
+        return sum(self.pending.pop(stream_id, None) is not None for stream_id in ids)
+
+    async def xdel(self, stream: str, *ids: str) -> int:
+        return sum(self.entries.pop(stream_id, None) is not None for stream_id in ids)
+
+
+@dataclass
+class FakeResult:
+    rows: list
+
+    def all(self) -> list:
+        return self.rows
+
+
+@dataclass
+class FakeURLSession:
+    """Runs the repository and flusher statements against a dict of stored
+    pairs."""
+
+    stored: dict[str, str]
+    fail_commit: bool = False
+    outbox: list = field(default_factory=list)
+    _inserts: dict[str, str] = field(default_factory=dict)
+
+    async def scalar(self, stmt) -> bool:
+        (short_url,) = stmt.compile(dialect=postgresql.dialect()).params.values()
+        return short_url in self.stored
+
+    async def scalars(self, stmt) -> FakeResult:
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        inserted = []
+        for name, short_url in params.items():
+            if not name.startswith("short_url_m"):
+                continue
+            long_url = params[name.replace("short_url", "long_url")]
+            if short_url not in self.stored and short_url not in self._inserts:
+                self._inserts[short_url] = long_url
+                inserted.append(short_url)
+        return FakeResult(inserted)
+
+    async def execute(self, stmt) -> FakeResult:
+        (short_urls,) = stmt.compile(dialect=postgresql.dialect()).params.values()
+        return FakeResult(
+            [
+                (short_url, self.stored[short_url])
+                for short_url in short_urls
+                if short_url in self.stored
+            ],
+        )
+
+    def add_all(self, models) -> None:
+        self.outbox.extend(models)
+
+    async def commit(self) -> None:
+        inserts, self._inserts = self._inserts, {}
+        if self.fail_commit:
+            raise ConnectionError
+        self.stored.update(inserts)
+
+
+@pytest.fixture
+def redis() -> FakeStreamRedis:
+    return FakeStreamRedis()
+
+
+@pytest.fixture
+def stored() -> dict[str, str]:
+    return {}
+
+
+@pytest.fixture
+def session(stored: dict[str, str]) -> FakeURLSession:
+    return FakeURLSession(stored=stored)
+
+
+@pytest.fixture
+def database(session: FakeURLSession) -> Database:
+    database = Database(
+        url="postgresql+asyncpg://localhost/test",
+        ro_url="postgresql+asyncpg://localhost/test",
+    )
+
+    @asynccontextmanager
+    async def get_session():
+        yield session
+
+    database.get_session = get_session
+    return database
+
+
+@pytest.fixture
+def repository(database: Database, redis: FakeStreamRedis) -> WriteBehindURLRepository:
+    return WriteBehindURLRepository(database=database, cache=redis)
+
+
+def build_flusher(database: Database, redis: FakeStreamRedis, **kwargs):
+    return WriteBehindFlusher(
+        database=database,
+        redis=redis,
+        stream="url_writes",
+        **kwargs,
+    )
+
+
+def test_queued_entry_round_trips(faker: Faker):
+    url_pair = URLEntity(short_url="abc123", long_url=LongURLValueObject(faker.url()))
+
+    fields = convert_url_entity_to_fields(url_pair)
+    entity = convert_fields_to_url_entity(fields)
+
+    assert all(isinstance(value, str) for value in fields.values())
+    assert entity == url_pair
+    assert entity.id == url_pair.id
+    assert entity.long_url == url_pair.long_url
+    assert entity.created_at == url_pair.created_at
+
+
+@pytest.mark.asyncio
+async def test_add_reserves_the_code_and_queues_the_pair(
+    repository: WriteBehindURLRepository,
+    redis: FakeStreamRedis,
+    faker: Faker,
+):
+    long_url = faker.url()
+    await repository.add(
+        URLEntity(short_url="abc123", long_url=LongURLValueObject(long_url)),
+    )
+
+    with pytest.raises(ShortURLAlreadyExistsException):
+        await repository.add(
+            URLEntity(short_url="abc123", long_url=LongURLValueObject(faker.url())),
+        )
+
+    assert redis.values == {"abc123": long_url, get_long_url_key(long_url): "abc123"}
+    (fields,) = redis.entries.values()
+    assert fields["short_url"] == "abc123"
+    assert fields["long_url"] == long_url
+
+
+@pytest.mark.asyncio
+async def test_unflushed_pair_is_resolved_from_redis(
+    repository: WriteBehindURLRepository,
+    monkeypatch,
+    faker: Faker,
+):
+    async def select_long_url(short_url: str) -> str | None:
+        raise AssertionError("the pair is not in Postgres yet")
+
+    monkeypatch.setattr(repository, "_select_long_url", select_long_url)
+    long_url = faker.url()
+    await repository.add(
+        URLEntity(short_url="abc123", long_url=LongURLValueObject(long_url)),
+    )
+
+    assert await repository.get_by_short_url("abc123") == long_url
+    assert await repository.exists("abc123")
+
+
+@pytest.mark.asyncio
+async def test_code_stored_past_redis_is_not_reserved(
+    repository: WriteBehindURLRepository,
+    redis: FakeStreamRedis,
+    stored: dict[str, str],
+    faker: Faker,
+):
+    # E.g. the cache write was skipped while the breaker was open
+    stored["abc123"] = faker.url()
+
+    with pytest.raises(ShortURLAlreadyExistsException):
+        await repository.add(
+            URLEntity(short_url="abc123", long_url=LongURLValueObject(faker.url())),
+        )
+
+    assert redis.values == {}
+    assert redis.entries == {}
+
+
+@pytest.mark.asyncio
+async def test_unflushed_long_url_is_deduplicated_from_redis(
+    repository: WriteBehindURLRepository,
+    faker: Faker,
+):
+    long_url = faker.url()
+    await repository.add(
+        URLEntity(short_url="abc123", long_url=LongURLValueObject(long_url)),
+    )
+    # The first code stays the one the long URL resolves to
+    await repository.add(
+        URLEntity(short_url="def456", long_url=LongURLValueObject(long_url)),
+    )
+
+    pair = await repository.get_pair_by_long_url(long_url)
+
+    assert pair.short_url == "abc123"
+    assert pair.long_url == long_url
+    assert await repository.get_pair_by_long_url(faker.url()) is None
+
+
+@pytest.mark.asyncio
+async def test_flushed_batch_is_acknowledged(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    session: FakeURLSession,
+    stored: dict[str, str],
+    faker: Faker,
+):
+    for short_url in ("abc", "def"):
+        await repository.add(
+            URLEntity(short_url=short_url, long_url=LongURLValueObject(faker.url())),
+        )
+    flusher = build_flusher(database, redis, outbox_enabled=True)
+
+    inserted = await flusher.flush_batch(await flusher.read_batch(NEW))
+
+    assert inserted == 2
+    assert stored == {short_url: redis.values[short_url] for short_url in stored}
+    assert len(session.outbox) == 2
+    assert redis.entries == {}
+    assert redis.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_outbox_is_written_only_for_the_relay(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    session: FakeURLSession,
+    faker: Faker,
+):
+    await repository.add(
+        URLEntity(short_url="abc", long_url=LongURLValueObject(faker.url())),
+    )
+    flusher = build_flusher(database, redis)
+
+    assert await flusher.flush_batch(await flusher.read_batch(NEW)) == 1
+    assert session.outbox == []
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stays_pending(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    session: FakeURLSession,
+    stored: dict[str, str],
+    faker: Faker,
+):
+    await repository.add(
+        URLEntity(short_url="abc", long_url=LongURLValueObject(faker.url())),
+    )
+    flusher = build_flusher(database, redis)
+    session.fail_commit = True
+
+    with pytest.raises(ConnectionError):
+        await flusher.flush_batch(await flusher.read_batch(NEW))
+    session.fail_commit = False
+
+    # Redelivered to the same consumer, not to the new entries
+    assert await flusher.read_batch(NEW) == []
+    assert await flusher.flush_batch(await flusher.read_batch(PENDING)) == 1
+    assert list(stored) == ["abc"]
+    assert redis.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_abandoned_entries_are_claimed(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    stored: dict[str, str],
+    faker: Faker,
+):
+    await repository.add(
+        URLEntity(short_url="abc", long_url=LongURLValueObject(faker.url())),
+    )
+    crashed = build_flusher(database, redis, consumer="crashed")
+    await crashed.read_batch(NEW)
+    survivor = build_flusher(database, redis, consumer="survivor", claim_idle_ms=0)
+
+    assert await survivor.read_batch(PENDING) == []
+    assert await survivor.flush_batch(await survivor.claim_abandoned()) == 1
+    assert list(stored) == ["abc"]
+    assert redis.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_retried_batch_is_not_a_conflict(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    stored: dict[str, str],
+    faker: Faker,
+    caplog,
+):
+    long_url = faker.url()
+    await repository.add(
+        URLEntity(short_url="abc", long_url=LongURLValueObject(long_url)),
+    )
+    # Committed before the worker died, the acknowledgement was lost
+    stored["abc"] = long_url
+    flusher = build_flusher(database, redis)
+
+    with caplog.at_level(logging.ERROR):
+        assert await flusher.flush_batch(await flusher.read_batch(NEW)) == 0
+
+    assert redis.values["abc"] == long_url
+    assert redis.pending == {}
+    assert not caplog.records
+
+
+@pytest.mark.asyncio
+async def test_conflicting_pair_is_dead_lettered(
+    repository: WriteBehindURLRepository,
+    database: Database,
+    redis: FakeStreamRedis,
+    stored: dict[str, str],
+    faker: Faker,
+    caplog,
+):
+    stored_long_url, queued_long_url = faker.url(), faker.url()
+    await repository.add(
+        URLEntity(short_url="abc", long_url=LongURLValueObject(queued_long_url)),
+    )
+    # Stored past Redis between the reservation and the flush
+    stored["abc"] = stored_long_url
+    flusher = build_flusher(database, redis)
+
+    with caplog.at_level(logging.ERROR):
+        assert await flusher.flush_batch(await flusher.read_batch(NEW)) == 0
+
+    assert stored == {"abc": stored_long_url}
+    # Never repointed silently
+    assert redis.values["abc"] == queued_long_url
+    assert redis.entries == {}
+    assert redis.pending == {}
+    (fields,) = redis.other_streams[flusher.conflicts_stream]
+    assert fields["short_url"] == "abc"
+    assert fields["long_url"] == queued_long_url
+    assert queued_long_url in caplog.text
@@ -0,0 +1,97 @@
+import asyncio
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from domain.services.hot_keys import HotKeys
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    generate_api_key,
+)
+from settings.config import Config
+
+
+@pytest.fixture
+def keys(container: Container) -> dict[str, str]:
+    """Tokens of an administrator and of a customer."""
+    admin_token, admin_key = generate_api_key(name="ops")
+    customer_token, customer_key = generate_api_key(name="partner")
+    container.register(
+        Config,
+        instance=Config(
+            WARMUP_ENABLED=False,
+            AUTH_ENABLED=True,
+            AUTH_ADMIN_SUBJECTS=[admin_key.subject],
+        ),
+        scope=Scope.singleton,
+    )
+    repository: BaseAPIKeyRepository = container.resolve(BaseAPIKeyRepository)
+    asyncio.run(repository.add(admin_key))
+    asyncio.run(repository.add(customer_key))
+    return {"admin": admin_token, "customer": customer_token}
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_report_resolves(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    keys: dict[str, str],
+    faker: Faker,
+):
+    headers = {"X-API-Key": keys["admin"]}
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+        headers=headers,
+    )
+    short_url = response.json()["data"]["short_url"]
+    for _ in range(12):
+        client.get(app.url_path_for("get_long_url", short_url=short_url))
+
+    hot_keys: HotKeys = container.resolve(HotKeys)
+    await hot_keys.refresh()
+
+    response = client.get(
+        app.url_path_for("get_hot_keys"),
+        params={"limit": 5},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["hot_keys"][0] == {
+        "short_url": short_url,
+        # Counted before the query cache, and halved by the refresh
+        "estimated_count": 6,
+        "pinned": True,
+    }
+
+
+def test_admin_requires_an_admin_principal(
+    app: FastAPI,
+    client: TestClient,
+    keys: dict[str, str],
+):
+    url = app.url_path_for("get_hot_keys")
+
+    anonymous = client.get(url)
+    customer = client.get(url, headers={"X-API-Key": keys["customer"]})
+
+    assert anonymous.status_code == status.HTTP_401_UNAUTHORIZED
+    assert customer.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_admin_is_hidden_without_authentication(app: FastAPI, client: TestClient):
+    response = client.get(app.url_path_for("get_hot_keys"))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,77 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+
+from presentation.api import exception_handlers
+from presentation.api.middleware.apm import SelectiveElasticAPM
+
+
+@pytest.fixture
+def captured(monkeypatch) -> list[Exception]:
+    captured = []
+    monkeypatch.setattr(
+        exception_handlers,
+        "_capture_exception_to_apm",
+        captured.append,
+    )
+    return captured
+
+
+def test_expected_domain_error_is_counted_but_not_captured(
+    app: FastAPI,
+    client: TestClient,
+    captured: list[Exception],
+):
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": "example.com"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    metrics = client.get(app.url_path_for("get_metrics")).text
+
+    assert captured == []
+    assert 'api_errors_total{exception="InvalidURLError",status="400"}' in metrics
+
+
+def test_unexpected_error_on_untraced_path_is_captured(
+    app: FastAPI,
+    captured: list[Exception],
+):
+    error = RuntimeError("boom")
+
+    # Traced requests are captured by the APM middleware itself, excluded
+    # paths have no transaction and rely on the exception handler.
+    @app.get("/healthcheck/boom")
+    async def boom():
+        raise error
+
+    client = TestClient(app=app, raise_server_exceptions=False)
+    response = client.get("/healthcheck/boom")
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert captured == [error]
+
+
+@pytest.mark.asyncio
+async def test_selective_apm_skips_excluded_paths():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+
+    middleware = SelectiveElasticAPM(app, excluded_paths=("/healthcheck", "/metrics"))
+
+    async def traced_app(scope, receive, send):
+        calls.append(("traced", scope["path"]))
+
+    middleware.traced_app = traced_app
+
+    for path in ("/healthcheck/ready", "/metrics", "/api/v1/urls"):
+        await middleware({"type": "http", "path": path}, None, None)
+
+    assert calls == ["/healthcheck/ready", "/metrics", ("traced", "/api/v1/urls")]
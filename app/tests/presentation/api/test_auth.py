@@ -0,0 +1,94 @@
+import asyncio
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from infrastructure.auth.authenticator import Authenticator
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    generate_api_key,
+)
+from settings.config import Config
+
+
+@pytest.fixture
+def api_key(container: Container) -> str:
+    container.register(
+        Config,
+        instance=Config(WARMUP_ENABLED=False, AUTH_ENABLED=True),
+        scope=Scope.singleton,
+    )
+    token, api_key = generate_api_key(name="partner", quota=2)
+    repository: BaseAPIKeyRepository = container.resolve(BaseAPIKeyRepository)
+    asyncio.run(repository.add(api_key))
+    return token
+
+
+def test_create_requires_credentials(app: FastAPI, api_key: str, faker: Faker):
+    client = TestClient(app=app)
+
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.headers["www-authenticate"] == "Bearer"
+    assert response.json()["errors"]
+
+
+def test_create_rejects_invalid_key(app: FastAPI, api_key: str, faker: Faker):
+    client = TestClient(app=app)
+
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+        headers={"X-API-Key": api_key[:-1]},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_create_with_key_until_quota(
+    app: FastAPI,
+    container: Container,
+    api_key: str,
+    faker: Faker,
+):
+    client = TestClient(app=app)
+    url = app.url_path_for("create_short_url")
+
+    statuses = [
+        client.post(
+            url,
+            json={"long_url": faker.url()},
+            headers={"Authorization": f"Bearer {api_key}"},
+        ).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [
+        status.HTTP_201_CREATED,
+        status.HTTP_201_CREATED,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    ]
+    authenticator: Authenticator = container.resolve(Authenticator)
+    assert len(authenticator._cache) == 1
+
+
+def test_resolve_stays_anonymous(app: FastAPI, api_key: str):
+    client = TestClient(app=app)
+
+    response = client.get(app.url_path_for("get_long_url", short_url="missing"))
+
+    assert response.status_code != status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,110 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from redis.asyncio import Redis
+
+from infrastructure.health.readiness import ReadinessChecker
+
+
+@pytest.fixture
+def probe_calls(monkeypatch) -> dict[str, int]:
+    calls = {"postgres": 0, "redis": 0}
+
+    async def probe_postgres(self, engine) -> None:
+        calls["postgres"] += 1
+
+    async def probe_redis(self) -> None:
+        calls["redis"] += 1
+
+    monkeypatch.setattr(ReadinessChecker, "_probe_postgres", probe_postgres)
+    monkeypatch.setattr(ReadinessChecker, "_probe_redis", probe_redis)
+
+    return calls
+
+
+def test_liveness(app: FastAPI, client: TestClient):
+    response = client.get(app.url_path_for("get_status"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"result": True}
+
+
+def test_readiness_before_startup(app: FastAPI, client: TestClient):
+    response = client.get(app.url_path_for("get_readiness"))
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["data"]["ready"] is False
+
+
+def test_readiness_reports_dependencies(app: FastAPI, probe_calls: dict[str, int]):
+    with TestClient(app=app) as client:
+        response = client.get(app.url_path_for("get_readiness"))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["ready"] is True
+    assert set(data["dependencies"]) == {"postgres", "postgres_read_only", "redis"}
+    assert all(dependency["healthy"] for dependency in data["dependencies"].values())
+    assert data["dependencies"]["postgres"]["pool"]["checked_out"] == 0
+    assert data["dependencies"]["redis"]["latency_ms"] >= 0
+
+
+def test_readiness_is_cached(app: FastAPI, probe_calls: dict[str, int]):
+    with TestClient(app=app) as client:
+        for _ in range(3):
+            client.get(app.url_path_for("get_readiness"))
+
+    assert probe_calls == {"postgres": 2, "redis": 1}
+
+
+def test_readiness_fails_when_dependency_is_down(
+    app: FastAPI,
+    probe_calls: dict[str, int],
+    monkeypatch,
+):
+    async def probe_redis(self) -> None:
+        raise ConnectionError("Connection refused")
+
+    monkeypatch.setattr(ReadinessChecker, "_probe_redis", probe_redis)
+
+    with TestClient(app=app) as client:
+        response = client.get(app.url_path_for("get_readiness"))
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    redis = response.json()["data"]["dependencies"]["redis"]
+    assert redis["healthy"] is False
+    assert redis["error"] == "Connection refused"
+
+
+@pytest.mark.asyncio
+async def test_readiness_without_external_storage():
+    checker = ReadinessChecker(database=None, cache=None, timeout=0.5, cache_ttl=0)
+
+    report = await checker.check()
+
+    assert report.ready is True
+    assert report.dependencies == {}
+
+
+@pytest.mark.asyncio
+async def test_optional_dependency_does_not_fail_readiness(monkeypatch):
+    async def probe_redis(self) -> None:
+        raise ConnectionError("Connection refused")
+
+    monkeypatch.setattr(ReadinessChecker, "_probe_redis", probe_redis)
+    checker = ReadinessChecker(
+        database=None,
+        cache=Redis(),
+        timeout=0.5,
+        cache_ttl=0,
+        optional=frozenset({"redis"}),
+    )
+
+    report = await checker.check()
+
+    assert report.ready is True
+    assert report.dependencies["redis"].healthy is False
@@ -0,0 +1,26 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from punq import Container
+
+from infrastructure.database.gateways.postgres import Database
+
+
+def test_lifespan_marks_app_ready_and_disposes_resources(
+    app: FastAPI,
+    container: Container,
+    monkeypatch,
+):
+    disposed = []
+
+    async def dispose(self: Database) -> None:
+        disposed.append(self)
+
+    monkeypatch.setattr(Database, "dispose", dispose)
+
+    with TestClient(app=app) as client:
+        assert app.state.ready is True
+        assert client.get(app.url_path_for("get_status")).status_code == 200
+
+    assert app.state.ready is False
+    assert disposed == [container.resolve(Database)]
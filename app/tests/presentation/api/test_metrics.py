@@ -0,0 +1,43 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+
+
+@pytest.mark.asyncio
+async def test_metrics_expose_route_and_handler_timings(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+):
+    client.post(app.url_path_for("create_short_url"), json={"long_url": faker.url()})
+
+    response = client.get(app.url_path_for("get_metrics"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="POST",route="/api/v1/urls",status="201"}'
+        in response.text
+    )
+    assert (
+        'mediator_handler_duration_seconds_count{handler="CreateShortURLCommandHandler",kind="command",message="CreateShortURLCommand",outcome="ok"}'
+        in response.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_use_route_template_for_path_parameters(
+    app: FastAPI,
+    client: TestClient,
+):
+    client.get(app.url_path_for("get_long_url", short_url="nonexistent123"))
+
+    response = client.get(app.url_path_for("get_metrics"))
+
+    assert 'route="/api/v1/urls/{short_url}",status="400"' in response.text
+    assert "nonexistent123" not in response.text
@@ -0,0 +1,144 @@
+import asyncio
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from application.init import init_container
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    generate_api_key,
+)
+from infrastructure.ratelimit.limiter import (
+    RateLimiter,
+    RateLimitRule,
+)
+from presentation.api.main import create_app
+from presentation.api.middleware.ratelimit import get_client_ip
+from settings import config
+from settings.config import Config
+
+
+@pytest.fixture
+def limited_app(container: Container, monkeypatch) -> FastAPI:
+    monkeypatch.setattr(config, "rate_limit_enabled", True)
+    # Redis is not available to the tests, the local buckets are the limit
+    container.register(
+        RateLimiter,
+        instance=RateLimiter(
+            rules={
+                "create": RateLimitRule(limit=2, window=60),
+                "resolve": RateLimitRule(limit=3, window=60),
+            },
+        ),
+        scope=Scope.singleton,
+    )
+
+    app = create_app()
+    app.dependency_overrides[init_container] = lambda: container
+    return app
+
+
+def test_create_is_limited_per_client(limited_app: FastAPI, faker: Faker):
+    client = TestClient(app=limited_app)
+    url = limited_app.url_path_for("create_short_url")
+
+    responses = [client.post(url, json={"long_url": faker.url()}) for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [
+        status.HTTP_201_CREATED,
+        status.HTTP_201_CREATED,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    ]
+    assert responses[0].headers["ratelimit-limit"] == "2"
+    assert responses[0].headers["ratelimit-remaining"] == "1"
+    assert responses[2].headers["retry-after"] == "60"
+    assert responses[2].json()["errors"]
+
+    # An unverified key does not open a new budget
+    response = client.post(
+        url,
+        json={"long_url": faker.url()},
+        headers={"X-API-Key": "another-client"},
+    )
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_verified_subject_has_own_budget(
+    limited_app: FastAPI,
+    container: Container,
+    faker: Faker,
+):
+    container.register(
+        Config,
+        instance=Config(WARMUP_ENABLED=False, AUTH_ENABLED=True),
+        scope=Scope.singleton,
+    )
+    token, api_key = generate_api_key(name="partner")
+    repository: BaseAPIKeyRepository = container.resolve(BaseAPIKeyRepository)
+    asyncio.run(repository.add(api_key))
+    client = TestClient(app=limited_app)
+    url = limited_app.url_path_for("create_short_url")
+
+    def create(headers: dict[str, str]) -> int:
+        response = client.post(url, json={"long_url": faker.url()}, headers=headers)
+        return response.status_code
+
+    # Rejected by authentication, but counted against the IP
+    assert [create({"X-API-Key": f"made-up-{i}"}) for i in range(3)] == [
+        status.HTTP_401_UNAUTHORIZED,
+        status.HTTP_401_UNAUTHORIZED,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    ]
+    assert create({"X-API-Key": token}) == status.HTTP_201_CREATED
+    assert create({"Authorization": f"Bearer {token}"}) == status.HTTP_201_CREATED
+    assert create({"X-API-Key": token}) == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_client_ip_is_taken_from_the_trusted_hop():
+    scope = {
+        "type": "http",
+        "headers": [
+            (b"x-forwarded-for", b"6.6.6.6, 10.0.0.1"),
+            (b"x-forwarded-for", b"10.0.0.2"),
+        ],
+        "client": ("10.0.0.3", 1234),
+    }
+
+    # Left of the trusted entries is whatever the client sent
+    assert get_client_ip(scope, forwarded_hops=0) == "10.0.0.3"
+    assert get_client_ip(scope, forwarded_hops=1) == "10.0.0.2"
+    assert get_client_ip(scope, forwarded_hops=2) == "10.0.0.1"
+    assert get_client_ip(scope, forwarded_hops=4) == "10.0.0.3"
+
+
+def test_resolve_has_separate_budget(limited_app: FastAPI, faker: Faker):
+    client = TestClient(app=limited_app)
+    response = client.post(
+        limited_app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+    )
+    short_url = response.json()["data"]["short_url"]
+    url = limited_app.url_path_for("get_long_url", short_url=short_url)
+
+    statuses = [client.get(url).status_code for _ in range(4)]
+
+    assert statuses == [200, 200, 200, status.HTTP_429_TOO_MANY_REQUESTS]
+
+
+def test_other_routes_are_not_limited(limited_app: FastAPI):
+    client = TestClient(app=limited_app)
+
+    for _ in range(5):
+        response = client.get(limited_app.url_path_for("get_status"))
+        assert response.status_code == status.HTTP_200_OK
+        assert "ratelimit-limit" not in response.headers
@@ -0,0 +1,28 @@
+import pytest
+from pydantic import ValidationError
+
+from presentation.api.server import get_workers_count
+from settings.config import Config
+
+
+def test_process_local_stores_run_a_single_worker():
+    assert get_workers_count(Config(URL_REPOSITORY_BACKEND="memory")) == 1
+    assert (
+        get_workers_count(
+            Config(URL_REPOSITORY_BACKEND="sqlite", SQLITE_PATH=":memory:"),
+        )
+        == 1
+    )
+    assert get_workers_count(Config(SERVER_WORKERS=4)) == 4
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"URL_REPOSITORY_BACKEND": "memory"},
+        {"URL_REPOSITORY_BACKEND": "sqlite", "SQLITE_PATH": ":memory:"},
+    ],
+)
+def test_process_local_stores_reject_several_workers(settings: dict):
+    with pytest.raises(ValidationError):
+        Config(SERVER_WORKERS=2, **settings)
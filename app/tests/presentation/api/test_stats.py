@@ -0,0 +1,213 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from application.interfaces.clicks import (
+    BaseClickStats,
+    ClickCount,
+    Granularity,
+)
+from infrastructure.auth.keys import (
+    BaseAPIKeyRepository,
+    generate_api_key,
+)
+from settings.config import Config
+
+
+@dataclass
+class ExactClickStats(BaseClickStats):
+    clicks: dict[str, list[datetime]] = field(default_factory=dict)
+
+    def record(self, short_url: str) -> None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.clicks.setdefault(short_url, []).append(now)
+
+    async def get_series(
+        self,
+        short_url: str,
+        granularity: Granularity,
+        start: datetime,
+        end: datetime,
+    ) -> list[ClickCount]:
+        buckets: dict[datetime, int] = {}
+        for clicked_at in self.clicks.get(short_url, ()):
+            if start <= clicked_at < end:
+                bucket = clicked_at.replace(second=0, microsecond=0)
+                if granularity != "minute":
+                    bucket = bucket.replace(minute=0)
+                if granularity == "day":
+                    bucket = bucket.replace(hour=0)
+                buckets[bucket] = buckets.get(bucket, 0) + 1
+        return [
+            ClickCount(bucket, clicks) for bucket, clicks in sorted(buckets.items())
+        ]
+
+    async def get_top(self, limit: int) -> list[tuple[str, int]]:
+        totals = {short_url: len(clicks) for short_url, clicks in self.clicks.items()}
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+@pytest.fixture
+def click_stats(container: Container) -> ExactClickStats:
+    container.register(
+        Config,
+        instance=Config(WARMUP_ENABLED=False, LINK_STATS_ENABLED=True),
+        scope=Scope.singleton,
+    )
+    click_stats = ExactClickStats()
+    container.register(BaseClickStats, instance=click_stats, scope=Scope.singleton)
+    return click_stats
+
+
+@pytest.fixture
+def admin_token(container: Container, click_stats: ExactClickStats) -> str:
+    token, api_key = generate_api_key(name="ops")
+    container.register(
+        Config,
+        instance=Config(
+            WARMUP_ENABLED=False,
+            LINK_STATS_ENABLED=True,
+            AUTH_ENABLED=True,
+            AUTH_ADMIN_SUBJECTS=[api_key.subject],
+        ),
+        scope=Scope.singleton,
+    )
+    repository: BaseAPIKeyRepository = container.resolve(BaseAPIKeyRepository)
+    asyncio.run(repository.add(api_key))
+    return token
+
+
+def create_short_url(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    headers: dict[str, str] | None = None,
+) -> str:
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+        headers=headers,
+    )
+    return response.json()["data"]["short_url"]
+
+
+def test_series_has_every_bucket(
+    app: FastAPI,
+    client: TestClient,
+    click_stats: ExactClickStats,
+    faker: Faker,
+):
+    short_url = create_short_url(app, client, faker)
+    for _ in range(3):
+        client.get(app.url_path_for("get_long_url", short_url=short_url))
+
+    response = client.get(
+        app.url_path_for("get_link_stats", short_url=short_url),
+        params={"granularity": "hour"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    today = datetime.now(timezone.utc).date()
+    assert data["date_to"] == today.isoformat()
+    assert data["total_clicks"] == 3
+    # 30 days of hours, empty ones included
+    assert len(data["series"]) == 30 * 24
+    assert data["series"][0]["bucket"] == f"{data['date_from']}T00:00:00"
+    assert sorted(point["clicks"] for point in data["series"])[-1] == 3
+
+
+def test_range_is_limited_per_granularity(
+    app: FastAPI,
+    client: TestClient,
+    click_stats: ExactClickStats,
+    faker: Faker,
+):
+    short_url = create_short_url(app, client, faker)
+    url = app.url_path_for("get_link_stats", short_url=short_url)
+
+    response = client.get(url, params={"granularity": "minute"})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["data"]["series"]) == 24 * 60
+
+    response = client.get(
+        url,
+        params={
+            "granularity": "minute",
+            "date_from": "2026-01-01",
+            "date_to": "2026-01-02",
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = client.get(url, params={"granularity": "week"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_top_links(
+    app: FastAPI,
+    client: TestClient,
+    admin_token: str,
+    faker: Faker,
+):
+    headers = {"X-API-Key": admin_token}
+    cold = create_short_url(app, client, faker, headers)
+    hot = create_short_url(app, client, faker, headers)
+    client.get(app.url_path_for("get_long_url", short_url=cold))
+    for _ in range(2):
+        client.get(app.url_path_for("get_long_url", short_url=hot))
+    url = app.url_path_for("get_top_links")
+
+    response = client.get(url, params={"limit": 5}, headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["links"] == [
+        {"short_url": hot, "clicks": 2},
+        {"short_url": cold, "clicks": 1},
+    ]
+    assert client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_top_links_require_an_administrator(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    admin_token: str,
+):
+    token, api_key = generate_api_key(name="partner")
+    repository: BaseAPIKeyRepository = container.resolve(BaseAPIKeyRepository)
+    asyncio.run(repository.add(api_key))
+
+    response = client.get(
+        app.url_path_for("get_top_links"),
+        headers={"X-API-Key": token},
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_disabled_by_default(app: FastAPI, client: TestClient):
+    response = client.get(app.url_path_for("get_link_stats", short_url="abc"))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.get(app.url_path_for("get_top_links"))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
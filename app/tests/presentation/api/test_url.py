@@ -162,3 +162,117 @@ async def test_create_short_url_invalid_url_too_long(
     assert isinstance(json_response["errors"], list)
     assert len(json_response["errors"]) > 0
     assert "too long" in json_response["errors"][0].lower()
+
+
+@pytest.mark.asyncio
+async def test_create_short_url_with_alias_conflict(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+):
+    url = app.url_path_for("create_short_url")
+
+    response1: Response = client.post(
+        url=url,
+        json={"long_url": faker.url(), "alias": "my-promo"},
+    )
+    assert response1.status_code == status.HTTP_201_CREATED
+    assert response1.json()["data"]["short_url"] == "my-promo"
+
+    response2: Response = client.post(
+        url=url,
+        json={"long_url": "https://other.example.com", "alias": "my-promo"},
+    )
+    assert response2.status_code == status.HTTP_409_CONFLICT
+    assert "taken" in response2.json()["errors"][0].lower()
+
+
+@pytest.mark.asyncio
+async def test_check_alias_availability(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+):
+    url = app.url_path_for("check_alias_availability", alias="my-promo")
+
+    response: Response = client.get(url=url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"alias": "my-promo", "available": True}
+
+    client.post(
+        url=app.url_path_for("create_short_url"),
+        json={"long_url": faker.url(), "alias": "my-promo"},
+    )
+
+    response = client.get(url=url)
+    assert response.json()["data"]["available"] is False
+
+    blocked_response: Response = client.get(
+        url=app.url_path_for("check_alias_availability", alias="api"),
+    )
+    assert blocked_response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_long_url_conditional_request(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+):
+    create_response: Response = client.post(
+        url=app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+    )
+    short_url = create_response.json()["data"]["short_url"]
+    get_url = app.url_path_for("get_long_url", short_url=short_url)
+
+    response: Response = client.get(url=get_url)
+    etag = response.headers["etag"]
+    assert etag.startswith('"json-')
+    assert "immutable" in response.headers["cache-control"]
+
+    not_modified: Response = client.get(
+        url=get_url,
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    modified: Response = client.get(url=get_url, headers={"If-None-Match": '"x"'})
+    assert modified.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_redirect_to_long_url(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+):
+    long_url = faker.url()
+    create_response: Response = client.post(
+        url=app.url_path_for("create_short_url"),
+        json={"long_url": long_url},
+    )
+    short_url = create_response.json()["data"]["short_url"]
+    redirect_url = app.url_path_for("redirect_to_long_url", short_url=short_url)
+
+    response: Response = client.get(url=redirect_url, follow_redirects=False)
+
+    assert response.status_code == status.HTTP_301_MOVED_PERMANENTLY
+    assert response.headers["location"] == long_url
+    assert response.headers["etag"].startswith('"redirect-')
+    assert "s-maxage=" in response.headers["cache-control"]
+
+    not_modified: Response = client.get(
+        url=redirect_url,
+        headers={"If-None-Match": response.headers["etag"]},
+        follow_redirects=False,
+    )
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    missing: Response = client.get(
+        url=app.url_path_for("redirect_to_long_url", short_url="nonexistent123"),
+        follow_redirects=False,
+    )
+    assert missing.status_code == status.HTTP_400_BAD_REQUEST
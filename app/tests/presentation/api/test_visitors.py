@@ -0,0 +1,107 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    date,
+    datetime,
+    timezone,
+)
+from typing import Sequence
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from application.interfaces.visitors import BaseVisitorCounter
+from settings.config import Config
+
+
+@dataclass
+class ExactVisitorCounter(BaseVisitorCounter):
+    visitors: dict[str, set[str]] = field(default_factory=dict)
+
+    def record(self, short_url: str, fingerprint: str) -> None:
+        self.visitors.setdefault(short_url, set()).add(fingerprint)
+
+    async def count(self, short_url: str, days: Sequence[date]) -> int:
+        return len(self.visitors.get(short_url, ()))
+
+
+@pytest.fixture
+def visitor_counter(container: Container) -> ExactVisitorCounter:
+    container.register(
+        Config,
+        instance=Config(WARMUP_ENABLED=False, UNIQUE_VISITORS_ENABLED=True),
+        scope=Scope.singleton,
+    )
+    visitor_counter = ExactVisitorCounter()
+    container.register(
+        BaseVisitorCounter,
+        instance=visitor_counter,
+        scope=Scope.singleton,
+    )
+    return visitor_counter
+
+
+def test_resolves_are_counted_per_visitor(
+    app: FastAPI,
+    client: TestClient,
+    visitor_counter: ExactVisitorCounter,
+    faker: Faker,
+):
+    response = client.post(
+        app.url_path_for("create_short_url"),
+        json={"long_url": faker.url()},
+    )
+    short_url = response.json()["data"]["short_url"]
+
+    for user_agent in ("firefox", "firefox", "curl"):
+        client.get(
+            app.url_path_for("get_long_url", short_url=short_url),
+            headers={"User-Agent": user_agent},
+        )
+    client.get(
+        app.url_path_for("redirect_to_long_url", short_url=short_url),
+        headers={"User-Agent": "safari"},
+        follow_redirects=False,
+    )
+
+    response = client.get(app.url_path_for("get_unique_visitors", short_url=short_url))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["unique_visitors"] == 3
+    assert data["date_to"] == datetime.now(timezone.utc).date().isoformat()
+
+
+def test_invalid_range_and_unknown_code(
+    app: FastAPI,
+    client: TestClient,
+    visitor_counter: ExactVisitorCounter,
+):
+    url = app.url_path_for("get_unique_visitors", short_url="missing")
+
+    assert client.get(url).status_code == status.HTTP_400_BAD_REQUEST
+
+    response = client.get(
+        url,
+        params={"date_from": "2026-02-01", "date_to": "2026-01-01"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Invalid date range" in response.json()["errors"][0]
+
+
+def test_disabled_by_default(app: FastAPI, client: TestClient):
+    response = client.get(app.url_path_for("get_unique_visitors", short_url="abc"))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND